@@ -0,0 +1,24 @@
+"""
+Runs Django Clarity's tests (Django TestCases) with pytest, in the test project of
+djangoclarity.tests.settings, without needing pytest-django.
+"""
+
+import os
+
+import django
+import pytest
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "djangoclarity.tests.settings")
+django.setup()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def django_test_databases():
+    from django.test.runner import DiscoverRunner
+
+    runner = DiscoverRunner(verbosity=0, interactive=False)
+    runner.setup_test_environment()
+    old_config = runner.setup_databases()
+    yield
+    runner.teardown_databases(old_config)
+    runner.teardown_test_environment()
@@ -1,4 +1,7 @@
 from django.apps import AppConfig
+from django.conf import settings
+
+from .permissions import connect_permissions_invalidation
 
 
 class DjangoclarityConfig(AppConfig):
@@ -14,3 +17,19 @@ class DjangoclarityConfig(AppConfig):
             raise ImportError(
                 "django-bootstrap5 is required. Install it with: pip install django-bootstrap5"
             )
+
+        # Invalidate the cached permissions when users, groups or permissions change
+        # (the registered models are connected by the AdminSite)
+        if (
+            getattr(settings, "DJANGOCLARITY_PERMISSIONS_CACHE_TIMEOUT", None)
+            is not None
+        ):
+            connect_permissions_invalidation()
+
+        # Warm up the caches of every registered model's pages (see the warmup
+        # module). Models have to be registered by then, ie. by apps that come
+        # before this one in INSTALLED_APPS.
+        if getattr(settings, "DJANGOCLARITY_WARMUP", False):
+            from .warmup import warmup
+
+            warmup()
@@ -0,0 +1,56 @@
+"""
+Django Clarity's static assets.
+
+Bootstrap is vendored with the package (so that pages don't depend on a CDN) and
+Django Clarity's own CSS/JS is shipped as one combined stylesheet and one script.
+All of them are referenced through `static()`, so with ManifestStaticFilesStorage
+they're served under hashed names that can be cached forever. Scripts are loaded
+with `defer`, so they never block the first paint.
+
+Set DJANGOCLARITY_BOOTSTRAP_CDN = True to load Bootstrap through
+django-bootstrap5's settings (its CDN by default) instead.
+"""
+
+from django.forms import Media
+from django.templatetags.static import static
+from django.utils.html import format_html
+
+BOOTSTRAP_CSS = "djangoclarity/vendor/bootstrap-5.3.3/css/bootstrap.min.css"
+BOOTSTRAP_JS = "djangoclarity/vendor/bootstrap-5.3.3/js/bootstrap.bundle.min.js"
+CLARITY_CSS = "djangoclarity/css/clarity.css"
+CLARITY_JS = "djangoclarity/js/clarity.js"
+
+
+class DeferredScript:
+    """
+    A Media script that's loaded with `defer`.
+    It's equal to its path, so a widget's Media that lists the same path is merged
+    with it rather than included twice.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def __eq__(self, other):
+        if isinstance(other, DeferredScript):
+            return self.path == other.path
+        return self.path == other
+
+    def __hash__(self):
+        return hash(self.path)
+
+    def __str__(self):
+        return self.path
+
+    def __html__(self):
+        return format_html('<script src="{}" defer></script>', static(self.path))
+
+
+def get_clarity_media():
+    """Return the Media of the CSS and JavaScript that every Clarity page loads."""
+    return Media(css={"all": [CLARITY_CSS]}, js=[DeferredScript(CLARITY_JS)])
+
+
+def get_bootstrap_media():
+    """Return the Media of the vendored Bootstrap CSS and JavaScript."""
+    return Media(css={"all": [BOOTSTRAP_CSS]}, js=[DeferredScript(BOOTSTRAP_JS)])
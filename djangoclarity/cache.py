@@ -0,0 +1,134 @@
+"""
+Caching for Django Clarity's index pages.
+
+Cached entries are keyed on a version counter per model, which is bumped whenever
+one of the model's instances is saved or deleted (or its many-to-many relations
+change). Bumping the version makes every cached entry for the model unreachable,
+so nothing ever has to be deleted from the cache.
+
+The signal receivers that bump the versions are only connected for the models
+that cached entries depend on (see connect_model_invalidation(), which the
+AdminSite calls for each registered model and its related models), so saving any
+other model doesn't cost a cache write.
+
+The cache alias is set with the DJANGOCLARITY_CACHE setting (default: "default").
+It needs to be shared between processes (ie. Redis or Memcached) for invalidation
+to be seen by every worker.
+"""
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+VERSION_KEY_PREFIX = "djangoclarity:version"
+
+
+def get_cache():
+    """Return the cache used by Django Clarity."""
+    return caches[getattr(settings, "DJANGOCLARITY_CACHE", "default")]
+
+
+def is_cache_shared():
+    """
+    Return whether the cache is shared between processes, so that a version bumped
+    by one process is seen by all of them (ie. not the local-memory cache).
+    """
+    return not isinstance(get_cache(), (LocMemCache, DummyCache))
+
+
+def _get_version_key(model):
+    return f"{VERSION_KEY_PREFIX}:{model._meta.label_lower}"
+
+
+def get_model_versions(*models):
+    """
+    Return a list of the current version of each model, in a single cache lookup.
+    """
+    cache = get_cache()
+    keys = [_get_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+
+    for key in keys:
+        if key not in versions:
+            # Start from the current time rather than from 1, so that a version
+            # that was evicted from the cache can never match older entries
+            cache.add(key, time.time_ns(), timeout=None)
+            versions[key] = cache.get(key, 0)
+
+    return [versions[key] for key in keys]
+
+
+def get_model_version(model):
+    """Return the current version of a model."""
+    return get_model_versions(model)[0]
+
+
+def bump_model_version(model):
+    """Bump a model's version, invalidating all of its cached entries."""
+    cache = get_cache()
+    key = _get_version_key(model)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # The version isn't in the cache, so a new one will be created on next use
+        pass
+
+
+def make_cache_key(prefix, models, *parts):
+    """
+    Return a cache key for the given models' current versions and the key parts.
+    """
+    versions = get_model_versions(*models)
+    labels = ",".join(model._meta.label_lower for model in models)
+    digest = hashlib.md5(
+        repr((versions, parts)).encode(), usedforsecurity=False
+    ).hexdigest()
+
+    return f"djangoclarity:{prefix}:{labels}:{digest}"
+
+
+def invalidate_model_cache(sender, **kwargs):
+    """Signal receiver for post_save and post_delete, to bump the model's version."""
+    bump_model_version(sender)
+
+
+def invalidate_m2m_cache(sender, instance, action, model, **kwargs):
+    """Signal receiver for m2m_changed, to bump the version of both models."""
+    if action in ("post_add", "post_remove", "post_clear"):
+        bump_model_version(type(instance))
+        bump_model_version(model)
+
+
+def connect_model_invalidation(model):
+    """
+    Connect the receivers that bump a model's version when one of its instances is
+    saved or deleted, or when one of its many-to-many relations changes. Connecting
+    a model more than once has no effect.
+    """
+    label = model._meta.label_lower
+    post_save.connect(
+        invalidate_model_cache,
+        sender=model,
+        dispatch_uid=f"djangoclarity-cache-post-save-{label}",
+    )
+    post_delete.connect(
+        invalidate_model_cache,
+        sender=model,
+        dispatch_uid=f"djangoclarity-cache-post-delete-{label}",
+    )
+
+    # m2m_changed is sent by the through model, from either side of the relation
+    for field in model._meta.get_fields():
+        if field.many_to_many:
+            through = (field.remote_field if field.concrete else field).through
+            m2m_changed.connect(
+                invalidate_m2m_cache,
+                sender=through,
+                dispatch_uid=f"djangoclarity-cache-m2m-changed-"
+                f"{through._meta.label_lower}",
+            )
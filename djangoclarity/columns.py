@@ -0,0 +1,126 @@
+"""
+Declarative extra columns for the index table.
+
+Each column is an annotation of the index queryset, so its values are fetched with
+the page's query instead of with a query per row. They're listed in
+ModelAdmin.list_extra_columns, ie.
+
+    list_extra_columns = {
+        "line_items": RelatedCount("lineitem"),
+        "quantity": RelatedSum("lineitem", "qty"),
+        "latest_label": LatestRelated("lineitem", "label", order_by="-id"),
+    }
+
+Relations are named like in queryset lookups (the reverse ForeignKey's query name).
+The values are computed with correlated subqueries rather than joins, so that they
+don't multiply the index's rows nor get in the way of its count.
+"""
+
+from django.db.models import Count, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+class ExtraColumn:
+    """Base class of the extra columns, meant to be subclassed."""
+
+    def __init__(self, relation, filter=None):
+        """
+        Args:
+            relation: Name of the reverse ForeignKey relation, ie. "lineitem"
+            filter: Optional Q object to filter the related objects by
+        """
+        self.relation = relation
+        self.filter = filter
+
+    def get_related_model(self, model):
+        """Return the model at the other end of the relation."""
+        return self._get_relation(model).related_model
+
+    def _get_relation(self, model):
+        for field in model._meta.get_fields():
+            if (
+                field.one_to_many
+                and field.auto_created
+                and field.field.related_query_name() == self.relation
+            ):
+                return field
+
+        raise ValueError(
+            "%s has no reverse ForeignKey relation named '%s'"
+            % (model.__name__, self.relation)
+        )
+
+    def get_related_queryset(self, model):
+        """Return the related objects of the outer query's row."""
+        relation = self._get_relation(model)
+        queryset = relation.related_model._default_manager.filter(
+            **{relation.field.name: OuterRef("pk")}
+        )
+        if self.filter is not None:
+            queryset = queryset.filter(self.filter)
+
+        return queryset
+
+    def _get_grouped_queryset(self, model):
+        """Return the related objects, grouped by their ForeignKey to the row."""
+        relation = self._get_relation(model)
+
+        return self.get_related_queryset(model).order_by().values(relation.field.name)
+
+    def get_expression(self, model):
+        """Return the annotation of the column's values, meant to be overridden."""
+        raise NotImplementedError
+
+
+class RelatedCount(ExtraColumn):
+    """The number of related objects."""
+
+    def get_expression(self, model):
+        counts = self._get_grouped_queryset(model).annotate(value=Count("pk"))
+
+        return Coalesce(Subquery(counts.values("value")), Value(0))
+
+
+class RelatedSum(ExtraColumn):
+    """The sum of a field of the related objects."""
+
+    def __init__(self, relation, field, filter=None):
+        """
+        Args:
+            relation: Name of the reverse ForeignKey relation, ie. "lineitem"
+            field: Name of the related objects' field to sum, ie. "qty"
+            filter: Optional Q object to filter the related objects by
+        """
+        self.field = field
+        super().__init__(relation, filter=filter)
+
+    def get_expression(self, model):
+        output_field = self.get_related_model(model)._meta.get_field(self.field)
+        sums = self._get_grouped_queryset(model).annotate(value=Sum(self.field))
+
+        return Coalesce(
+            Subquery(sums.values("value"), output_field=output_field),
+            Value(0),
+            output_field=output_field,
+        )
+
+
+class LatestRelated(ExtraColumn):
+    """A field of the latest related object, by the given ordering."""
+
+    def __init__(self, relation, field, order_by="-pk", filter=None):
+        """
+        Args:
+            relation: Name of the reverse ForeignKey relation, ie. "lineitem"
+            field: Name of the related object's field to show, ie. "label"
+            order_by: Ordering that puts the latest related object first
+            filter: Optional Q object to filter the related objects by
+        """
+        self.field = field
+        self.order_by = order_by
+        super().__init__(relation, filter=filter)
+
+    def get_expression(self, model):
+        latest = self.get_related_queryset(model).order_by(self.order_by)
+
+        return Subquery(latest.values(self.field)[:1])
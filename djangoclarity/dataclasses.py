@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -6,3 +6,18 @@ class ReadOnlyField:
     name: str
     label_tag: str
     value: str | None
+
+
+@dataclass
+class ImportResult:
+    # Number of rows read, and written (created, or updated by an upsert)
+    rows: int = 0
+    imported: int = 0
+    # Rows that matched an existing object and were left as they were (an upsert
+    # without any fields to update)
+    skipped: int = 0
+    error_count: int = 0
+    # (line number, list of error messages), up to the import's maximum
+    errors: list = field(default_factory=list)
+    # Columns of the CSV's header that aren't imported
+    ignored_columns: list = field(default_factory=list)
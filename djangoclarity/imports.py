@@ -0,0 +1,263 @@
+"""
+Bulk CSV imports for DjangoClarityModelImportView.
+
+The CSV file is read one row at a time, and each row is validated with the model's
+form (the one that the create view uses), with the CSV's header naming the form's
+fields. Valid rows are collected into batches, and each batch is written with a
+single bulk_create() in its own transaction, so an import of millions of rows runs
+in constant memory. With unique fields, rows that match an existing object update
+it instead (an upsert, with bulk_create(update_conflicts=True)).
+
+Invalid rows are skipped and reported by line number at the end, up to a maximum.
+A batch that fails to be written (ie. two of its rows share a unique value) is
+retried one row at a time, so that only its failing rows are skipped and reported.
+
+Many-to-many fields can't be written by bulk_create(), so they aren't imported:
+their columns are ignored, like any column that doesn't name one of the form's
+fields, and listed in the ImportResult's ignored_columns.
+"""
+
+import csv
+import io
+
+from django import forms
+from django.db import DatabaseError, transaction
+from django.db.models import Q
+
+from .dataclasses import ImportResult
+
+
+class ImportForm(forms.Form):
+    """The import page's upload form."""
+
+    file = forms.FileField(
+        label="CSV file", help_text="The header row names the form's fields."
+    )
+    upsert = forms.BooleanField(required=False, label="Update existing rows")
+
+    def __init__(self, *args, unique_fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Upserting is only an option with the ModelAdmin's unique fields
+        if unique_fields:
+            self.fields["upsert"].help_text = (
+                "Rows that match an existing object by %s update it."
+                % ", ".join(unique_fields)
+            )
+        else:
+            del self.fields["upsert"]
+
+
+def get_import_field_names(form_class):
+    """Return the names of the form's fields that can be imported."""
+    many_to_many_names = {
+        field.name for field in form_class._meta.model._meta.many_to_many
+    }
+
+    return [name for name in form_class.base_fields if name not in many_to_many_names]
+
+
+def get_import_form_class(form_class, unique_fields=None):
+    """
+    Return the form class that rows are validated with, without the form's
+    many-to-many fields. When upserting, rows may match existing objects, so their
+    unique fields aren't checked against the database (which would also cost a
+    query per row).
+    """
+    field_names = get_import_field_names(form_class)
+    if not unique_fields and len(field_names) == len(form_class.base_fields):
+        return form_class
+
+    attrs = {}
+    if unique_fields:
+
+        def validate_unique(self):
+            pass
+
+        attrs["validate_unique"] = validate_unique
+
+    import_form_class = type(f"Import{form_class.__name__}", (form_class,), attrs)
+    import_form_class.base_fields = {
+        name: import_form_class.base_fields[name] for name in field_names
+    }
+
+    return import_form_class
+
+
+def count_existing(model, objs, unique_fields):
+    """Return the number of the objects' unique fields' values that already exist."""
+    manager = model._default_manager
+    if len(unique_fields) == 1:
+        name = unique_fields[0]
+        return manager.filter(
+            **{f"{name}__in": {getattr(obj, name) for obj in objs} - {None}}
+        ).count()
+
+    query = Q()
+    for obj in objs:
+        values = {name: getattr(obj, name) for name in unique_fields}
+        if None not in values.values():
+            query |= Q(**values)
+
+    return manager.filter(query).count() if query else 0
+
+
+def write_batch(model, objs, unique_fields=None, update_fields=None):
+    """
+    Write a batch of new (unsaved) objects in one transaction, and return the
+    numbers of rows written and of rows skipped, which are the rows that matched
+    an existing object when upserting without any fields to update. Models that
+    can't be written in bulk (see `can_bulk_save()`) are saved one at a time, in
+    the same transaction.
+    """
+    # Imported here to avoid a circular import with the registration module
+    from .registration import can_bulk_save
+
+    manager = model._default_manager
+
+    if unique_fields:
+        # A batch can't upsert the same row twice, so keep the last of each key
+        objs = list(
+            {
+                tuple(getattr(obj, name) for name in unique_fields): obj for obj in objs
+            }.values()
+        )
+
+    skipped = 0
+    with transaction.atomic():
+        if can_bulk_save(model):
+            if unique_fields and update_fields:
+                manager.bulk_create(
+                    objs,
+                    update_conflicts=True,
+                    unique_fields=unique_fields,
+                    update_fields=update_fields,
+                )
+            elif unique_fields:
+                # There's nothing to update, so rows that match existing objects
+                # are left as they are. ignore_conflicts doesn't tell which rows
+                # were inserted, so they're counted first.
+                skipped = count_existing(model, objs, unique_fields)
+                manager.bulk_create(objs, ignore_conflicts=True)
+            else:
+                manager.bulk_create(objs)
+        else:
+            for obj in objs:
+                lookup = {name: getattr(obj, name) for name in unique_fields or ()}
+                if unique_fields and update_fields:
+                    manager.update_or_create(
+                        **lookup,
+                        defaults={name: getattr(obj, name) for name in update_fields},
+                    )
+                elif unique_fields and manager.filter(**lookup).exists():
+                    skipped += 1
+                else:
+                    obj.save()
+
+    return len(objs) - skipped, skipped
+
+
+def import_csv(
+    file,
+    form_class,
+    unique_fields=None,
+    batch_size=1000,
+    max_errors=100,
+    encoding="utf-8-sig",
+    progress=None,
+):
+    """
+    Import the rows of a CSV file (a binary file object, ie. an uploaded file) and
+    return an ImportResult.
+
+    Args:
+        file: The CSV file, with a header row of the form's field names
+        form_class: The model form class to validate each row with
+        unique_fields: Field names to upsert on, or None to only insert
+        batch_size: Number of rows per bulk_create() and transaction
+        max_errors: Maximum number of row errors to report (all are counted)
+        encoding: The file's encoding (the default skips a UTF-8 BOM)
+        progress: Optional callable, given the ImportResult after each batch
+    """
+    model = form_class._meta.model
+    import_form_class = get_import_form_class(form_class, unique_fields)
+    result = ImportResult()
+
+    # Only the form's model fields are updated by an upsert
+    update_fields = None
+    if unique_fields:
+        concrete_field_names = {field.name for field in model._meta.concrete_fields}
+        update_fields = [
+            name
+            for name in import_form_class.base_fields
+            if name in concrete_field_names and name not in unique_fields
+        ]
+
+    def add_error(line_number, messages):
+        result.error_count += 1
+        if len(result.errors) < max_errors:
+            result.errors.append((line_number, messages))
+
+    def write(objs):
+        written, skipped = write_batch(
+            model, objs, unique_fields=unique_fields, update_fields=update_fields
+        )
+        result.imported += written
+        result.skipped += skipped
+
+    def flush(batch):
+        try:
+            write([obj for _, obj in batch])
+        except DatabaseError:
+            # ie. a unique constraint that's broken by two of the batch's rows, or
+            # since the rows were validated. Retry each row in its own transaction,
+            # to only skip (and report) the rows that fail.
+            for line_number, obj in batch:
+                try:
+                    write([obj])
+                except DatabaseError as e:
+                    add_error(line_number, [str(e)])
+
+        if progress is not None:
+            progress(result)
+
+    batch = []
+    text = io.TextIOWrapper(file, encoding=encoding, newline="")
+    try:
+        reader = csv.DictReader(text)
+        result.ignored_columns = [
+            name
+            for name in reader.fieldnames or ()
+            if name not in import_form_class.base_fields
+        ]
+        for row in reader:
+            result.rows += 1
+            line_number = reader.line_num
+
+            form = import_form_class(data=row)
+            if not form.is_valid():
+                add_error(
+                    line_number,
+                    [
+                        f"{name}: {error}" if name != "__all__" else error
+                        for name, errors in form.errors.items()
+                        for error in errors
+                    ],
+                )
+                continue
+
+            batch.append((line_number, form.save(commit=False)))
+            if len(batch) >= batch_size:
+                flush(batch)
+                batch = []
+    except (csv.Error, UnicodeDecodeError) as e:
+        add_error(result.rows + 1, [f"The file couldn't be read as CSV: {e}"])
+    finally:
+        # Don't close the underlying file along with the wrapper
+        text.detach()
+
+    # Write the rest of the valid rows
+    if batch:
+        flush(batch)
+
+    return result
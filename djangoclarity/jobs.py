@@ -0,0 +1,222 @@
+"""
+Background jobs for Django Clarity's long-running operations.
+
+An operation is a function that takes the Job as its first argument, and keyword
+arguments that can be stored as JSON, ie.
+
+    def archive_products(job, pks):
+        for i, pk in enumerate(pks):
+            ...
+            job.set_progress(i + 1, total=len(pks))
+
+        return {"archived": len(pks)}
+
+It's queued with enqueue_job("myapp.jobs.archive_products", {"pks": pks}), which
+saves a Job and hands its pk to the job backend once the transaction commits. The
+job's state, progress and result are stored in the database, where the job page
+polls them from.
+
+The backend is set with the DJANGOCLARITY_JOB_BACKEND setting, the dotted path of a
+JobBackend subclass (default: ThreadPoolJobBackend, which runs jobs in a pool of
+DJANGOCLARITY_JOB_WORKERS threads in the web process). A backend for a task queue
+only needs to send the job's pk to a task that calls run_job(), ie. with Celery:
+
+    @shared_task
+    def run_clarity_job(job_id):
+        run_job(job_id)
+
+    class CeleryJobBackend(JobBackend):
+        def submit(self, job_id):
+            run_clarity_job.delay(job_id)
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+
+from django.apps import apps
+from django.conf import settings
+from django.db import close_old_connections, connections, transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .cache import bump_model_version
+from .imports import import_csv
+from .models import Job
+from .uploads import open_staged_upload, remove_staged_upload
+
+logger = logging.getLogger(__name__)
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+class JobBackend:
+    """Base class of the job backends, meant to be subclassed."""
+
+    def submit(self, job_id):
+        """Run the job with the given pk with run_job(), meant to be overridden."""
+        raise NotImplementedError
+
+
+class ImmediateJobBackend(JobBackend):
+    """Runs jobs straight away, in the request (ie. for tests and development)."""
+
+    def submit(self, job_id):
+        run_job(job_id)
+
+
+class ThreadPoolJobBackend(JobBackend):
+    """
+    Runs jobs in a pool of threads in the current process. Jobs that are still
+    running are lost if the process exits, so a task queue is better suited to
+    operations that mustn't be interrupted.
+    """
+
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(
+            max_workers=getattr(settings, "DJANGOCLARITY_JOB_WORKERS", 2),
+            thread_name_prefix="djangoclarity-job",
+        )
+
+    def submit(self, job_id):
+        self.executor.submit(self._run, job_id)
+
+    def _run(self, job_id):
+        try:
+            run_job(job_id)
+        finally:
+            # The thread's database connections aren't closed by a request
+            connections.close_all()
+
+
+def get_job_backend():
+    """Return the configured job backend, creating it on first use."""
+    global _backend
+
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                backend_class = import_string(
+                    getattr(
+                        settings,
+                        "DJANGOCLARITY_JOB_BACKEND",
+                        "djangoclarity.jobs.ThreadPoolJobBackend",
+                    )
+                )
+                _backend = backend_class()
+
+    return _backend
+
+
+def enqueue_job(operation, kwargs=None, label="", user=None, return_url=""):
+    """
+    Save a new Job for an operation (the dotted path of its function) and submit it
+    to the job backend once the current transaction commits. Returns the Job.
+    """
+    job = Job.objects.create(
+        operation=operation,
+        kwargs=kwargs or {},
+        label=label,
+        user=user if user is not None and user.is_authenticated else None,
+        return_url=return_url,
+    )
+    transaction.on_commit(lambda: get_job_backend().submit(job.pk))
+
+    return job
+
+
+def run_job(job_id):
+    """
+    Run a pending job's operation, and store its result (or its error). A job that
+    isn't pending anymore (ie. one that was submitted twice) isn't run again.
+    """
+    close_old_connections()
+
+    # Claim the job, so that only one worker runs it
+    claimed = Job.objects.filter(pk=job_id, status=Job.PENDING).update(
+        status=Job.RUNNING, started_at=timezone.now()
+    )
+    if not claimed:
+        return
+
+    job = Job.objects.get(pk=job_id)
+    try:
+        operation = import_string(job.operation)
+        result = operation(job, **job.kwargs)
+    except Exception as e:
+        logger.exception("Django Clarity job %s (%s) failed", job.pk, job.operation)
+        Job.objects.filter(pk=job.pk).update(
+            status=Job.FAILED, error=str(e) or repr(e), finished_at=timezone.now()
+        )
+    else:
+        Job.objects.filter(pk=job.pk).update(
+            status=Job.SUCCEEDED, result=result, finished_at=timezone.now()
+        )
+
+
+# Operations
+
+
+def delete_objects(job, model, pks, batch_size=100):
+    """
+    Delete the objects of a model (given by its label, ie. "shop.product"), in
+    batches that are each deleted in their own transaction.
+    """
+    model = apps.get_model(model)
+    job.set_progress(0, total=len(pks))
+
+    deleted = 0
+    for start in range(0, len(pks), batch_size):
+        batch = pks[start : start + batch_size]
+        with transaction.atomic():
+            count, _ = model._default_manager.filter(pk__in=batch).delete()
+        deleted += count
+
+        job.set_progress(start + len(batch), message=f"Deleted {deleted} objects")
+
+    # Invalidate the model's cached index pages
+    bump_model_version(model)
+
+    return {"deleted": deleted}
+
+
+def import_staged_csv(
+    job, model, token, site="djangoclarity", unique_fields=None, **kwargs
+):
+    """
+    Import a staged CSV file (see the uploads module) of the rows of a model that's
+    registered with a site (given by its URL namespace), with import_csv(). The
+    staged file is removed afterwards.
+    """
+    # Imported here to avoid a circular import with the registration module
+    from .registration import create_model_form_class, get_site
+
+    model = apps.get_model(model)
+    form_class, _ = create_model_form_class(
+        model, get_site(site).get_model_admin(model)
+    )
+
+    file = open_staged_upload(token)
+    if file is None:
+        raise ValueError("The uploaded file has expired")
+
+    def progress(result):
+        job.set_progress(
+            result.rows,
+            message=f"Read {result.rows} rows, imported {result.imported}",
+        )
+
+    try:
+        result = import_csv(
+            file, form_class, unique_fields=unique_fields, progress=progress, **kwargs
+        )
+    finally:
+        file.close()
+        remove_staged_upload(token)
+
+    if result.imported:
+        bump_model_version(model)
+
+    return asdict(result)
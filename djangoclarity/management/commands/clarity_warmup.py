@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from djangoclarity.warmup import warmup
+
+
+class Command(BaseCommand):
+    help = (
+        "Warm up Django Clarity's caches: load the URLconf, compile the templates, "
+        "build the forms and reverse the object URLs, so that the first requests "
+        "don't have to."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--counts",
+            action="store_true",
+            help="Also run (and cache) each index's first COUNT.",
+        )
+
+    def handle(self, *args, **options):
+        def log(message):
+            if options["verbosity"] >= 1:
+                self.stdout.write(message)
+
+        warmup(counts=options["counts"], log=log)
+
+        if options["verbosity"] >= 1:
+            self.stdout.write(self.style.SUCCESS("Django Clarity is warmed up."))
@@ -0,0 +1,81 @@
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+class Job(models.Model):
+    """
+    A long-running operation (ie. a bulk delete or an import) that's run in the
+    background by the job backend, with its state and progress (see the jobs module).
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (PENDING, "Pending"),
+        (RUNNING, "Running"),
+        (SUCCEEDED, "Succeeded"),
+        (FAILED, "Failed"),
+    ]
+
+    # Dotted path of the operation's function, and its keyword arguments
+    operation = models.CharField(max_length=255)
+    kwargs = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)
+    label = models.CharField(max_length=255, blank=True)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=PENDING)
+    # Units of work done, out of the total (if it's known)
+    progress = models.PositiveBigIntegerField(default=0)
+    total = models.PositiveBigIntegerField(null=True, blank=True)
+    message = models.TextField(blank=True)
+    # The operation's return value, or the error that it failed with
+    result = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    error = models.TextField(blank=True)
+    # URL to link to once the job is done, ie. the model's index page
+    return_url = models.CharField(max_length=255, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return self.label or self.operation
+
+    @property
+    def is_done(self):
+        return self.status in (self.SUCCEEDED, self.FAILED)
+
+    @property
+    def percent(self):
+        """Return the job's progress as a percentage, or None if it's unknown."""
+        if self.status == self.SUCCEEDED:
+            return 100
+        if not self.total:
+            return None
+
+        return min(100, int(self.progress * 100 / self.total))
+
+    def set_progress(self, progress, total=None, message=None):
+        """
+        Save the job's progress, without saving (and overwriting) its other fields.
+        Called by the job's operation as it goes.
+        """
+        fields = {"progress": progress}
+        if total is not None:
+            fields["total"] = total
+        if message is not None:
+            fields["message"] = message
+
+        for name, value in fields.items():
+            setattr(self, name, value)
+        type(self)._default_manager.filter(pk=self.pk).update(**fields)
@@ -0,0 +1,74 @@
+"""
+Permission checks for Django Clarity's pages.
+
+The user's permissions are loaded once per request and memoized on it, so checking
+every registered model (ie. on the index page) or every row of an index table
+doesn't cost a query each.
+
+With the DJANGOCLARITY_PERMISSIONS_CACHE_TIMEOUT setting (in seconds, default: None
+for no caching), they're also cached between requests. The cache key includes the
+versions of the user, group and permission models (see the cache module), so
+granting or revoking a permission (or a group) invalidates it.
+connect_permissions_invalidation() connects their receivers, when the app is ready.
+"""
+
+from django.conf import settings
+from django.contrib.auth import get_permission_codename, get_user_model
+
+from .cache import connect_model_invalidation, get_cache, make_cache_key
+
+REQUEST_ATTRIBUTE = "_djangoclarity_permissions"
+
+
+def get_user_permissions(request):
+    """
+    Return the set of the request's user's permissions, ie. {"shop.view_product"},
+    loading them at most once per request.
+    """
+    permissions = getattr(request, REQUEST_ATTRIBUTE, None)
+    if permissions is not None:
+        return permissions
+
+    user = request.user
+    timeout = getattr(settings, "DJANGOCLARITY_PERMISSIONS_CACHE_TIMEOUT", None)
+    if not user.is_active:
+        permissions = frozenset()
+    elif timeout is None:
+        permissions = frozenset(user.get_all_permissions())
+    else:
+        # Imported here since models can't be imported before the apps are ready
+        from django.contrib.auth.models import Group, Permission
+
+        cache_key = make_cache_key(
+            "permissions", [get_user_model(), Group, Permission], user.pk
+        )
+        permissions = get_cache().get(cache_key)
+        if permissions is None:
+            permissions = frozenset(user.get_all_permissions())
+            get_cache().set(cache_key, permissions, timeout)
+
+    setattr(request, REQUEST_ATTRIBUTE, permissions)
+
+    return permissions
+
+
+def has_model_permission(request, model, action):
+    """
+    Return whether the request's user has a model's permission for an action (one
+    of "view", "add", "change" or "delete"). Active superusers have them all.
+    """
+    user = request.user
+    if user.is_active and user.is_superuser:
+        return True
+
+    codename = get_permission_codename(action, model._meta)
+    return f"{model._meta.app_label}.{codename}" in get_user_permissions(request)
+
+
+def connect_permissions_invalidation():
+    """Connect the receivers that invalidate the cached permissions."""
+    # Imported here since models can't be imported before the apps are ready
+    from django.contrib.auth.models import Group, Permission
+
+    for model in (get_user_model(), Group, Permission):
+        connect_model_invalidation(model)
@@ -1,14 +1,29 @@
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db.models import ImageField, Model, UniqueConstraint
+from django.db.models.signals import post_save, pre_save
 from django.forms import ModelForm
-from django.forms.models import inlineformset_factory, modelform_factory
+from django.forms.models import (
+    inlineformset_factory,
+    modelform_factory,
+    modelformset_factory,
+)
 from django.urls import path
 from django.views.generic import RedirectView
 
+from .cache import connect_model_invalidation
 from .dataclasses import ReadOnlyField
+from .permissions import has_model_permission
 from .views import (
+    AGGREGATE_FUNCTIONS,
     DjangoClarityAppIndexView,
+    DjangoClarityChunkedUploadView,
     DjangoClarityIndexView,
+    DjangoClarityJobStatusView,
+    DjangoClarityJobView,
     DjangoClarityModelCreateView,
+    DjangoClarityModelDataView,
     DjangoClarityModelDeleteView,
+    DjangoClarityModelImportView,
     DjangoClarityModelListView,
     DjangoClarityModelUpdateView,
 )
@@ -65,19 +80,202 @@ def create_inline_formsets(model, inlines):
                 widgets=inline.widgets,
             )
 
-        formsets.append(
-            inlineformset_factory(
-                model,
-                inline.model,
-                form=formset_form_class,
-                extra=inline.extra,
-            )
+        formset_class = inlineformset_factory(
+            model,
+            inline.model,
+            form=formset_form_class,
+            extra=inline.extra,
         )
+        # Whether the children can be saved in bulk, see the views' save_formset()
+        formset_class.bulk_save = (
+            can_bulk_save(inline.model)
+            if inline.bulk_save is None
+            else inline.bulk_save
+        )
+
+        formsets.append(formset_class)
         formset_layouts.append(formset_layout)
 
     return formsets, formset_layouts
 
 
+def can_bulk_save(model):
+    """
+    Return whether the model's instances can be written with bulk_update() (and
+    bulk_create()), which skip Model.save() and the pre_save/post_save signals.
+    That's only the case if the model doesn't override save(), isn't a multi-table
+    child, and has no receivers for those signals (other than Django Clarity's own
+    cache invalidation, whose work the views do themselves after saving).
+    """
+    if model.save is not Model.save or model._meta.parents:
+        return False
+
+    for signal in (pre_save, post_save):
+        for lookup_key, *_ in signal.receivers:
+            receiver_key, sender_key = lookup_key
+            if isinstance(receiver_key, str) and receiver_key.startswith(
+                "djangoclarity-"
+            ):
+                continue
+
+            # Receivers for this model, or for every model
+            if sender_key in (id(model), id(None)):
+                return False
+
+    return True
+
+
+def has_image_fields(model, model_admin):
+    """Return whether a registered model, or one of its inlines, has image fields."""
+    models = [model] + [inline.model for inline in model_admin.inlines]
+
+    return any(
+        isinstance(field, ImageField) for m in models for field in m._meta.fields
+    )
+
+
+def get_cache_models(model, model_admin):
+    """
+    Return the models that the cached data and ETags of a registered model's pages
+    depend on: the model, the models it relates to (whose objects are shown in the
+    table, its filters and its form's choices), its inlines' models and the models
+    of its extra columns.
+    """
+    models = [model]
+    related_models = [
+        field.related_model
+        for field in model._meta.get_fields()
+        if field.is_relation and field.concrete
+    ]
+    related_models += [inline.model for inline in model_admin.inlines]
+    related_models += [
+        column.get_related_model(model)
+        for column in model_admin.list_extra_columns.values()
+    ]
+
+    for related_model in related_models:
+        if related_model is not None and related_model not in models:
+            models.append(related_model)
+
+    return models
+
+
+def create_list_editable_formset_class(model, model_admin):
+    """
+    Return the model formset class of the index's editable grid (for the fields in
+    ModelAdmin.list_editable), or None if there isn't one.
+    """
+    if not model_admin.list_editable:
+        return None
+
+    formset_class = modelformset_factory(
+        model,
+        ModelForm,
+        fields=tuple(model_admin.list_editable),
+        widgets=model_admin.widgets,
+        extra=0,
+    )
+    # Whether the rows can be saved in bulk, see the views' save_formset()
+    formset_class.bulk_save = can_bulk_save(model)
+
+    return formset_class
+
+
+def get_index_backed_fields(model):
+    """
+    Return the names of the model's fields that lead a database index.
+    Ordering by one of these (plus the pk) can be served by the index rather than
+    by sorting the whole table.
+    """
+    opts = model._meta
+    field_names = set()
+
+    # Primary keys, unique fields, db_index=True (and ForeignKeys, by default)
+    for field in opts.concrete_fields:
+        if field.primary_key or field.unique or field.db_index:
+            field_names.add(field.name)
+
+    # Only the leading column of a multi-column index can be used for sorting
+    for index in opts.indexes:
+        if index.fields and index.condition is None:
+            field_names.add(index.fields[0].removeprefix("-"))
+
+    for constraint in opts.constraints:
+        if (
+            isinstance(constraint, UniqueConstraint)
+            and constraint.fields
+            and constraint.condition is None
+        ):
+            field_names.add(constraint.fields[0])
+
+    for fields in opts.unique_together:
+        field_names.add(fields[0])
+
+    return field_names
+
+
+def get_sortable_fields(model, model_admin, form_layout):
+    """
+    Return the layout fields that the index page may be sorted by.
+
+    By default these are the index-backed layout fields, but ModelAdmin.sortable_fields
+    can list them explicitly instead. Either way, only concrete, non-null,
+    non-relation fields are kept, so the sort values can be used as a cursor.
+    """
+    layout_field_names = [
+        field.name if type(field) is ReadOnlyField else field for field in form_layout
+    ]
+
+    if model_admin.sortable_fields is None:
+        index_backed_fields = get_index_backed_fields(model)
+        candidates = [
+            field_name
+            for field_name in layout_field_names
+            if field_name in index_backed_fields
+        ]
+    else:
+        candidates = model_admin.sortable_fields
+
+    sortable_fields = []
+    for field_name in candidates:
+        try:
+            field = model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            continue
+
+        if field.concrete and not field.is_relation and not field.null:
+            sortable_fields.append(field_name)
+
+    return tuple(sortable_fields)
+
+
+def check_list_aggregates(model, model_admin):
+    """
+    Raise ImproperlyConfigured if ModelAdmin.list_aggregates has an unknown
+    function, or a column that isn't one of the model's fields or of
+    ModelAdmin.list_extra_columns.
+    """
+    for name, function in model_admin.list_aggregates.items():
+        if function not in AGGREGATE_FUNCTIONS:
+            raise ImproperlyConfigured(
+                "%s.list_aggregates['%s'] is '%s', which isn't one of: %s"
+                % (model_admin.__name__, name, function, ", ".join(AGGREGATE_FUNCTIONS))
+            )
+
+        if name in model_admin.list_extra_columns:
+            continue
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            field = None
+        if field is None or not field.concrete or field.many_to_many:
+            raise ImproperlyConfigured(
+                "%s.list_aggregates refers to '%s', which isn't a field of %s nor "
+                "one of list_extra_columns"
+                % (model_admin.__name__, name, model.__name__)
+            )
+
+
 def create_model_form_class(model, model_admin):
     # url_name_prefix = f"djangoclarity-{model._meta.app_label}-{model._meta.model_name}"
 
@@ -85,10 +283,13 @@ def create_model_form_class(model, model_admin):
     if model_admin.fields == "__all__":
         # Show only the editable fields
         # TODO: currently this shows the ID field, which we should maybe not show?
+        # (except for the version field, which the update view sets itself)
         form_layout = tuple(
             field.name
             for field in model._meta.fields
-            if field.editable and field.name != "id"
+            if field.editable
+            and field.name != "id"
+            and field.name != model_admin.version_field
         )
 
         # Send the string "__all__" to the model form factory
@@ -96,6 +297,7 @@ def create_model_form_class(model, model_admin):
             model,
             ModelForm,
             fields=model_admin.fields,
+            exclude=(model_admin.version_field,) if model_admin.version_field else None,
             widgets=model_admin.widgets,
         )
 
@@ -133,11 +335,100 @@ class ModelAdmin:
     readonly_fields = ()
     widgets = {}
     inlines = []
+    list_virtual_scroll = False
+    # None: sort by any index-backed layout field. Otherwise, a tuple of field names.
+    sortable_fields = None
+    # Fields to load for the related objects in the index table (the ones their
+    # __str__ uses), ie. {"category": ("name",)}. Unlisted relations load every field.
+    list_select_related_fields = {}
+    # "instances" builds model instances for the index rows. "values" fetches tuples
+    # of the table's columns instead, which is much cheaper for plain tables.
+    list_fetch = "instances"
+    # Extra index columns that are computed in the index query, ie.
+    # {"line_items": RelatedCount("lineitem")} (see the columns module)
+    list_extra_columns = {}
+    # Footer row of the index table, with an aggregate of each listed column over
+    # the search results, ie. {"price": "sum"}. One of "sum", "avg", "min", "max"
+    # or "count".
+    list_aggregates = {}
+    # Fields that are edited directly in the index table, ie. ("status", "price").
+    # The grid's changed rows are saved together with bulk_update().
+    list_editable = ()
+    # Fields to filter the index by in a sidebar, with counts for each value.
+    # Choice, boolean, ForeignKey and date fields are supported.
+    list_filter = ()
+    # DateField or DateTimeField to drill down the index by, with links to its
+    # years, then the months of the selected year, then the days of the month
+    date_hierarchy = None
+    # Number of seconds to cache the filters' counts (and the date hierarchy's
+    # dates) for (None: no caching)
+    list_filter_cache_timeout = 60
+    # Number of seconds to cache the index pages' data for (None: no caching)
+    list_cache_timeout = None
+    # Answer unchanged GETs of the update and index pages with 304 Not Modified.
+    # The index pages' ETags only change with the versions of the models in
+    # get_cache_models(), so this needs a cache that's shared between processes
+    # (see the cache module), and is ignored with the local-memory cache.
+    conditional_get = False
+    # DateTimeField (ie. with auto_now=True) that the update page's ETag and
+    # Last-Modified are computed from. Without it, the model's version is used.
+    updated_at_field = "updated_at"
+    # Field that the update view checks for concurrent edits, ie. an IntegerField
+    # that's incremented on each save, or a DateTimeField that's set to the time of
+    # each save. None: no check, the last save wins.
+    version_field = None
+    # Unique fields that the import page can upsert on, ie. ("sku",). They need a
+    # unique constraint in the database. Empty: the import only inserts rows.
+    import_unique_fields = ()
+    # Number of imported rows per bulk_create() and transaction
+    import_batch_size = 1000
+    # Maximum number of invalid rows that the import page reports
+    import_max_errors = 100
+    # Run imports and deletes as background jobs (see the jobs module), with a
+    # progress page, instead of in the request
+    import_in_background = False
+    delete_in_background = False
+    # Database alias (ie. a read replica) that the GETs of the index, data, update
+    # and delete pages read from. None: AdminSite.read_db_alias. Saves always use
+    # the default database.
+    read_db_alias = None
+    # Number of seconds after a user's save that their reads stay on the default
+    # database, so that they see their own changes despite the replica's lag
+    read_your_writes_window = 5
     create_view_class = DjangoClarityModelCreateView
+    data_view_class = DjangoClarityModelDataView
     delete_view_class = DjangoClarityModelDeleteView
+    import_view_class = DjangoClarityModelImportView
     index_view_class = DjangoClarityModelListView
     update_view_class = DjangoClarityModelUpdateView
 
+    def __init__(self, model=None):
+        self.model = model
+
+    # Permissions, from the user's model permissions by default. The user's
+    # permissions are loaded once per request (see the permissions module), so
+    # these can be called for every model or row without any more queries.
+
+    def has_view_permission(self, request):
+        """Whether the user can see the model's index and objects."""
+        if has_model_permission(request, self.model, "view"):
+            return True
+
+        # Like in Django's admin, the change permission implies the view permission
+        return self.has_change_permission(request)
+
+    def has_add_permission(self, request):
+        """Whether the user can create (and import) objects."""
+        return has_model_permission(request, self.model, "add")
+
+    def has_change_permission(self, request):
+        """Whether the user can update objects."""
+        return has_model_permission(request, self.model, "change")
+
+    def has_delete_permission(self, request):
+        """Whether the user can delete objects."""
+        return has_model_permission(request, self.model, "delete")
+
 
 class InlineModelAdmin:
     model = None
@@ -145,11 +436,53 @@ class InlineModelAdmin:
     readonly_fields = ()
     widgets = {}
     extra = 3
+    updated_at_field = "updated_at"
+    # Whether new and changed children are written with bulk_create()/bulk_update().
+    # None: only if the model allows it (see can_bulk_save())
+    bulk_save = None
+
+
+# The AdminSites by their URL namespace, see get_site()
+_sites = {}
+
+
+def get_site(namespace):
+    """
+    Return the AdminSite with the given URL namespace, ie. for a background job
+    that was queued by one of its pages.
+    """
+    try:
+        return _sites[namespace]
+    except KeyError:
+        raise LookupError(f"There's no Django Clarity site named '{namespace}'")
 
 
 class AdminSite:
-    _registry = {}
     _namespace = "djangoclarity"
+    # Database alias that the registered models read from, unless their ModelAdmin
+    # sets its own read_db_alias. None: the default database.
+    read_db_alias = None
+
+    def __init__(self, name=None):
+        # Each site has its own models
+        self._registry = {}
+        if name is not None:
+            self._namespace = name
+        _sites[self._namespace] = self
+
+    @property
+    def name(self):
+        """The site's URL namespace."""
+        return self._namespace
+
+    def get_model_admin(self, model):
+        """Return the ModelAdmin class that a model is registered with."""
+        try:
+            return self._registry[model]
+        except KeyError:
+            raise LookupError(
+                f"{model.__name__} isn't registered with the '{self._namespace}' site"
+            )
 
     def register(self, model, model_admin=None):
         # Set up the default Model Admin class, if necessary
@@ -158,9 +491,14 @@ class AdminSite:
         # Add these to the registry
         self._registry[model] = model_admin
 
+        # Invalidate the model's cached pages when it (or a model they show) changes
+        for cache_model in get_cache_models(model, model_admin):
+            connect_model_invalidation(cache_model)
+
     def get_urls(self):
         urlpatterns = []
         app_label_models_dict = {}
+        model_admins = {}
 
         # Go through each registered model
         for model, model_admin in self._registry.items():
@@ -173,8 +511,19 @@ class AdminSite:
             formsets, formset_layouts = create_inline_formsets(
                 model, model_admin.inlines
             )
+            model_admin_instance = model_admin(model)
+            model_admins[model] = model_admin_instance
+            if model_admin_instance.read_db_alias is None:
+                model_admin_instance.read_db_alias = self.read_db_alias
+            sortable_fields = get_sortable_fields(model, model_admin, form_layout)
+            check_list_aggregates(model, model_admin)
+            list_editable_formset = create_list_editable_formset_class(
+                model, model_admin
+            )
             create_view_class = model_admin.create_view_class
+            data_view_class = model_admin.data_view_class
             delete_view_class = model_admin.delete_view_class
+            import_view_class = model_admin.import_view_class
             index_view_class = model_admin.index_view_class
             update_view_class = model_admin.update_view_class
             url_prefix = f"{model._meta.app_label}/{model._meta.model_name}"
@@ -193,6 +542,7 @@ class AdminSite:
                         formsets=formsets,
                         formset_layouts=formset_layouts,
                         namespace=self._namespace,
+                        model_admin=model_admin_instance,
                     ),
                     # name=form_class.Meta.url_names["create_url_name"],
                     name=f"{url_name_prefix}-create",
@@ -205,6 +555,7 @@ class AdminSite:
                         formsets=formsets,
                         formset_layouts=formset_layouts,
                         namespace=self._namespace,
+                        model_admin=model_admin_instance,
                     ),
                     # name=form_class.Meta.url_names["delete_url_name"],
                     name=f"{url_name_prefix}-delete",
@@ -217,10 +568,34 @@ class AdminSite:
                         formsets=formsets,
                         formset_layouts=formset_layouts,
                         namespace=self._namespace,
+                        model_admin=model_admin_instance,
+                        sortable_fields=sortable_fields,
+                        list_editable_formset=list_editable_formset,
                     ),
                     # name=form_class.Meta.url_names["index_url_name"],
                     name=f"{url_name_prefix}-index",
                 ),
+                path(
+                    f"{url_prefix}/data/",
+                    data_view_class.as_view(
+                        form_class=form_class,
+                        form_layout=form_layout,
+                        namespace=self._namespace,
+                        model_admin=model_admin_instance,
+                        sortable_fields=sortable_fields,
+                    ),
+                    name=f"{url_name_prefix}-data",
+                ),
+                path(
+                    f"{url_prefix}/import/",
+                    import_view_class.as_view(
+                        form_class=form_class,
+                        form_layout=form_layout,
+                        namespace=self._namespace,
+                        model_admin=model_admin_instance,
+                    ),
+                    name=f"{url_name_prefix}-import",
+                ),
                 path(
                     f"{url_prefix}/<int:pk>/change/",
                     update_view_class.as_view(
@@ -229,6 +604,7 @@ class AdminSite:
                         formsets=formsets,
                         formset_layouts=formset_layouts,
                         namespace=self._namespace,
+                        model_admin=model_admin_instance,
                     ),
                     # name=form_class.Meta.url_names["update_url_name"],
                     name=f"{url_name_prefix}-update",
@@ -266,12 +642,45 @@ class AdminSite:
                 path(
                     f"{app_label}/",
                     DjangoClarityAppIndexView.as_view(
-                        namespace=self._namespace, app_label=app_label, models=models
+                        namespace=self._namespace,
+                        app_label=app_label,
+                        models=models,
+                        model_admins=model_admins,
                     ),
                     name=f"djangoclarity-{app_label}-index",
                 )
             )
 
+        # Endpoint for the chunked uploads of ThumbnailImageWidget, for the users
+        # that can add or change a model with images
+        urlpatterns.append(
+            path(
+                "upload/",
+                DjangoClarityChunkedUploadView.as_view(
+                    model_admins=[
+                        model_admin
+                        for model, model_admin in model_admins.items()
+                        if has_image_fields(model, self._registry[model])
+                    ]
+                ),
+                name="djangoclarity-upload",
+            )
+        )
+
+        # Progress pages of the background jobs
+        urlpatterns += [
+            path(
+                "jobs/<int:pk>/",
+                DjangoClarityJobView.as_view(namespace=self._namespace),
+                name="djangoclarity-job",
+            ),
+            path(
+                "jobs/<int:pk>/status/",
+                DjangoClarityJobStatusView.as_view(namespace=self._namespace),
+                name="djangoclarity-job-status",
+            ),
+        ]
+
         # Create a final URL pattern for the overview index
         urlpatterns.append(
             path(
@@ -279,6 +688,7 @@ class AdminSite:
                 DjangoClarityIndexView.as_view(
                     namespace=self._namespace,
                     app_label_models_dict=app_label_models_dict,
+                    model_admins=model_admins,
                 ),
                 name="djangoclarity-index",
             )
@@ -0,0 +1,549 @@
+/*
+ * Django Clarity's combined script: the behaviour of its widgets and index table.
+ * Loaded once per page with `defer`.
+ */
+
+/*
+ * Button group behaviour for RadioButtonsWidget.
+ *
+ * A single delegated listener handles every radio button group on the page, so
+ * the cost doesn't grow with the number of widgets (ie. in inline formsets).
+ */
+(function () {
+  "use strict";
+
+  document.addEventListener("click", function (event) {
+    var button = event.target.closest(".djangoclarity-radio-buttons .btn-group label");
+    if (!button) {
+      return;
+    }
+
+    // Make the clicked button the only active one in its group
+    button.parentNode.querySelectorAll("label").forEach(function (btn) {
+      btn.classList.toggle("active", btn === button);
+    });
+  });
+})();
+
+/*
+ * Chunked uploads for ThumbnailImageWidget's "chunked" upload mode.
+ *
+ * When an image is picked, it's downscaled in the browser to the widget's maximum
+ * dimension, then uploaded in chunks to the chunked upload view. The file input
+ * is then cleared and the upload's token is put in the widget's hidden input, so
+ * the form is submitted without the image itself.
+ */
+(function () {
+  "use strict";
+
+  function getCsrfToken(form) {
+    var input = form && form.querySelector("[name=csrfmiddlewaretoken]");
+    if (input) {
+      return input.value;
+    }
+    var match = document.cookie.match(/(?:^|;\s*)csrftoken=([^;]+)/);
+    return match ? decodeURIComponent(match[1]) : "";
+  }
+
+  function downscale(file, maxDimension) {
+    if (!window.createImageBitmap) {
+      return Promise.resolve(file);
+    }
+
+    return createImageBitmap(file, { imageOrientation: "from-image" }).then(
+      function (bitmap) {
+        var scale = Math.min(
+          1,
+          maxDimension / Math.max(bitmap.width, bitmap.height)
+        );
+        if (scale === 1) {
+          bitmap.close();
+          return file;
+        }
+
+        var canvas = document.createElement("canvas");
+        canvas.width = Math.round(bitmap.width * scale);
+        canvas.height = Math.round(bitmap.height * scale);
+        canvas.getContext("2d").drawImage(bitmap, 0, 0, canvas.width, canvas.height);
+        bitmap.close();
+
+        var type = file.type === "image/png" ? "image/png" : "image/jpeg";
+        return new Promise(function (resolve) {
+          canvas.toBlob(
+            function (blob) {
+              resolve(blob || file);
+            },
+            type,
+            0.9
+          );
+        });
+      }
+    );
+  }
+
+  function uploadChunks(url, blob, name, chunkSize, csrfToken, onProgress) {
+    var token = null;
+
+    function sendChunk(offset) {
+      if (offset >= blob.size && token) {
+        return Promise.resolve(token);
+      }
+
+      var headers = {
+        "Content-Type": "application/octet-stream",
+        "X-CSRFToken": csrfToken,
+        "X-Upload-Offset": String(offset),
+      };
+      if (token) {
+        headers["X-Upload-Token"] = token;
+      } else {
+        headers["X-Upload-Filename"] = encodeURIComponent(name);
+        headers["X-Upload-Content-Type"] = blob.type;
+      }
+
+      return fetch(url, {
+        method: "POST",
+        headers: headers,
+        body: blob.slice(offset, offset + chunkSize),
+        credentials: "same-origin",
+      })
+        .then(function (response) {
+          return response.json().then(function (data) {
+            if (!response.ok) {
+              throw new Error(data.error || "HTTP " + response.status);
+            }
+            return data;
+          });
+        })
+        .then(function (data) {
+          token = data.token;
+          onProgress(data.size, blob.size);
+          return sendChunk(data.size);
+        });
+    }
+
+    return sendChunk(0);
+  }
+
+  function handleChange(event) {
+    var input = event.target;
+    if (!input.matches("[data-djangoclarity-chunked-upload]") || !input.files.length) {
+      return;
+    }
+
+    var file = input.files[0];
+    var form = input.form;
+    var container = input.closest(".thumbnail-image-widget-container");
+    var tokenInput = container.querySelector(
+      'input[type=hidden][name="' + input.dataset.tokenInput + '"]'
+    );
+    var status = container.querySelector(".djangoclarity-upload-status");
+
+    // Block submitting the form until the upload has finished
+    form.dataset.djangoclarityUploads = (Number(form.dataset.djangoclarityUploads) || 0) + 1;
+    tokenInput.value = "";
+    status.textContent = "Preparing image...";
+
+    downscale(file, Number(input.dataset.maxDimension))
+      .then(function (blob) {
+        return uploadChunks(
+          input.dataset.djangoclarityChunkedUpload,
+          blob,
+          file.name,
+          Number(input.dataset.chunkSize),
+          getCsrfToken(form),
+          function (sent, total) {
+            status.textContent = "Uploading... " + Math.round((sent / total) * 100) + "%";
+          }
+        );
+      })
+      .then(function (token) {
+        tokenInput.value = token;
+        input.value = "";
+        input.required = false;
+        status.textContent = "Uploaded " + file.name;
+      })
+      .catch(function (error) {
+        status.textContent = "Upload failed: " + error.message;
+      })
+      .finally(function () {
+        form.dataset.djangoclarityUploads = Number(form.dataset.djangoclarityUploads) - 1;
+      });
+  }
+
+  function handleSubmit(event) {
+    if (Number(event.target.dataset.djangoclarityUploads) > 0) {
+      event.preventDefault();
+      window.alert("Please wait for the image uploads to finish.");
+    }
+  }
+
+  document.addEventListener("change", handleChange);
+  document.addEventListener("submit", handleSubmit);
+})();
+
+/*
+ * Virtual scrolling for the Django Clarity index table.
+ *
+ * Rows are fetched in windows from the model's JSON data endpoint as the user
+ * scrolls, and only the rows that are visible (plus a small overscan) are ever
+ * rendered into the DOM. Spacer rows above and below the rendered rows keep the
+ * scrollbar sized for the full result set.
+ *
+ * Scrolling on from a loaded window continues with its cursor (keyset
+ * pagination), while jumping ahead (ie. dragging the scrollbar) seeks straight to
+ * the visible rows with an offset. Rows far away from the visible ones are
+ * dropped, so memory stays bounded however far the user scrolls.
+ */
+(function () {
+  "use strict";
+
+  var OVERSCAN = 10;
+  var DEFAULT_ROW_HEIGHT = 41;
+  // Number of rows to keep loaded on each side of the visible ones
+  var KEEP_ROWS = 2000;
+  // Longest wait (in milliseconds) before retrying a failed fetch
+  var MAX_RETRY_DELAY = 30000;
+
+  function VirtualTable(container, config) {
+    this.container = container;
+    this.config = config;
+    this.tbody = container.querySelector("tbody");
+    // Loaded rows by their index, and the cursors that continue after a window
+    // by the index of the window's next row
+    this.rows = new Map();
+    this.cursors = new Map();
+    this.count = null;
+    this.loading = false;
+    this.failures = 0;
+    this.retryTimer = null;
+    // Message of a client error (ie. an expired cursor), which isn't retried
+    this.error = null;
+    this.rowHeight = DEFAULT_ROW_HEIGHT;
+    this.renderedRange = null;
+
+    container.addEventListener("scroll", this.onScroll.bind(this), {
+      passive: true,
+    });
+    window.addEventListener("resize", this.onScroll.bind(this));
+
+    this.fetchWindow();
+  }
+
+  VirtualTable.prototype.visibleRange = function () {
+    var first = Math.floor(this.container.scrollTop / this.rowHeight);
+    var visible = Math.ceil(this.container.clientHeight / this.rowHeight);
+    return {
+      start: Math.max(0, first - OVERSCAN),
+      end: first + visible + OVERSCAN,
+    };
+  };
+
+  VirtualTable.prototype.onScroll = function () {
+    if (this.scheduled) {
+      return;
+    }
+    this.scheduled = true;
+    window.requestAnimationFrame(
+      function () {
+        this.scheduled = false;
+        this.render();
+
+        // Keep fetching windows until the visible rows have been loaded
+        this.fetchWindow();
+      }.bind(this)
+    );
+  };
+
+  VirtualTable.prototype.firstMissingRow = function () {
+    // The first window also sizes the table
+    if (this.count === null) {
+      return 0;
+    }
+
+    var range = this.visibleRange();
+    var end = Math.min(range.end, this.count);
+    for (var i = range.start; i < end; i++) {
+      if (!this.rows.has(i)) {
+        return i;
+      }
+    }
+    return null;
+  };
+
+  VirtualTable.prototype.fetchWindow = function () {
+    // Don't fetch while another fetch (or the retry of a failed one) is pending,
+    // nor after a client error
+    if (this.loading || this.retryTimer !== null || this.error !== null) {
+      return;
+    }
+    var index = this.firstMissingRow();
+    if (index === null) {
+      return;
+    }
+    this.loading = true;
+
+    var params = new URLSearchParams();
+    if (this.config.search) {
+      params.set("q", this.config.search);
+    }
+    if (this.config.sort) {
+      params.set("o", this.config.sort);
+    }
+    Object.keys(this.config.filters || {}).forEach(
+      function (name) {
+        params.set(name, this.config.filters[name]);
+      }.bind(this)
+    );
+    if (this.cursors.has(index)) {
+      params.set("cursor", this.cursors.get(index));
+    } else if (index > 0) {
+      params.set("offset", index);
+    }
+
+    fetch(this.config.url + "?" + params.toString(), {
+      headers: { Accept: "application/json" },
+      credentials: "same-origin",
+    })
+      .then(function (response) {
+        if (response.status >= 400 && response.status < 500) {
+          // A client error won't go away by retrying, so show the endpoint's
+          // message instead
+          return response
+            .json()
+            .catch(function () {
+              return {};
+            })
+            .then(function (data) {
+              var error = new Error(data.error || "HTTP " + response.status);
+              error.isClientError = true;
+              throw error;
+            });
+        }
+        if (!response.ok) {
+          throw new Error("HTTP " + response.status);
+        }
+        return response.json();
+      })
+      .then(
+        function (data) {
+          if (data.count !== undefined) {
+            this.count = data.count;
+          }
+          data.results.forEach(function (row, i) {
+            this.rows.set(index + i, row);
+          }, this);
+
+          var end = index + data.results.length;
+          if (data.next_cursor) {
+            this.cursors.set(end, data.next_cursor);
+          } else {
+            // The results ended here, whatever the count was
+            this.count = end;
+          }
+
+          this.loading = false;
+          this.failures = 0;
+          this.dropDistantRows();
+          this.renderedRange = null;
+          this.onScroll();
+        }.bind(this)
+      )
+      .catch(
+        function (error) {
+          this.loading = false;
+          if (error.isClientError) {
+            this.error = error.message;
+            this.renderedRange = null;
+            this.render();
+            return;
+          }
+
+          // Try again after an exponential backoff, rather than giving up
+          this.failures += 1;
+          var delay = Math.min(
+            MAX_RETRY_DELAY,
+            1000 * Math.pow(2, this.failures - 1)
+          );
+          this.retryTimer = window.setTimeout(
+            function () {
+              this.retryTimer = null;
+              this.onScroll();
+            }.bind(this),
+            delay
+          );
+        }.bind(this)
+      );
+  };
+
+  VirtualTable.prototype.dropDistantRows = function () {
+    var range = this.visibleRange();
+    var low = range.start - KEEP_ROWS;
+    var high = range.end + KEEP_ROWS;
+
+    [this.rows, this.cursors].forEach(function (map) {
+      map.forEach(function (value, index) {
+        if (index < low || index > high) {
+          map.delete(index);
+        }
+      });
+    });
+  };
+
+  VirtualTable.prototype.spacerRow = function (height) {
+    var tr = document.createElement("tr");
+    var td = document.createElement("td");
+    td.colSpan = this.config.columns.length;
+    td.style.height = height + "px";
+    td.style.padding = "0";
+    td.style.border = "0";
+    tr.appendChild(td);
+    return tr;
+  };
+
+  VirtualTable.prototype.errorRow = function (message) {
+    var tr = document.createElement("tr");
+    var td = document.createElement("td");
+    td.colSpan = this.config.columns.length;
+    td.className = "text-danger";
+    td.textContent = "The rows couldn't be loaded: " + message;
+    tr.appendChild(td);
+    return tr;
+  };
+
+  VirtualTable.prototype.dataRow = function (item) {
+    var tr = document.createElement("tr");
+    this.config.columns.forEach(
+      function (column) {
+        var td = document.createElement("td");
+        var value = item[column];
+        var linkLabel = this.config.link_columns[column];
+        if (linkLabel) {
+          var a = document.createElement("a");
+          a.href = value;
+          a.textContent = linkLabel;
+          td.appendChild(a);
+        } else if (value !== null && value !== undefined) {
+          td.textContent = value;
+        }
+        tr.appendChild(td);
+      }.bind(this)
+    );
+    return tr;
+  };
+
+  VirtualTable.prototype.render = function () {
+    var total = this.count || 0;
+    var range = this.visibleRange();
+    var start = Math.min(range.start, total);
+    var end = Math.min(range.end, total);
+
+    if (
+      this.renderedRange &&
+      this.renderedRange.start === start &&
+      this.renderedRange.end === end
+    ) {
+      return;
+    }
+    this.renderedRange = { start: start, end: end };
+
+    // Rows that are still being fetched are rendered as blank placeholders
+    var measurable = null;
+    var fragment = document.createDocumentFragment();
+    if (this.error !== null) {
+      fragment.appendChild(this.errorRow(this.error));
+    }
+    fragment.appendChild(this.spacerRow(start * this.rowHeight));
+    var firstChild = fragment.childNodes.length;
+    for (var i = start; i < end; i++) {
+      if (this.rows.has(i)) {
+        fragment.appendChild(this.dataRow(this.rows.get(i)));
+        if (measurable === null) {
+          measurable = firstChild + i - start;
+        }
+      } else {
+        fragment.appendChild(this.spacerRow(this.rowHeight));
+      }
+    }
+    fragment.appendChild(this.spacerRow(Math.max(0, total - end) * this.rowHeight));
+
+    this.tbody.replaceChildren(fragment);
+
+    // Measure the real row height once there's a row to measure
+    if (measurable !== null && this.rowHeight === DEFAULT_ROW_HEIGHT) {
+      var measured =
+        this.tbody.children[measurable].getBoundingClientRect().height;
+      if (measured > 0 && measured !== this.rowHeight) {
+        this.rowHeight = measured;
+        this.renderedRange = null;
+        this.render();
+      }
+    }
+  };
+
+  document.addEventListener("DOMContentLoaded", function () {
+    document
+      .querySelectorAll("[data-djangoclarity-virtual-table]")
+      .forEach(function (container) {
+        var config = JSON.parse(
+          document.getElementById(container.dataset.djangoclarityVirtualTable)
+            .textContent
+        );
+        new VirtualTable(container, config);
+      });
+  });
+})();
+
+/*
+ * Progress of a background job.
+ *
+ * The job page polls the job's status URL, and updates its progress bar until the
+ * job is done, then reloads to show the job's result.
+ */
+(function () {
+  "use strict";
+
+  var POLL_INTERVAL = 1000;
+
+  function poll(container) {
+    fetch(container.dataset.djangoclarityJob, {
+      headers: { Accept: "application/json" },
+      credentials: "same-origin",
+    })
+      .then(function (response) {
+        if (!response.ok) {
+          throw new Error("HTTP " + response.status);
+        }
+        return response.json();
+      })
+      .then(function (job) {
+        if (job.done) {
+          window.location.reload();
+          return;
+        }
+
+        container.querySelector("[data-job-status]").textContent =
+          job.status_display;
+        container.querySelector("[data-job-message]").textContent = job.message;
+        var bar = container.querySelector("[data-job-progress]");
+        if (job.percent !== null) {
+          bar.style.width = job.percent + "%";
+          bar.textContent = job.percent + "%";
+        }
+
+        setTimeout(poll, POLL_INTERVAL, container);
+      })
+      .catch(function () {
+        // Keep polling through transient errors, but more slowly
+        setTimeout(poll, POLL_INTERVAL * 5, container);
+      });
+  }
+
+  document.addEventListener("DOMContentLoaded", function () {
+    document
+      .querySelectorAll("[data-djangoclarity-job]")
+      .forEach(function (container) {
+        setTimeout(poll, POLL_INTERVAL, container);
+      });
+  });
+})();
@@ -1,5 +1,9 @@
 from django import template
+from django.conf import settings
+from django.forms import CheckboxInput, Select
+from django.utils.html import format_html, format_html_join
 
+from ..assets import get_bootstrap_media, get_clarity_media
 from ..dataclasses import ReadOnlyField
 
 register = template.Library()
@@ -11,6 +15,24 @@ def get_item(d, key):
     return d.get(key)
 
 
+# Inclusion tag for rendering the page's CSS and JavaScript: Bootstrap, Clarity's
+# combined stylesheet and script, and any media of the page's widgets
+@register.inclusion_tag("djangoclarity/includes/assets.html")
+def djangoclarity_assets(media=None):
+    # Merging the media means that each file is only included once
+    page_media = get_clarity_media()
+    if media:
+        page_media += media
+
+    bootstrap_cdn = getattr(settings, "DJANGOCLARITY_BOOTSTRAP_CDN", False)
+
+    return {
+        "bootstrap_cdn": bootstrap_cdn,
+        "bootstrap_media": None if bootstrap_cdn else get_bootstrap_media(),
+        "media": page_media,
+    }
+
+
 # Inclusion tag for rendering a single form field
 @register.inclusion_tag("djangoclarity/includes/render_field.html")
 def djangoclarity_render_field(field):
@@ -22,6 +44,35 @@ def djangoclarity_render_field(field):
     return {"field": field, "widget_attrs": widget_attrs}
 
 
+# Tag for rendering a field of the index's editable grid, as a bare input
+@register.simple_tag
+def djangoclarity_render_grid_field(form, field_name):
+    bound_field = form[field_name]
+    widget = bound_field.field.widget
+
+    attrs = {}
+    if "class" not in widget.attrs:
+        if isinstance(widget, CheckboxInput):
+            attrs["class"] = "form-check-input"
+        elif isinstance(widget, Select):
+            attrs["class"] = "form-select form-select-sm"
+        else:
+            attrs["class"] = "form-control form-control-sm"
+
+        if bound_field.errors:
+            attrs["class"] += " is-invalid"
+
+    return format_html(
+        "{}{}",
+        bound_field.as_widget(attrs=attrs),
+        format_html_join(
+            "",
+            '<div class="invalid-feedback d-block">{}</div>',
+            ((error,) for error in bound_field.errors),
+        ),
+    )
+
+
 # Inclusion tag for rendering a single readonly form field
 @register.inclusion_tag("djangoclarity/includes/render_readonly_field.html")
 def djangoclarity_render_readonly_field(field):
@@ -0,0 +1,81 @@
+"""
+Settings of Django Clarity's test project, ie.
+
+    python -m pytest
+    python -m django test --settings=djangoclarity.tests.settings
+"""
+
+import tempfile
+
+SECRET_KEY = "djangoclarity-tests"
+DEBUG = False
+ALLOWED_HOSTS = ["testserver"]
+
+INSTALLED_APPS = [
+    "django.contrib.admin",
+    "django.contrib.auth",
+    "django.contrib.contenttypes",
+    "django.contrib.sessions",
+    "django.contrib.messages",
+    "django.contrib.staticfiles",
+    "django_bootstrap5",
+    "djangoclarity",
+    "djangoclarity.tests.testapp",
+]
+
+MIDDLEWARE = [
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+]
+
+ROOT_URLCONF = "djangoclarity.tests.urls"
+
+# The replica mirrors the default database, so the tests can check which alias
+# each query goes to
+DATABASES = {
+    "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"},
+    "replica": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+        "TEST": {"MIRROR": "default"},
+    },
+}
+
+TEMPLATES = [
+    {
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "APP_DIRS": True,
+        "OPTIONS": {
+            # Without the request context processor, which Clarity's templates
+            # mustn't depend on
+            "context_processors": [
+                "django.contrib.auth.context_processors.auth",
+                "django.contrib.messages.context_processors.messages",
+            ],
+        },
+    },
+]
+
+STATIC_URL = "/static/"
+MEDIA_URL = "/media/"
+MEDIA_ROOT = tempfile.mkdtemp(prefix="djangoclarity-tests-")
+
+# A cache that's shared between processes, like the ones Clarity's version counters
+# are meant for
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": tempfile.mkdtemp(prefix="djangoclarity-tests-cache-"),
+    },
+}
+
+USE_TZ = True
+TIME_ZONE = "UTC"
+DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+DJANGOCLARITY_JOB_BACKEND = "djangoclarity.jobs.ImmediateJobBackend"
+DJANGOCLARITY_UPLOAD_DIR = tempfile.mkdtemp(prefix="djangoclarity-tests-uploads-")
@@ -0,0 +1,48 @@
+from django.contrib.staticfiles import finders
+from django.test import TestCase, override_settings
+
+from djangoclarity.assets import (
+    BOOTSTRAP_CSS,
+    BOOTSTRAP_JS,
+    CLARITY_CSS,
+    CLARITY_JS,
+    get_clarity_media,
+)
+from djangoclarity.tests.utils import clarity_url, create_user
+from djangoclarity.widgets import RadioButtonsWidget
+
+
+class AssetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_assets_are_shipped(self):
+        for path in (BOOTSTRAP_CSS, BOOTSTRAP_JS, CLARITY_CSS, CLARITY_JS):
+            with self.subTest(path=path):
+                self.assertIsNotNone(finders.find(path))
+
+    def test_pages_load_deferred_static_assets(self):
+        response = self.client.get(clarity_url("product", "create"))
+
+        self.assertContains(
+            response, f'<script src="/static/{CLARITY_JS}" defer></script>', count=1
+        )
+        self.assertContains(response, f'<script src="/static/{BOOTSTRAP_JS}" defer>')
+        self.assertContains(response, f'href="/static/{BOOTSTRAP_CSS}"')
+        self.assertNotContains(response, "cdn.jsdelivr.net")
+
+    @override_settings(DJANGOCLARITY_BOOTSTRAP_CDN=True)
+    def test_bootstrap_from_cdn(self):
+        response = self.client.get(clarity_url("product", "create"))
+
+        self.assertNotContains(response, BOOTSTRAP_CSS)
+        self.assertContains(response, "cdn.jsdelivr.net")
+
+    def test_widget_scripts_are_merged(self):
+        media = get_clarity_media() + RadioButtonsWidget().media
+
+        self.assertEqual([str(js) for js in media._js], [CLARITY_JS])
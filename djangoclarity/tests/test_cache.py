@@ -0,0 +1,84 @@
+from unittest import mock
+
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.test import TestCase
+
+from djangoclarity.cache import get_model_version
+from djangoclarity.models import Job
+from djangoclarity.tests.testapp.clarity import ProductAdmin
+from djangoclarity.tests.testapp.models import Category, Product, Tag
+from djangoclarity.tests.utils import clarity_url, create_user
+
+
+class InvalidationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_saving_and_deleting_bump_the_version(self):
+        version = get_model_version(Product)
+        product = Product.objects.create(name="Apple")
+        self.assertNotEqual(get_model_version(Product), version)
+
+        version = get_model_version(Product)
+        product.delete()
+        self.assertNotEqual(get_model_version(Product), version)
+
+    def test_related_models_bump_their_version(self):
+        version = get_model_version(Category)
+        Category.objects.create(name="Fruit")
+
+        self.assertNotEqual(get_model_version(Category), version)
+
+    def test_m2m_changes_bump_both_models(self):
+        product = Product.objects.create(name="Apple")
+        tag = Tag.objects.create(name="Red")
+        versions = get_model_version(Product), get_model_version(Tag)
+
+        product.tags.add(tag)
+
+        self.assertNotEqual(get_model_version(Product), versions[0])
+        self.assertNotEqual(get_model_version(Tag), versions[1])
+
+    def test_unrelated_models_dont_touch_the_cache(self):
+        with mock.patch("djangoclarity.cache.bump_model_version") as bump:
+            Group.objects.create(name="Editors")
+            Job.objects.create(operation="myapp.jobs.noop")
+
+        bump.assert_not_called()
+
+
+class CachedIndexTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+        patcher = mock.patch.object(ProductAdmin, "list_cache_timeout", 60)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cached_data_is_invalidated_by_saves(self):
+        product = Product.objects.create(name="Apple")
+        url = clarity_url("product", "data")
+        self.assertEqual(self.client.get(url).json()["results"][0]["name"], "Apple")
+
+        product.name = "Banana"
+        product.save()
+
+        self.assertEqual(self.client.get(url).json()["results"][0]["name"], "Banana")
+
+    def test_cached_data_is_invalidated_by_related_saves(self):
+        category = Category.objects.create(name="Fruit")
+        Product.objects.create(name="Apple", category=category)
+        url = clarity_url("product", "data")
+        self.assertEqual(self.client.get(url).json()["results"][0]["category"], "Fruit")
+
+        category.name = "Fruits"
+        category.save()
+
+        self.assertEqual(
+            self.client.get(url).json()["results"][0]["category"], "Fruits"
+        )
@@ -0,0 +1,124 @@
+import datetime
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from djangoclarity.tests.testapp.clarity import ProductAdmin
+from djangoclarity.tests.testapp.models import Category, LineItem, Product
+from djangoclarity.tests.utils import clarity_url, create_user
+
+
+class ConditionalGetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.product = Product.objects.create(name="Apple")
+        cls.item = LineItem.objects.create(product=cls.product, label="Box")
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+        patcher = mock.patch.object(ProductAdmin, "conditional_get", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def assertNotModified(self, url):
+        """Assert that the page is answered with a 304 once it has been fetched."""
+        # The first GET of a form page sets the CSRF cookie, which is in its ETag
+        self.client.get(url)
+        etag = self.client.get(url).headers["ETag"]
+        response = self.client.get(url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        return etag
+
+    def assertModified(self, url, etag):
+        response = self.client.get(url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+    def test_disabled_by_default(self):
+        with mock.patch.object(ProductAdmin, "conditional_get", False):
+            response = self.client.get(clarity_url("product", "index"))
+
+        self.assertNotIn("ETag", response.headers)
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_disabled_with_a_per_process_cache(self):
+        response = self.client.get(clarity_url("product", "index"))
+
+        self.assertNotIn("ETag", response.headers)
+
+    def test_index_changes_with_saves(self):
+        url = clarity_url("product", "index")
+        etag = self.assertNotModified(url)
+
+        Product.objects.create(name="Banana")
+
+        self.assertModified(url, etag)
+
+    def test_index_changes_with_related_saves(self):
+        url = clarity_url("product", "index")
+        etag = self.assertNotModified(url)
+
+        Category.objects.create(name="Fruit")
+
+        self.assertModified(url, etag)
+
+    def test_index_etag_depends_on_the_query(self):
+        url = clarity_url("product", "index")
+        etag = self.client.get(url).headers["ETag"]
+
+        response = self.client.get(url, {"q": "Apple"}, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_update_page_changes_with_the_object(self):
+        url = clarity_url("product", "update", self.product.pk)
+        etag = self.assertNotModified(url)
+
+        Product.objects.filter(pk=self.product.pk).update(name="Green apple")
+        self.product.refresh_from_db()
+        self.product.save()
+
+        self.assertModified(url, etag)
+
+    def test_update_page_changes_with_deleted_children(self):
+        url = clarity_url("product", "update", self.product.pk)
+        etag = self.assertNotModified(url)
+
+        self.item.delete()
+
+        self.assertModified(url, etag)
+
+    def test_index_changes_with_the_date(self):
+        # The date filters and the date hierarchy are relative to the current date
+        url = clarity_url("product", "index")
+        with mock.patch(
+            "django.utils.timezone.localdate", return_value=datetime.date(2024, 5, 1)
+        ):
+            etag = self.assertNotModified(url)
+
+        with mock.patch(
+            "django.utils.timezone.localdate", return_value=datetime.date(2024, 5, 2)
+        ):
+            self.assertModified(url, etag)
+
+    def test_index_without_dates_doesnt_depend_on_the_date(self):
+        url = clarity_url("product", "index")
+        with mock.patch.object(ProductAdmin, "date_hierarchy", None):
+            with mock.patch(
+                "django.utils.timezone.localdate",
+                return_value=datetime.date(2024, 5, 1),
+            ):
+                etag = self.assertNotModified(url)
+
+            with mock.patch(
+                "django.utils.timezone.localdate",
+                return_value=datetime.date(2024, 5, 2),
+            ):
+                response = self.client.get(url, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
@@ -0,0 +1,48 @@
+from django.test import TestCase
+
+from djangoclarity.tests.testapp.models import Product
+from djangoclarity.tests.utils import clarity_url, create_user, get_form_data
+
+
+class CreateViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        self.url = clarity_url("product", "create")
+
+    def test_page_has_the_inline_formsets(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(len(response.context["formsets"]), 1)
+        self.assertNotIn("formset_model_names", response.context)
+
+    def test_children_are_saved_with_the_parent(self):
+        data = get_form_data(
+            self.client.get(self.url),
+            name="Apple",
+            **{"lineitem_set-0-label": "Box", "lineitem_set-0-qty": "2"},
+        )
+
+        response = self.client.post(self.url, data)
+
+        product = Product.objects.get()
+        self.assertRedirects(response, clarity_url("product", "update", product.pk))
+        self.assertEqual(
+            list(product.lineitem_set.values_list("label", "qty")), [("Box", 2)]
+        )
+
+    def test_invalid_child_saves_nothing(self):
+        data = get_form_data(
+            self.client.get(self.url),
+            name="Apple",
+            **{"lineitem_set-0-label": "Box", "lineitem_set-0-qty": "many"},
+        )
+
+        response = self.client.post(self.url, data)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["all_errors"])
+        self.assertFalse(Product.objects.exists())
@@ -0,0 +1,73 @@
+from django.test import TestCase
+
+from djangoclarity.tests.testapp.models import Product
+from djangoclarity.tests.utils import clarity_url, create_user
+
+
+class DataViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        # Duplicated names, so that cursors have to use the pk tiebreaker
+        Product.objects.bulk_create(
+            Product(name=f"Product {i // 2:02d}") for i in range(25)
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        self.url = clarity_url("product", "data")
+
+    def fetch(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_first_window_has_count_and_cursor(self):
+        data = self.fetch(limit=10)
+
+        self.assertEqual(data["count"], 25)
+        self.assertEqual(len(data["results"]), 10)
+        self.assertIsNotNone(data["next_cursor"])
+
+    def test_cursors_walk_every_row_once(self):
+        for sort in ("", "name", "-name"):
+            with self.subTest(sort=sort):
+                names = []
+                data = self.fetch(limit=7, o=sort)
+                while True:
+                    names += [row["name"] for row in data["results"]]
+                    if not data["next_cursor"]:
+                        break
+                    data = self.fetch(limit=7, o=sort, cursor=data["next_cursor"])
+                    self.assertNotIn("count", data)
+
+                self.assertEqual(len(names), 25)
+                ordering = ("-name", "-pk") if sort == "-name" else (sort or "pk", "pk")
+                expected = list(
+                    Product.objects.order_by(*ordering).values_list("name", flat=True)
+                )
+                self.assertEqual(names, expected)
+
+    def test_offset_seeks_and_continues_with_a_cursor(self):
+        pks = list(Product.objects.order_by("pk").values_list("pk", flat=True))
+
+        data = self.fetch(limit=5, offset=20)
+        self.assertNotIn("count", data)
+        self.assertEqual(
+            [row["djangoclarity-testapp-product-update"] for row in data["results"]],
+            [clarity_url("product", "update", pk) for pk in pks[20:25]],
+        )
+        self.assertIsNone(data["next_cursor"])
+
+        data = self.fetch(limit=3, offset=10)
+        data = self.fetch(limit=3, cursor=data["next_cursor"])
+        self.assertEqual(
+            [row["djangoclarity-testapp-product-update"] for row in data["results"]],
+            [clarity_url("product", "update", pk) for pk in pks[13:16]],
+        )
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {"cursor": "not a cursor"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("error", response.json())
@@ -0,0 +1,156 @@
+from datetime import date, datetime, timezone
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from djangoclarity.tests.testapp.clarity import ProductAdmin
+from djangoclarity.tests.testapp.models import Category, Product
+from djangoclarity.tests.utils import clarity_url, create_user
+
+
+class ListFilterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.fruit = Category.objects.create(name="Fruit")
+        cls.vegetables = Category.objects.create(name="Vegetables")
+        Product.objects.create(name="Apple", status="a", category=cls.fruit)
+        Product.objects.create(name="Banana", status="d", category=cls.fruit)
+        Product.objects.create(name="Carrot", status="a", category=cls.vegetables)
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+        self.url = clarity_url("product", "index")
+
+    def get_counts(self, response, name):
+        facet = next(f for f in response.context["facets"] if f["name"] == name)
+        return {option["label"]: option["count"] for option in facet["options"]}
+
+    def test_facet_counts(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(self.get_counts(response, "status"), {"Active": 2, "Draft": 1})
+        self.assertEqual(
+            self.get_counts(response, "category"), {"Fruit": 2, "Vegetables": 1}
+        )
+
+    def test_filtering(self):
+        response = self.client.get(self.url, {"status": "a"})
+
+        names = [item["name"] for item in response.context["items"]]
+        self.assertEqual(names, ["Apple", "Carrot"])
+
+    def test_counts_apply_the_other_filters(self):
+        response = self.client.get(self.url, {"category": self.fruit.pk})
+
+        # The status counts are within the fruit, but the category counts aren't
+        # narrowed down by the category filter itself
+        self.assertEqual(self.get_counts(response, "status"), {"Active": 1, "Draft": 1})
+        self.assertEqual(
+            self.get_counts(response, "category"), {"Fruit": 2, "Vegetables": 1}
+        )
+
+    def test_invalid_value_is_ignored(self):
+        response = self.client.get(self.url, {"category": "fruit"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["items"]), 3)
+
+
+class DateHierarchyTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        for name, created in [
+            ("Apple", datetime(2023, 12, 31, 23, 30)),
+            ("Banana", datetime(2024, 1, 1)),
+            ("Cherry", datetime(2024, 2, 29, 12)),
+        ]:
+            Product.objects.create(
+                name=name, created=created.replace(tzinfo=timezone.utc)
+            )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+        self.url = clarity_url("product", "index")
+
+    def get_names(self, **params):
+        response = self.client.get(self.url, params)
+
+        self.assertEqual(response.status_code, 200)
+        return [item["name"] for item in response.context["items"]]
+
+    def test_drill_down(self):
+        self.assertEqual(self.get_names(created__year=2024), ["Banana", "Cherry"])
+        self.assertEqual(
+            self.get_names(created__year=2023, created__month=12), ["Apple"]
+        )
+        self.assertEqual(
+            self.get_names(created__year=2024, created__month=2, created__day=29),
+            ["Cherry"],
+        )
+
+    def test_next_level_dates(self):
+        response = self.client.get(self.url, {"created__year": 2024})
+
+        links = response.context["date_hierarchy"]["links"]
+        self.assertEqual([link["label"] for link in links], ["January", "February"])
+
+    def test_invalid_selection_is_ignored(self):
+        all_names = ["Apple", "Banana", "Cherry"]
+        for params in [
+            {"created__year": "last"},
+            {"created__year": 9999},
+            {"created__year": 0},
+            {"created__year": 10**20},
+        ]:
+            with self.subTest(params=params):
+                self.assertEqual(self.get_names(**params), all_names)
+
+        # Only the invalid levels are dropped
+        self.assertEqual(
+            self.get_names(created__year=2024, created__month=2, created__day=30),
+            ["Cherry"],
+        )
+
+    def test_last_month_and_day_before_date_max(self):
+        Product.objects.create(
+            name="Durian", created=datetime(9998, 12, 31, tzinfo=timezone.utc)
+        )
+
+        self.assertEqual(
+            self.get_names(created__year=9998, created__month=12), ["Durian"]
+        )
+        self.assertEqual(
+            self.get_names(created__year=9998, created__month=12, created__day=31),
+            ["Durian"],
+        )
+
+
+class DateFilterCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        Product.objects.create(
+            name="Apple", created=datetime(2024, 5, 1, 12, tzinfo=timezone.utc)
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+        self.url = clarity_url("product", "index")
+
+    def get_today_count(self, today):
+        with mock.patch("django.utils.timezone.localdate", return_value=today):
+            response = self.client.get(self.url)
+
+        facet = next(f for f in response.context["facets"] if f["name"] == "created")
+        return next(o["count"] for o in facet["options"] if o["label"] == "Today")
+
+    @mock.patch.object(ProductAdmin, "list_filter", ("created",))
+    def test_cached_counts_dont_outlive_the_day(self):
+        self.assertEqual(self.get_today_count(date(2024, 5, 1)), 1)
+        self.assertEqual(self.get_today_count(date(2024, 5, 2)), 0)
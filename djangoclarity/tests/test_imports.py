@@ -0,0 +1,139 @@
+import io
+from decimal import Decimal
+
+from django.contrib.auth.models import Permission
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.forms import modelform_factory
+from django.test import TestCase
+
+from djangoclarity.imports import import_csv
+from djangoclarity.tests.testapp.models import Product, Tag
+from djangoclarity.tests.utils import clarity_url, create_user
+
+ProductForm = modelform_factory(Product, fields=["name", "sku", "price"])
+
+
+def csv_file(*lines):
+    return io.BytesIO("\n".join(lines).encode())
+
+
+class ImportCsvTests(TestCase):
+    def test_rows_are_created(self):
+        result = import_csv(
+            csv_file("name,sku,price", "Apple,A1,1.50", "Banana,,2", "Cherry,C1,free"),
+            ProductForm,
+        )
+
+        self.assertEqual((result.rows, result.imported, result.error_count), (3, 2, 1))
+        self.assertEqual(result.errors, [(4, ["price: Enter a number."])])
+        self.assertEqual(
+            list(Product.objects.values_list("name", "sku", "price")),
+            [("Apple", "A1", Decimal("1.50")), ("Banana", None, Decimal("2"))],
+        )
+
+    def test_failing_rows_of_a_batch_are_reported(self):
+        # Both rows pass validate_unique(), but they can't both be written
+        result = import_csv(
+            csv_file("name,sku,price", "Apple,A1,1", "Banana,B1,2", "Cherry,A1,3"),
+            ProductForm,
+        )
+
+        self.assertEqual((result.imported, result.error_count), (2, 1))
+        self.assertEqual([line for line, _ in result.errors], [4])
+        self.assertEqual(
+            list(Product.objects.values_list("name", flat=True)), ["Apple", "Banana"]
+        )
+
+    def test_upsert(self):
+        Product.objects.create(name="Apple", sku="A1", price=1)
+
+        result = import_csv(
+            csv_file("name,sku,price", "Green apple,A1,1.25", "Banana,B1,2"),
+            ProductForm,
+            unique_fields=["sku"],
+        )
+
+        self.assertEqual((result.imported, result.error_count), (2, 0))
+        self.assertEqual(
+            list(Product.objects.values_list("name", "sku", "price")),
+            [("Green apple", "A1", Decimal("1.25")), ("Banana", "B1", Decimal("2"))],
+        )
+
+    def test_upsert_without_fields_to_update(self):
+        Product.objects.create(name="Apple", sku="A1")
+
+        result = import_csv(
+            csv_file("sku", "A1", "B1"),
+            modelform_factory(Product, fields=["sku"]),
+            unique_fields=["sku"],
+        )
+
+        self.assertEqual(
+            (result.imported, result.skipped, result.error_count), (1, 1, 0)
+        )
+        self.assertEqual(
+            list(Product.objects.values_list("name", "sku")),
+            [("Apple", "A1"), ("", "B1")],
+        )
+
+    def test_many_to_many_columns_are_ignored(self):
+        Tag.objects.create(name="Fruit")
+
+        result = import_csv(
+            csv_file("name,tags,colour", "Apple,1,red"),
+            modelform_factory(Product, fields=["name", "tags"]),
+        )
+
+        self.assertEqual((result.imported, result.error_count), (1, 0))
+        self.assertEqual(result.ignored_columns, ["tags", "colour"])
+        self.assertFalse(Product.objects.get().tags.exists())
+
+
+class ImportViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        self.url = clarity_url("product", "import")
+
+    def post_csv(self, *lines, **data):
+        file = SimpleUploadedFile("products.csv", "\n".join(lines).encode())
+        return self.client.post(self.url, {"file": file, **data})
+
+    def test_import(self):
+        response = self.post_csv(
+            "name,sku,status,price", "Apple,A1,a,1", "Banana,B1,d,2"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["import_result"].imported, 2)
+        self.assertEqual(Product.objects.count(), 2)
+
+    def test_upsert(self):
+        Product.objects.create(name="Apple", sku="A1", price=1)
+
+        response = self.post_csv(
+            "name,sku,status,price", "Green apple,A1,a,3", upsert="on"
+        )
+
+        self.assertEqual(response.context["import_result"].imported, 1)
+        product = Product.objects.get()
+        self.assertEqual((product.name, product.price), ("Green apple", Decimal("3")))
+
+    def test_upsert_needs_the_change_permission(self):
+        user = create_user("clerk", superuser=False)
+        user.user_permissions.add(
+            *Permission.objects.filter(codename__in=["add_product", "view_product"])
+        )
+        self.client.force_login(user)
+        Product.objects.create(name="Apple", sku="A1")
+
+        response = self.post_csv(
+            "name,sku,status,price", "Green apple,A1,a,3", upsert="on"
+        )
+
+        self.assertNotIn("upsert", response.context["import_form"].fields)
+        self.assertEqual(response.context["import_result"].error_count, 1)
+        self.assertEqual(Product.objects.get().name, "Apple")
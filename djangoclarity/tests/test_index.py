@@ -0,0 +1,310 @@
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth.models import Permission
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from djangoclarity.columns import LatestRelated, RelatedCount, RelatedSum
+from djangoclarity.registration import AdminSite, ModelAdmin, _sites
+from djangoclarity.tests.testapp.clarity import ProductAdmin
+from djangoclarity.tests.testapp.models import Category, LineItem, Product
+from djangoclarity.tests.utils import clarity_url, create_user, get_formset_data
+from djangoclarity.views import DjangoClarityModelListView
+
+
+class SortableColumnsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        Product.objects.create(name="Banana", price=1)
+        Product.objects.create(name="Apple", price=2)
+        Product.objects.create(name="Cherry", price=3)
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        self.url = clarity_url("product", "index")
+
+    def test_only_index_backed_fields_are_sortable(self):
+        response = self.client.get(self.url)
+
+        sort_links = response.context["sort_links"]
+        self.assertIn("name", sort_links)
+        self.assertNotIn("price", sort_links)
+
+    def test_sorting(self):
+        response = self.client.get(self.url, {"o": "-name"})
+
+        names = [item["name"] for item in response.context["items"]]
+        self.assertEqual(names, ["Cherry", "Banana", "Apple"])
+        self.assertEqual(response.context["sort_links"]["name"]["direction"], "desc")
+
+    def test_unsortable_field_is_ignored(self):
+        response = self.client.get(self.url, {"o": "price"})
+
+        self.assertEqual(response.status_code, 200)
+        names = [item["name"] for item in response.context["items"]]
+        self.assertEqual(names, ["Banana", "Apple", "Cherry"])
+
+    def test_links_keep_the_search_and_sort(self):
+        # The test settings don't have the request context processor
+        response = self.client.get(self.url, {"o": "name", "q": "an"})
+
+        self.assertContains(response, '<input type="hidden" name="o" value="name">')
+        self.assertContains(response, 'value="an"')
+        self.assertContains(response, 'href="?o=-name&amp;q=an"')
+
+
+class IndexQueryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.category = Category.objects.create(name="Fruit")
+        for name in ("Apple", "Banana", "Cherry"):
+            Product.objects.create(name=name, category=cls.category)
+
+    def setUp(self):
+        # Start without the facets that other tests cached
+        cache.clear()
+        self.client.force_login(self.user)
+        self.url = clarity_url("product", "index")
+
+    def get_product_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        return [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith("SELECT") and "testapp_product" in query["sql"]
+        ]
+
+    def test_only_the_table_columns_are_loaded(self):
+        sql = self.get_product_queries()[-1]
+
+        self.assertIn('"testapp_product"."name"', sql)
+        self.assertNotIn('"testapp_product"."version"', sql)
+        self.assertNotIn('"testapp_product"."updated_at"', sql)
+
+    def test_related_objects_are_fetched_in_the_same_query(self):
+        queries = self.get_product_queries()
+        for name in ("Dragonfruit", "Elderberry"):
+            Product.objects.create(name=name, category=self.category)
+
+        self.assertEqual(len(self.get_product_queries()), len(queries))
+        self.assertIn('"testapp_category"."name"', queries[-1])
+
+    def test_related_objects_only_load_the_listed_fields(self):
+        with mock.patch.object(
+            ProductAdmin, "list_select_related_fields", {"category": ("name",)}
+        ):
+            sql = self.get_product_queries()[-1]
+
+        self.assertIn('"testapp_category"."name"', sql)
+
+    def test_values_fetch_gives_the_same_rows(self):
+        items = self.client.get(self.url, {"o": "name"}).context["items"]
+
+        with mock.patch.object(ProductAdmin, "list_fetch", "values"):
+            response = self.client.get(self.url, {"o": "name"})
+
+        self.assertEqual(response.context["items"], items)
+        self.assertEqual(response.context["items"][0]["category"], "Fruit")
+
+
+class EditableGridTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.products = [
+            Product.objects.create(name=name, price=1) for name in ("Apple", "Banana")
+        ]
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        self.url = clarity_url("product", "index")
+
+    def get_grid_data(self, **changes):
+        formset = self.client.get(self.url).context["list_editable_formset"]
+        return get_formset_data(formset, **changes)
+
+    def test_changed_rows_are_saved_together(self):
+        data = self.get_grid_data(**{"form-0-price": "2.00", "form-1-price": "3.00"})
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, data)
+
+        self.assertEqual(response.status_code, 302)
+        updates = [
+            query
+            for query in queries.captured_queries
+            if query["sql"].startswith('UPDATE "testapp_product"')
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(
+            [str(price) for price in Product.objects.values_list("price", flat=True)],
+            ["2.00", "3.00"],
+        )
+
+    def test_invalid_rows_save_nothing(self):
+        data = self.get_grid_data(**{"form-0-price": "2.00", "form-1-price": "free"})
+
+        response = self.client.post(self.url, data)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["list_editable_formset"].errors[1])
+        self.assertEqual(Product.objects.filter(price=1).count(), 2)
+
+    def test_view_only_users_cant_edit(self):
+        data = self.get_grid_data(**{"form-0-price": "2.00"})
+        user = create_user("viewer", superuser=False)
+        user.user_permissions.set(Permission.objects.filter(codename="view_product"))
+        self.client.force_login(user)
+
+        response = self.client.get(self.url)
+        self.assertIsNone(response.context.get("list_editable_formset"))
+        self.assertEqual(self.client.post(self.url, data).status_code, 403)
+
+
+class ExtraColumnsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.apple = Product.objects.create(name="Apple")
+        cls.banana = Product.objects.create(name="Banana")
+        LineItem.objects.create(product=cls.apple, label="First", qty=2)
+        LineItem.objects.create(product=cls.apple, label="Second", qty=3)
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+        self.url = clarity_url("product", "index")
+
+    def get_items(self, **kwargs):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, **kwargs)
+
+        return response.context["items"], queries
+
+    @mock.patch.object(
+        ProductAdmin,
+        "list_extra_columns",
+        {
+            "line_items": RelatedCount("lineitem"),
+            "quantity": RelatedSum("lineitem", "qty"),
+            "latest_label": LatestRelated("lineitem", "label"),
+        },
+    )
+    def test_extra_columns(self):
+        items, _ = self.get_items()
+
+        self.assertEqual(
+            [
+                (item["line_items"], item["quantity"], item["latest_label"])
+                for item in items
+            ],
+            [(2, 5, "Second"), (0, 0, None)],
+        )
+
+    def test_extra_columns_are_fetched_in_the_page_query(self):
+        _, queries = self.get_items()
+        for i in range(5):
+            Product.objects.create(name=f"Product {i}")
+        cache.clear()
+
+        with mock.patch.object(
+            ProductAdmin, "list_extra_columns", {"line_items": RelatedCount("lineitem")}
+        ):
+            items, more_queries = self.get_items()
+
+        self.assertEqual(len(items), 7)
+        self.assertEqual(len(more_queries), len(queries))
+
+    def test_extra_items_are_looked_up_once_per_page(self):
+        def get_extra_items_for_page(view, objects):
+            return {obj.pk: {"label": obj.name.upper()} for obj in objects}
+
+        with mock.patch.object(
+            DjangoClarityModelListView,
+            "_get_extra_items_for_page",
+            autospec=True,
+            side_effect=get_extra_items_for_page,
+        ) as hook:
+            items, _ = self.get_items()
+
+        hook.assert_called_once()
+        self.assertEqual([item["label"] for item in items], ["APPLE", "BANANA"])
+
+
+class AggregatesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        apple = Product.objects.create(name="Apple", price="1.50", status="a")
+        Product.objects.create(name="Banana", price="2.50", status="a")
+        Product.objects.create(name="Cherry", price="4.00", status="d")
+        LineItem.objects.create(product=apple, label="First", qty=2)
+        LineItem.objects.create(product=apple, label="Second", qty=3)
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+        self.url = clarity_url("product", "index")
+
+    @mock.patch.object(
+        ProductAdmin, "list_aggregates", {"price": "sum", "name": "count"}
+    )
+    def test_aggregates_of_the_search_results(self):
+        response = self.client.get(self.url, {"status": "a"})
+
+        self.assertEqual(
+            response.context["aggregates"], {"price": Decimal("4.00"), "name": 2}
+        )
+        self.assertContains(response, "<tfoot>")
+
+    @mock.patch.object(ProductAdmin, "list_aggregates", {"price": "avg"})
+    @mock.patch.object(DjangoClarityModelListView, "items_per_page", 1)
+    def test_aggregates_arent_limited_to_the_page(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(len(response.context["items"]), 1)
+        self.assertEqual(response.context["aggregates"], {"price": Decimal("2.67")})
+
+    @mock.patch.object(
+        ProductAdmin, "list_extra_columns", {"quantity": RelatedSum("lineitem", "qty")}
+    )
+    @mock.patch.object(ProductAdmin, "list_aggregates", {"quantity": "sum"})
+    def test_extra_columns_are_aggregated(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.context["aggregates"], {"quantity": 5})
+
+    def test_no_aggregates(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.context["aggregates"], {})
+
+    def test_invalid_aggregates_are_improperly_configured(self):
+        for list_aggregates in [
+            {"price": "median"},
+            {"margin": "sum"},
+            {"tags": "count"},
+        ]:
+            with self.subTest(list_aggregates=list_aggregates):
+                site = AdminSite(name="aggregates")
+                self.addCleanup(_sites.pop, "aggregates", None)
+                site.register(
+                    Product,
+                    type(
+                        "BadProductAdmin",
+                        (ModelAdmin,),
+                        {"list_aggregates": list_aggregates},
+                    ),
+                )
+
+                with self.assertRaises(ImproperlyConfigured):
+                    site.get_urls()
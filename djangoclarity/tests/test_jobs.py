@@ -0,0 +1,135 @@
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+
+from djangoclarity.jobs import enqueue_job, import_staged_csv, run_job
+from djangoclarity.models import Job
+from djangoclarity.registration import AdminSite, ModelAdmin, _sites, get_site
+from djangoclarity.tests.testapp.clarity import ProductAdmin
+from djangoclarity.tests.testapp.models import LineItem, Product
+from djangoclarity.tests.utils import clarity_url, create_user
+from djangoclarity.uploads import open_staged_upload, stage_file
+
+
+def failing_operation(job):
+    raise ValueError("Out of stock")
+
+
+def counting_operation(job, calls):
+    job.set_progress(1, total=2, message="Halfway")
+    return {"calls": calls + 1}
+
+
+class RunJobTests(TestCase):
+    def test_result_is_stored(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            job = enqueue_job(
+                "djangoclarity.tests.test_jobs.counting_operation", {"calls": 0}
+            )
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.SUCCEEDED)
+        self.assertEqual(job.result, {"calls": 1})
+        self.assertEqual((job.progress, job.total, job.message), (1, 2, "Halfway"))
+        self.assertIsNotNone(job.finished_at)
+
+    def test_error_is_stored(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            job = enqueue_job("djangoclarity.tests.test_jobs.failing_operation")
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FAILED)
+        self.assertEqual(job.error, "Out of stock")
+
+    def test_job_is_only_run_once(self):
+        job = Job.objects.create(
+            operation="djangoclarity.tests.test_jobs.counting_operation",
+            kwargs={"calls": 0},
+        )
+        run_job(job.pk)
+        Job.objects.filter(pk=job.pk).update(result=None)
+
+        run_job(job.pk)
+
+        job.refresh_from_db()
+        self.assertIsNone(job.result)
+
+
+class JobViewsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    @mock.patch.object(ProductAdmin, "delete_in_background", True)
+    def test_delete_in_background(self):
+        product = Product.objects.create(name="Apple")
+        LineItem.objects.create(product=product, label="First")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(clarity_url("product", "delete", product.pk))
+
+        job = Job.objects.get()
+        self.assertRedirects(response, f"/clarity/jobs/{job.pk}/")
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.SUCCEEDED)
+        self.assertFalse(Product.objects.exists())
+
+        response = self.client.get(f"/clarity/jobs/{job.pk}/status/")
+        self.assertEqual(response.json()["status"], Job.SUCCEEDED)
+
+    @mock.patch.object(ProductAdmin, "import_in_background", True)
+    def test_import_in_background(self):
+        file = SimpleUploadedFile(
+            "products.csv", b"name,sku,status,price\nApple,A1,a,1\nBanana,B1,d,2\n"
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(clarity_url("product", "import"), {"file": file})
+
+        job = Job.objects.get()
+        self.assertEqual(job.kwargs["site"], "djangoclarity")
+        self.assertEqual(job.status, Job.SUCCEEDED)
+        self.assertEqual(job.result["imported"], 2)
+        self.assertEqual(Product.objects.count(), 2)
+        # The staged file is removed
+        self.assertIsNone(open_staged_upload(job.kwargs["token"]))
+
+    def test_other_users_jobs_are_hidden(self):
+        job = Job.objects.create(operation="", user=self.user)
+        self.client.force_login(create_user("other", superuser=False))
+
+        response = self.client.get(f"/clarity/jobs/{job.pk}/")
+
+        self.assertEqual(response.status_code, 404)
+
+
+class CustomSiteImportTests(TestCase):
+    def setUp(self):
+        # A site with its own registry, and a form without the status and price
+        self.site = AdminSite(name="shop")
+        self.addCleanup(_sites.pop, "shop")
+
+        class ShopProductAdmin(ModelAdmin):
+            fields = ("name", "sku")
+
+        self.site.register(Product, ShopProductAdmin)
+
+    def test_sites_have_their_own_registry(self):
+        self.assertIs(get_site("shop"), self.site)
+        self.assertEqual(self.site.get_model_admin(Product).fields, ("name", "sku"))
+        self.assertIs(get_site("djangoclarity").get_model_admin(Product), ProductAdmin)
+        with self.assertRaises(LookupError):
+            get_site("djangoclarity").get_model_admin(Job)
+
+    def test_import_with_the_sites_form(self):
+        token = stage_file(SimpleUploadedFile("products.csv", b"name,sku\nApple,A1\n"))
+        job = Job.objects.create(operation="djangoclarity.jobs.import_staged_csv")
+
+        result = import_staged_csv(job, "testapp.product", token, site="shop")
+
+        self.assertEqual((result["imported"], result["error_count"]), (1, 0))
+        self.assertEqual(Product.objects.get().sku, "A1")
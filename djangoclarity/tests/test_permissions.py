@@ -0,0 +1,144 @@
+from django.contrib.auth.models import Group, Permission
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from djangoclarity.permissions import connect_permissions_invalidation
+from djangoclarity.tests.testapp.models import Product
+from djangoclarity.tests.utils import clarity_url, create_user
+
+
+def grant(user, *codenames):
+    user.user_permissions.add(*Permission.objects.filter(codename__in=codenames))
+
+
+class PagePermissionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.product = Product.objects.create(name="Apple")
+        cls.user = create_user("clerk", superuser=False)
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+
+    def get_status_codes(self):
+        pk = self.product.pk
+        return {
+            "index": self.client.get(clarity_url("product", "index")).status_code,
+            "create": self.client.get(clarity_url("product", "create")).status_code,
+            "import": self.client.get(clarity_url("product", "import")).status_code,
+            "update": self.client.get(clarity_url("product", "update", pk)).status_code,
+            "save": self.client.post(clarity_url("product", "update", pk)).status_code,
+            "delete": self.client.get(clarity_url("product", "delete", pk)).status_code,
+        }
+
+    def test_anonymous_users_are_sent_to_log_in(self):
+        self.client.logout()
+        url = clarity_url("product", "index")
+
+        response = self.client.get(url)
+
+        self.assertRedirects(
+            response, f"/accounts/login/?next={url}", fetch_redirect_response=False
+        )
+
+    def test_no_permissions(self):
+        self.assertEqual(set(self.get_status_codes().values()), {403})
+
+        response = self.client.get("/clarity/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["app_labels_models"], [])
+
+    def test_view_permission(self):
+        grant(self.user, "view_product")
+
+        self.assertEqual(
+            self.get_status_codes(),
+            {
+                "index": 200,
+                "create": 403,
+                "import": 403,
+                "update": 200,
+                "save": 403,
+                "delete": 403,
+            },
+        )
+        response = self.client.get(clarity_url("product", "index"))
+        self.assertNotContains(response, clarity_url("product", "create"))
+        self.assertNotContains(response, clarity_url("product", "delete", 1))
+
+    def test_change_permission_implies_view(self):
+        grant(self.user, "change_product")
+
+        codes = self.get_status_codes()
+
+        self.assertEqual((codes["index"], codes["update"]), (200, 200))
+        self.assertEqual((codes["create"], codes["delete"]), (403, 403))
+
+    def test_add_and_delete_permissions(self):
+        grant(self.user, "view_product", "add_product", "delete_product")
+
+        codes = self.get_status_codes()
+
+        self.assertEqual(
+            (codes["create"], codes["import"], codes["delete"]), (200,) * 3
+        )
+        self.assertEqual(codes["save"], 403)
+
+    def test_group_permissions(self):
+        group = Group.objects.create(name="Clerks")
+        group.permissions.add(Permission.objects.get(codename="view_product"))
+        self.user.groups.add(group)
+
+        self.assertEqual(self.get_status_codes()["index"], 200)
+
+
+class PermissionQueryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user("clerk", superuser=False)
+        grant(cls.user, "view_product", "change_product", "delete_product")
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+
+    def count_permission_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(clarity_url("product", "index"))
+
+        self.assertEqual(response.status_code, 200)
+        return len(
+            [
+                query
+                for query in queries.captured_queries
+                if '"auth_permission"' in query["sql"]
+            ]
+        )
+
+    def test_permissions_are_loaded_once_per_request(self):
+        Product.objects.create(name="Apple")
+        count = self.count_permission_queries()
+
+        Product.objects.bulk_create(Product(name=f"Product {i}") for i in range(5))
+        cache.clear()
+
+        self.assertLessEqual(count, 2)
+        self.assertEqual(self.count_permission_queries(), count)
+
+    @override_settings(DJANGOCLARITY_PERMISSIONS_CACHE_TIMEOUT=60)
+    def test_cached_permissions(self):
+        connect_permissions_invalidation()
+        self.count_permission_queries()
+
+        self.assertEqual(self.count_permission_queries(), 0)
+
+        # Revoking a permission invalidates the cached permissions
+        self.user.user_permissions.remove(
+            Permission.objects.get(codename="change_product")
+        )
+        self.assertGreater(self.count_permission_queries(), 0)
+        response = self.client.post(clarity_url("product", "update", 1))
+        self.assertEqual(response.status_code, 403)
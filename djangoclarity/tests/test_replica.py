@@ -0,0 +1,120 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connections
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+
+from djangoclarity.tests.testapp.models import LineItem, Product, Tag
+from djangoclarity.tests.utils import (
+    clarity_url,
+    create_user,
+    get_form_data,
+    get_formset_data,
+)
+
+
+class ReplicaRoutingTests(TransactionTestCase):
+    # The replica mirrors the default database (see the test settings). A
+    # TransactionTestCase, since the replica's connection can't see a test
+    # transaction's rows.
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user()
+        self.client.force_login(self.user)
+        self.product = Product.objects.create(name="Apple", price=1)
+
+        # The views share the model's ModelAdmin instance
+        model_admin = resolve(clarity_url("product", "index")).func.view_initkwargs[
+            "model_admin"
+        ]
+        patcher = mock.patch.object(model_admin, "read_db_alias", "replica")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def request(self, method, url, data=None):
+        """Make a request, and return it with the product queries of each alias."""
+        with CaptureQueriesContext(
+            connections["default"]
+        ) as default, CaptureQueriesContext(connections["replica"]) as replica:
+            response = getattr(self.client, method)(url, data)
+
+        def product_queries(queries):
+            return [
+                query["sql"]
+                for query in queries.captured_queries
+                if '"testapp_product"' in query["sql"]
+            ]
+
+        return response, product_queries(default), product_queries(replica)
+
+    def assertReadsFromReplica(self, url):
+        response, default, replica = self.request("get", url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(default, [])
+        self.assertTrue(replica)
+
+    def test_index_reads_from_the_replica(self):
+        self.assertReadsFromReplica(clarity_url("product", "index"))
+
+    def test_data_reads_from_the_replica(self):
+        self.assertReadsFromReplica(clarity_url("product", "data"))
+
+    def test_update_page_reads_from_the_replica(self):
+        self.assertReadsFromReplica(clarity_url("product", "update", self.product.pk))
+
+    def test_delete_page_reads_from_the_replica(self):
+        self.assertReadsFromReplica(clarity_url("product", "delete", self.product.pk))
+
+    def test_inline_choices_read_from_the_replica(self):
+        Tag.objects.create(name="Red")
+        LineItem.objects.create(product=self.product, label="Box")
+        url = clarity_url("product", "update", self.product.pk)
+
+        with CaptureQueriesContext(
+            connections["default"]
+        ) as default, CaptureQueriesContext(connections["replica"]) as replica:
+            response = self.client.get(url)
+
+        self.assertContains(response, ">Red</option>", count=2)
+        tag_queries = [
+            [
+                query
+                for query in queries.captured_queries
+                if '"testapp_tag"' in query["sql"]
+            ]
+            for queries in (default, replica)
+        ]
+        self.assertEqual(tag_queries[0], [])
+        self.assertTrue(tag_queries[1])
+
+    def test_saves_use_the_default_database(self):
+        url = clarity_url("product", "update", self.product.pk)
+        data = get_form_data(self.client.get(url), name="Green apple")
+
+        response, default, replica = self.request("post", url, data)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(replica, [])
+        self.assertTrue(any(sql.startswith("UPDATE") for sql in default))
+
+        # The user's reads stay on the default database for a while, so they see
+        # their own changes
+        response, default, replica = self.request("get", url)
+        self.assertEqual(replica, [])
+        self.assertTrue(default)
+
+    def test_grid_saves_use_the_default_database(self):
+        url = clarity_url("product", "index")
+        formset = self.client.get(url).context["list_editable_formset"]
+        data = get_formset_data(formset, **{"form-0-price": "2.00"})
+
+        response, default, replica = self.request("post", url, data)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(replica, [])
+        self.assertEqual(str(Product.objects.get().price), "2.00")
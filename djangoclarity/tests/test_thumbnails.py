@@ -0,0 +1,54 @@
+from io import BytesIO
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import SimpleTestCase, override_settings
+from PIL import Image
+
+from djangoclarity.thumbnails import (
+    get_thumbnail,
+    get_thumbnail_format,
+    get_thumbnail_name,
+)
+
+
+def save_image(name, size=(200, 100)):
+    """Save a PNG of the given size to the default storage, returning its name."""
+    buffer = BytesIO()
+    Image.new("RGB", size, "red").save(buffer, format="PNG")
+    return default_storage.save(name, ContentFile(buffer.getvalue()))
+
+
+class ThumbnailTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_thumbnail_is_resized_and_stored(self):
+        name = save_image("products/photo.png")
+
+        thumbnail = get_thumbnail(name, 50)
+
+        self.assertEqual((thumbnail["width"], thumbnail["height"]), (50, 25))
+        thumbnail_name = get_thumbnail_name(name, 50, get_thumbnail_format())
+        self.assertTrue(default_storage.exists(thumbnail_name))
+        self.assertEqual(thumbnail["url"], default_storage.url(thumbnail_name))
+
+    def test_size_is_cached(self):
+        name = save_image("products/cached.png")
+        get_thumbnail(name, 50)
+        default_storage.delete(name)
+
+        # The thumbnail isn't created (nor opened) again
+        self.assertEqual(get_thumbnail(name, 50)["width"], 50)
+
+    def test_invalid_original(self):
+        name = default_storage.save("products/photo.txt", ContentFile(b"not an image"))
+
+        self.assertIsNone(get_thumbnail(name, 50))
+
+    @override_settings(DJANGOCLARITY_THUMBNAIL_MAX_SOURCE_PIXELS=100)
+    def test_too_many_pixels(self):
+        name = save_image("products/large.png")
+
+        self.assertIsNone(get_thumbnail(name, 50))
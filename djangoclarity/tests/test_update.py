@@ -0,0 +1,189 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.db.models.signals import post_save
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from djangoclarity.registration import can_bulk_save
+from djangoclarity.tests.testapp.clarity import ProductAdmin
+from djangoclarity.tests.testapp.models import LineItem, Product
+from djangoclarity.tests.utils import clarity_url, create_user, get_form_data
+
+
+class VersionCheckTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+        self.product = Product.objects.create(name="Apple")
+        self.url = clarity_url("product", "update", self.product.pk)
+
+    def test_sequential_saves(self):
+        for name in ("Green apple", "Red apple"):
+            data = get_form_data(self.client.get(self.url), name=name)
+            self.assertEqual(self.client.post(self.url, data).status_code, 302)
+
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.name, "Red apple")
+        self.assertEqual(self.product.version, 2)
+
+    def test_concurrent_save_is_a_conflict(self):
+        first = get_form_data(self.client.get(self.url), name="Green apple")
+        second = get_form_data(self.client.get(self.url), name="Red apple")
+        self.client.post(self.url, first)
+
+        response = self.client.post(self.url, second)
+
+        self.assertEqual(response.status_code, 409)
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.name, "Green apple")
+
+    def test_missing_token_is_a_conflict(self):
+        data = get_form_data(self.client.get(self.url), djangoclarity_version="")
+
+        self.assertEqual(self.client.post(self.url, data).status_code, 409)
+
+    def test_unchanged_save_changes_the_etag(self):
+        with mock.patch.object(ProductAdmin, "conditional_get", True):
+            self.client.get(self.url)
+            response = self.client.get(self.url)
+            etag = response.headers["ETag"]
+
+            # Saving without any changes still moves the object to a new version,
+            # so the page (and its version token) mustn't be answered with a 304
+            self.client.post(self.url, get_form_data(response))
+            response = self.client.get(self.url, headers={"If-None-Match": etag})
+            self.assertEqual(response.status_code, 200)
+
+            data = get_form_data(response, name="Green apple")
+            self.assertEqual(self.client.post(self.url, data).status_code, 302)
+
+    def test_null_version(self):
+        with mock.patch.object(ProductAdmin, "version_field", "revision"):
+            response = self.client.get(self.url)
+            self.assertEqual(response.context["version_token"], "")
+            stale = get_form_data(response, name="Red apple")
+
+            data = get_form_data(response, name="Green apple")
+            self.assertEqual(self.client.post(self.url, data).status_code, 302)
+            self.product.refresh_from_db()
+            self.assertEqual(self.product.revision, 1)
+
+            self.assertEqual(self.client.post(self.url, stale).status_code, 409)
+
+
+class ChangedFieldsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        self.product = Product.objects.create(name="Apple")
+        self.url = clarity_url("product", "update", self.product.pk)
+
+    def test_only_changed_fields_are_written(self):
+        data = get_form_data(self.client.get(self.url), price="2.50")
+        # A change of a field that isn't in the form, ie. by a background task
+        Product.objects.filter(pk=self.product.pk).update(revision=7)
+
+        self.client.post(self.url, data)
+
+        self.product.refresh_from_db()
+        self.assertEqual(str(self.product.price), "2.50")
+        self.assertEqual(self.product.revision, 7)
+
+    def test_fields_changed_by_clean_are_written(self):
+        data = get_form_data(self.client.get(self.url), price="2.50")
+
+        self.client.post(self.url, data)
+
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.search_name, "apple")
+
+    def test_unchanged_save_writes_nothing(self):
+        Product.objects.filter(pk=self.product.pk).update(search_name="apple")
+        updated_at = Product.objects.get(pk=self.product.pk).updated_at
+
+        self.client.post(self.url, get_form_data(self.client.get(self.url)))
+
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.updated_at, updated_at)
+        self.assertEqual(self.product.version, 1)
+
+
+class BulkSaveTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        self.product = Product.objects.create(name="Apple")
+        self.items = [
+            LineItem.objects.create(product=self.product, label=label)
+            for label in ("Box", "Crate")
+        ]
+        self.url = clarity_url("product", "update", self.product.pk)
+
+    def get_item_writes(self, data):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, data)
+
+        self.assertEqual(response.status_code, 302)
+        return [
+            query["sql"]
+            for query in queries.captured_queries
+            if "testapp_lineitem" in query["sql"]
+            and query["sql"].startswith(("INSERT", "UPDATE"))
+        ]
+
+    def test_can_bulk_save(self):
+        self.assertTrue(can_bulk_save(LineItem))
+
+        def receiver(**kwargs):
+            pass
+
+        post_save.connect(receiver, sender=LineItem)
+        self.addCleanup(post_save.disconnect, receiver, sender=LineItem)
+        self.assertFalse(can_bulk_save(LineItem))
+
+    def test_new_children_are_inserted_together(self):
+        data = get_form_data(self.client.get(self.url))
+        data["lineitem_set-TOTAL_FORMS"] = "5"
+        for i, label in enumerate(("Bag", "Tray", "Tin"), start=2):
+            data[f"lineitem_set-{i}-label"] = label
+            data[f"lineitem_set-{i}-qty"] = "1"
+
+        writes = self.get_item_writes(data)
+
+        self.assertEqual(len(writes), 1)
+        self.assertEqual(
+            sorted(self.product.lineitem_set.values_list("label", flat=True)),
+            ["Bag", "Box", "Crate", "Tin", "Tray"],
+        )
+
+    def test_changed_children_are_updated_together(self):
+        data = get_form_data(self.client.get(self.url))
+        data["lineitem_set-0-qty"] = "2"
+        data["lineitem_set-1-qty"] = "3"
+
+        writes = self.get_item_writes(data)
+
+        self.assertEqual(len(writes), 1)
+        self.assertEqual(
+            list(
+                self.product.lineitem_set.order_by("pk").values_list("qty", flat=True)
+            ),
+            [2, 3],
+        )
+
+    def test_unchanged_children_arent_written(self):
+        data = get_form_data(self.client.get(self.url), name="Green apple")
+
+        self.assertEqual(self.get_item_writes(data), [])
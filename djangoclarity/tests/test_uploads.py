@@ -0,0 +1,83 @@
+import os
+from io import BytesIO
+
+from django.contrib.auth.models import Permission
+from django.test import TestCase
+from django.urls import reverse
+from PIL import Image
+
+from djangoclarity.tests.testapp.models import Product
+from djangoclarity.tests.utils import (
+    clarity_url,
+    create_user,
+    get_form_data,
+)
+from djangoclarity.uploads import get_upload_dir
+
+
+def png_bytes():
+    buffer = BytesIO()
+    Image.new("RGB", (20, 10), "blue").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class ChunkedUploadTests(TestCase):
+    def post_chunk(self, data, offset=0, token=None):
+        headers = {
+            "X-Upload-Offset": str(offset),
+            "X-Upload-Filename": "photo.png",
+            "X-Upload-Content-Type": "image/png",
+        }
+        if token:
+            headers["X-Upload-Token"] = token
+
+        return self.client.post(
+            reverse("djangoclarity:djangoclarity-upload"),
+            data,
+            content_type="application/octet-stream",
+            headers=headers,
+        )
+
+    def login(self, *codenames, superuser=False):
+        user = create_user(superuser=superuser)
+        user.user_permissions.set(Permission.objects.filter(codename__in=codenames))
+        self.client.force_login(user)
+
+    def test_anonymous_users_cant_upload(self):
+        self.assertEqual(self.post_chunk(b"data").status_code, 403)
+
+    def test_users_need_to_add_or_change_a_model_with_images(self):
+        # Categories don't have images
+        self.login("view_product", "change_category")
+
+        self.assertEqual(self.post_chunk(b"data").status_code, 403)
+
+    def test_chunks_are_appended(self):
+        self.login("change_product")
+
+        response = self.post_chunk(b"abc")
+        self.assertEqual(response.status_code, 200)
+        token = response.json()["token"]
+
+        response = self.post_chunk(b"de", offset=3, token=token)
+        self.assertEqual(response.json(), {"token": token, "size": 5})
+
+        # A retried chunk isn't appended twice
+        response = self.post_chunk(b"de", offset=3, token=token)
+        self.assertEqual(response.status_code, 400)
+
+    def test_staged_upload_is_removed_once_saved(self):
+        self.login(superuser=True)
+        product = Product.objects.create(name="Apple")
+        token = self.post_chunk(png_bytes()).json()["token"]
+
+        url = clarity_url("product", "update", product.pk)
+        data = get_form_data(self.client.get(url), photo__upload_token=token)
+        response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, 302)
+        product.refresh_from_db()
+        self.assertTrue(product.photo.name.endswith(".png"))
+        self.assertEqual(
+            [name for name in os.listdir(get_upload_dir()) if token in name], []
+        )
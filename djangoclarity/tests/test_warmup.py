@@ -0,0 +1,82 @@
+import os
+import subprocess
+import sys
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from djangoclarity.tests.testapp.clarity import ProductAdmin
+from djangoclarity.tests.testapp.models import Product
+from djangoclarity.tests.utils import clarity_url, create_user
+from djangoclarity.warmup import get_template_names, warmup
+
+
+class WarmupTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_command(self):
+        out = StringIO()
+
+        call_command("clarity_warmup", stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("Loaded the URLconf, with ", output)
+        self.assertIn("Django Clarity is warmed up.", output)
+        self.assertNotIn("Counted", output)
+
+    def test_templates(self):
+        names = get_template_names()
+
+        self.assertIn("djangoclarity/base_index_template.html", names)
+        self.assertIn("djangoclarity/base.html", names)
+
+    def test_counts_need_a_superuser(self):
+        log = []
+
+        warmup(counts=True, log=log.append)
+
+        self.assertIn("Skipped the counts, as there's no active superuser", log)
+
+    @mock.patch.object(ProductAdmin, "list_cache_timeout", 60)
+    def test_counts_are_cached(self):
+        user = create_user()
+        Product.objects.create(name="Apple")
+        Product.objects.create(name="Banana")
+        log = []
+
+        warmup(counts=True, log=log.append)
+
+        self.assertIn("Counted 2 products", log)
+        self.client.force_login(user)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(clarity_url("product", "index"))
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(
+            [
+                query
+                for query in queries.captured_queries
+                if query["sql"].startswith("SELECT COUNT(*)")
+                and '"testapp_product"' in query["sql"]
+            ]
+        )
+
+    def test_doesnt_import_the_test_client(self):
+        # Warming up runs at startup, where django.test shouldn't be needed
+        code = (
+            "import sys, django; django.setup(); "
+            "from djangoclarity.warmup import warmup; warmup(); "
+            "sys.exit('django.test' in sys.modules)"
+        )
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": "djangoclarity.tests.settings"}
+
+        # Run from the repository's root, where djangoclarity is importable
+        root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        process = subprocess.run([sys.executable, "-c", code], env=env, cwd=root)
+
+        self.assertEqual(process.returncode, 0)
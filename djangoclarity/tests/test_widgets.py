@@ -0,0 +1,122 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from django import forms
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from djangoclarity import widgets
+from djangoclarity.assets import CLARITY_JS
+from djangoclarity.tests.testapp.models import Category
+from djangoclarity.widgets import RadioButtonsWidget
+
+STATUS_CHOICES = [("a", "Active"), ("d", "Draft")]
+
+
+class CategoryForm(forms.Form):
+    category = forms.ModelChoiceField(
+        queryset=Category.objects.all(), widget=RadioButtonsWidget
+    )
+
+
+class RadioButtonsWidgetTests(SimpleTestCase):
+    def test_script_is_static_media(self):
+        widget = RadioButtonsWidget(choices=STATUS_CHOICES)
+
+        self.assertIn(CLARITY_JS, widget.media._js)
+        self.assertNotIn("<script", widget.render("status", "a"))
+
+    def test_render(self):
+        class StatusForm(forms.Form):
+            status = forms.ChoiceField(
+                choices=STATUS_CHOICES, widget=RadioButtonsWidget
+            )
+
+        html = str(StatusForm(initial={"status": "d"})["status"])
+
+        self.assertInHTML(
+            '<input type="radio" name="status" value="d" id="id_status_1" checked '
+            'style="display:none;">',
+            html,
+        )
+        self.assertIn('<label for="id_status_1"', html)
+        self.assertIn(' active">Draft</label>', html)
+        self.assertNotIn(' active">Active</label>', html)
+
+    def test_labels_are_escaped(self):
+        widget = RadioButtonsWidget(choices=[("x", "<b>X</b>")])
+
+        self.assertIn("&lt;b&gt;X&lt;/b&gt;", widget.render("letter", None))
+
+
+class CompiledChoicesCacheTests(TestCase):
+    def setUp(self):
+        widgets._compiled_choices_cache.clear()
+        cache.clear()
+
+    def test_static_choices_are_shared(self):
+        first = RadioButtonsWidget(choices=STATUS_CHOICES).get_compiled_choices()
+        second = RadioButtonsWidget(choices=STATUS_CHOICES).get_compiled_choices()
+
+        self.assertIs(first, second)
+
+    def test_static_choices_labels_are_read_once_per_widget(self):
+        widget = RadioButtonsWidget(choices=STATUS_CHOICES)
+        widget.get_compiled_choices()
+
+        with mock.patch.object(widget, "_make_static_choices_cache_key") as make_key:
+            widget.get_compiled_choices()
+            make_key.assert_not_called()
+
+            # Unless the choices are replaced
+            widget.choices = [("x", "Archived")]
+            widget.get_compiled_choices()
+            make_key.assert_called_once()
+
+    def test_model_choices_are_cached_by_model_version(self):
+        CategoryFormSet = forms.formset_factory(CategoryForm, extra=5)
+        category = Category.objects.create(name="Fruit")
+        self.assertIn(">Fruit</label>", str(CategoryForm()["category"]))
+
+        # The formset's forms don't query the choices again
+        formset = CategoryFormSet()
+        with self.assertNumQueries(0):
+            for form in formset:
+                str(form["category"])
+
+        # Saving a category (in any process) bumps the model's version
+        category.name = "Fruits"
+        category.save()
+        Category.objects.create(name="Vegetables")
+        html = str(CategoryForm()["category"])
+
+        self.assertIn(">Fruits</label>", html)
+        self.assertIn(">Vegetables</label>", html)
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_model_choices_need_a_shared_cache(self):
+        Category.objects.create(name="Fruit")
+
+        self.assertIn(">Fruit</label>", str(CategoryForm()["category"]))
+        self.assertEqual(widgets._compiled_choices_cache, {})
+
+    def test_cache_is_bounded(self):
+        with mock.patch.object(widgets, "COMPILED_CHOICES_CACHE_SIZE", 3):
+            for i in range(10):
+                RadioButtonsWidget(choices=[(i, str(i))]).get_compiled_choices()
+
+        self.assertEqual(len(widgets._compiled_choices_cache), 3)
+
+    def test_concurrent_renders(self):
+        def render(i):
+            widget = RadioButtonsWidget(choices=[(i % 50, "Option")])
+            return widget.render("option", None)
+
+        with mock.patch.object(widgets, "COMPILED_CHOICES_CACHE_SIZE", 10):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(render, range(2000)))
+
+        self.assertEqual(len(results), 2000)
+        self.assertLessEqual(len(widgets._compiled_choices_cache), 10)
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class TestappConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "djangoclarity.tests.testapp"
+    label = "testapp"
+
+    def ready(self):
+        from . import clarity  # noqa: F401
@@ -0,0 +1,35 @@
+import djangoclarity
+from djangoclarity.widgets import ThumbnailImageWidget
+
+from .models import Category, LineItem, Product, Tag
+
+
+class LineItemInline(djangoclarity.InlineModelAdmin):
+    model = LineItem
+    fields = ("label", "qty", "tag")
+    extra = 1
+
+
+class ProductAdmin(djangoclarity.ModelAdmin):
+    fields = (
+        "name",
+        "sku",
+        "status",
+        "price",
+        "active",
+        "category",
+        "created",
+        "photo",
+    )
+    widgets = {"photo": ThumbnailImageWidget(upload_mode="chunked")}
+    inlines = [LineItemInline]
+    version_field = "version"
+    list_filter = ("status", "active", "category")
+    date_hierarchy = "created"
+    import_unique_fields = ("sku",)
+    list_editable = ("price", "active")
+
+
+djangoclarity.site.register(Product, ProductAdmin)
+djangoclarity.site.register(Category)
+djangoclarity.site.register(Tag)
@@ -0,0 +1,54 @@
+from django.db import models
+
+
+class Category(models.Model):
+    name = models.CharField(max_length=50)
+
+    def __str__(self):
+        return self.name
+
+
+class Tag(models.Model):
+    name = models.CharField(max_length=50)
+
+    def __str__(self):
+        return self.name
+
+
+class Product(models.Model):
+    STATUS_CHOICES = [("a", "Active"), ("d", "Draft")]
+
+    name = models.CharField(max_length=100, db_index=True)
+    sku = models.CharField(max_length=20, unique=True, null=True, blank=True)
+    status = models.CharField(max_length=1, choices=STATUS_CHOICES, default="a")
+    price = models.DecimalField(max_digits=8, decimal_places=2, default=0)
+    active = models.BooleanField(default=True)
+    category = models.ForeignKey(
+        Category, null=True, blank=True, on_delete=models.SET_NULL
+    )
+    tags = models.ManyToManyField(Tag, blank=True)
+    photo = models.ImageField(upload_to="products", blank=True)
+    created = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    version = models.IntegerField(default=0)
+    # A nullable version field, ie. one that was added to existing rows
+    revision = models.IntegerField(null=True, blank=True)
+    # Set by clean(), rather than by the form
+    search_name = models.CharField(max_length=100, blank=True)
+
+    def __str__(self):
+        return self.name
+
+    def clean(self):
+        self.search_name = self.name.lower()
+
+
+class LineItem(models.Model):
+    product = models.ForeignKey(Product, on_delete=models.CASCADE)
+    label = models.CharField(max_length=50)
+    qty = models.IntegerField(default=1)
+    tag = models.ForeignKey(Tag, null=True, blank=True, on_delete=models.SET_NULL)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return self.label
@@ -0,0 +1,9 @@
+from django.contrib import admin
+from django.urls import include, path
+
+from djangoclarity import site
+
+urlpatterns = [
+    path("admin/", admin.site.urls),
+    path("clarity/", include(site.urls)),
+]
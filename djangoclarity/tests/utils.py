@@ -0,0 +1,64 @@
+from django.contrib.auth import get_user_model
+from django.db.models.fields.files import FieldFile
+from django.urls import reverse
+
+
+def clarity_url(model_name, page, pk=None):
+    """Return the URL of a test app model's page, ie. ("product", "update", 1)."""
+    kwargs = {"pk": pk} if pk is not None else {}
+    return reverse(
+        f"djangoclarity:djangoclarity-testapp-{model_name}-{page}", kwargs=kwargs
+    )
+
+
+def create_user(username="admin", superuser=True, **kwargs):
+    """Create an (active, staff) user, a superuser by default."""
+    return get_user_model().objects.create_user(
+        username=username,
+        password="password",
+        is_staff=True,
+        is_superuser=superuser,
+        **kwargs,
+    )
+
+
+def _add_form_data(data, form):
+    """Add a form's rendered values to POST data, as a browser would send them."""
+    for bound_field in form:
+        value = bound_field.value()
+        if value is None or value is False or isinstance(value, FieldFile):
+            continue
+        if value is True:
+            data[bound_field.html_name] = "on"
+        elif isinstance(value, (list, tuple)):
+            data[bound_field.html_name] = [str(v) for v in value]
+        else:
+            data[bound_field.html_name] = bound_field.field.widget.format_value(value)
+
+
+def get_formset_data(formset, **changes):
+    """Return the POST data of a formset (as it was rendered), with the changes."""
+    data = {}
+    for form in [formset.management_form] + list(formset.forms):
+        _add_form_data(data, form)
+
+    data.update(changes)
+    return data
+
+
+def get_form_data(response, **changes):
+    """
+    Return the POST data that a browser would send for a create or update page's
+    form and formsets (as they were rendered), with the given changes.
+    """
+    context = response.context
+    data = {}
+    _add_form_data(data, context["form"])
+    for formset in context.get("formsets", []):
+        data.update(get_formset_data(formset))
+
+    if context.get("version_token_name"):
+        data[context["version_token_name"]] = context["version_token"]
+
+    data.update(changes)
+    return data
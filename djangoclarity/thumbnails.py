@@ -0,0 +1,165 @@
+"""
+Server-generated thumbnails for ThumbnailImageWidget.
+
+Thumbnails are resized with Pillow the first time they're needed (or ahead of time,
+with `generate_thumbnails()` ie. from a post_save receiver), and stored with the
+original file's storage in a "thumbnails" directory next to it, under a name that's
+derived from the original's. Their dimensions are kept in Django Clarity's cache,
+so that rendering a widget doesn't have to open the file again.
+
+Pillow is optional. Without it, no thumbnails are generated and the widget falls
+back to showing the original image.
+
+Settings:
+    DJANGOCLARITY_THUMBNAIL_FORMAT: "WEBP" (default) or "JPEG"
+    DJANGOCLARITY_THUMBNAIL_QUALITY: encoder quality (default: 80)
+    DJANGOCLARITY_THUMBNAIL_MAX_SOURCE_BYTES: larger originals aren't thumbnailed
+        (default: 50 MB)
+    DJANGOCLARITY_THUMBNAIL_MAX_SOURCE_PIXELS: originals with more pixels aren't
+        thumbnailed (default: 50 megapixels)
+"""
+
+import hashlib
+import posixpath
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+from .cache import get_cache
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:
+    Image = None
+
+THUMBNAIL_DIR = "thumbnails"
+
+FORMAT_EXTENSIONS = {"WEBP": "webp", "JPEG": "jpg"}
+
+
+def get_thumbnail_format():
+    """Return the Pillow format to save thumbnails in."""
+    thumbnail_format = getattr(settings, "DJANGOCLARITY_THUMBNAIL_FORMAT", "WEBP")
+    thumbnail_format = thumbnail_format.upper()
+
+    # Fall back to JPEG if Pillow was built without WebP support
+    if thumbnail_format == "WEBP" and not features.check("webp"):
+        thumbnail_format = "JPEG"
+
+    return thumbnail_format
+
+
+def get_thumbnail_name(name, width, thumbnail_format):
+    """
+    Return the storage name of an original file's thumbnail, ie.
+    "products/photo.jpg" -> "products/thumbnails/photo.3f2a9c1b0d4e.200w.webp"
+    """
+    dirname, basename = posixpath.split(name)
+    stem = posixpath.splitext(basename)[0]
+    digest = hashlib.md5(name.encode(), usedforsecurity=False).hexdigest()[:12]
+    extension = FORMAT_EXTENSIONS[thumbnail_format]
+
+    return posixpath.join(
+        dirname, THUMBNAIL_DIR, f"{stem}.{digest}.{width}w.{extension}"
+    )
+
+
+def _create_thumbnail(name, thumbnail_name, width, thumbnail_format, storage):
+    """
+    Resize the original file to the given width and save it to storage.
+    Returns the (width, height) of the thumbnail, or None if it can't be created.
+    """
+    max_bytes = getattr(
+        settings, "DJANGOCLARITY_THUMBNAIL_MAX_SOURCE_BYTES", 50 * 1024 * 1024
+    )
+    max_pixels = getattr(
+        settings, "DJANGOCLARITY_THUMBNAIL_MAX_SOURCE_PIXELS", 50_000_000
+    )
+
+    try:
+        if storage.size(name) > max_bytes:
+            return None
+
+        with storage.open(name, "rb") as f:
+            image = Image.open(f)
+
+            # Only the header has been read so far, so check the size before decoding
+            if image.width * image.height > max_pixels:
+                return None
+
+            # Use draft mode for JPEGs, which decodes at a reduced scale
+            image.draft("RGB", (width, width * image.height // image.width))
+            image = ImageOps.exif_transpose(image)
+            image.thumbnail((width, image.height), Image.Resampling.LANCZOS)
+
+        if thumbnail_format == "JPEG" and image.mode != "RGB":
+            image = image.convert("RGB")
+        elif image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA")
+
+        quality = getattr(settings, "DJANGOCLARITY_THUMBNAIL_QUALITY", 80)
+        buffer = BytesIO()
+        image.save(buffer, format=thumbnail_format, quality=quality)
+
+        # Don't let the storage rename the file, or it wouldn't be found again
+        if storage.exists(thumbnail_name):
+            storage.delete(thumbnail_name)
+        storage.save(thumbnail_name, ContentFile(buffer.getvalue()))
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return None
+
+    return image.size
+
+
+def get_thumbnail(name, width, storage=None):
+    """
+    Return a dict of the "url", "width" and "height" of an original file's thumbnail,
+    creating the thumbnail if it doesn't exist yet.
+    Returns None if Pillow isn't installed or the original can't be thumbnailed.
+    """
+    if Image is None or not name:
+        return None
+
+    storage = storage or default_storage
+    thumbnail_format = get_thumbnail_format()
+    thumbnail_name = get_thumbnail_name(name, width, thumbnail_format)
+
+    cache = get_cache()
+    cache_key = f"djangoclarity:thumbnail:{thumbnail_name}"
+    size = cache.get(cache_key)
+
+    # An empty size means the original couldn't be thumbnailed recently
+    if size == ():
+        return None
+
+    if size is None:
+        if storage.exists(thumbnail_name):
+            try:
+                with storage.open(thumbnail_name, "rb") as f:
+                    size = Image.open(f).size
+            except OSError:
+                size = None
+
+        if size is None:
+            size = _create_thumbnail(
+                name, thumbnail_name, width, thumbnail_format, storage
+            )
+            if size is None:
+                # Don't retry on every render
+                cache.set(cache_key, (), 60 * 60)
+                return None
+
+        cache.set(cache_key, size, None)
+
+    return {
+        "url": storage.url(thumbnail_name),
+        "width": size[0],
+        "height": size[1],
+    }
+
+
+def generate_thumbnails(name, widths, storage=None):
+    """Create the thumbnails of an original file for each width, ie. when it's saved."""
+    return [get_thumbnail(name, width, storage=storage) for width in widths]
@@ -0,0 +1,190 @@
+"""
+Staged (chunked) uploads for ThumbnailImageWidget.
+
+In "chunked" upload mode the browser downscales the image, then sends it in chunks
+to DjangoClarityChunkedUploadView, which streams them into a staging file. The
+form is then submitted with only the upload's token, and the widget hands the
+staged file to the form as if it had been uploaded with it.
+
+Settings:
+    DJANGOCLARITY_UPLOAD_DIR: directory for staged uploads (default: a
+        "djangoclarity_uploads" directory in FILE_UPLOAD_TEMP_DIR or the system's
+        temporary directory). It must be shared by all of the app's servers.
+    DJANGOCLARITY_UPLOAD_MAX_BYTES: maximum size of a staged upload
+        (default: 20 MB)
+    DJANGOCLARITY_UPLOAD_EXPIRY: seconds after which unused staged uploads are
+        removed (default: 1 day)
+
+Staged uploads are removed once the form that used them is saved. Abandoned ones
+(ie. of forms that were never submitted) are removed by remove_expired_uploads(),
+which runs whenever an upload starts. Sites with few uploads should also run it
+periodically, ie. from a cron job with `manage.py shell -c`.
+"""
+
+import json
+import os
+import re
+import tempfile
+import time
+import uuid
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+
+TOKEN_RE = re.compile(r"^[0-9a-f]{32}$")
+
+
+class UploadError(Exception):
+    pass
+
+
+class StagedUploadedFile(UploadedFile):
+    """An uploaded file that was staged on disk by the chunked upload view."""
+
+    def __init__(self, path, name, content_type, token=None):
+        super().__init__(
+            file=open(path, "rb"),
+            name=name,
+            content_type=content_type,
+            size=os.path.getsize(path),
+        )
+        self._path = path
+        self.token = token
+
+    def temporary_file_path(self):
+        return self._path
+
+    def close(self):
+        try:
+            return self.file.close()
+        except FileNotFoundError:
+            pass
+
+
+def get_upload_dir():
+    """Return the directory that staged uploads are written to, creating it."""
+    upload_dir = getattr(settings, "DJANGOCLARITY_UPLOAD_DIR", None)
+    if upload_dir is None:
+        temp_dir = settings.FILE_UPLOAD_TEMP_DIR or tempfile.gettempdir()
+        upload_dir = os.path.join(temp_dir, "djangoclarity_uploads")
+
+    os.makedirs(upload_dir, exist_ok=True)
+
+    return upload_dir
+
+
+def _get_paths(token):
+    """Return the (data, metadata) file paths of a staged upload."""
+    if not TOKEN_RE.match(token or ""):
+        raise UploadError("Invalid upload token")
+
+    upload_dir = get_upload_dir()
+
+    return (
+        os.path.join(upload_dir, f"{token}.part"),
+        os.path.join(upload_dir, f"{token}.json"),
+    )
+
+
+def start_upload(name, content_type):
+    """Create a new, empty staged upload and return its token."""
+    remove_expired_uploads()
+
+    token = uuid.uuid4().hex
+    data_path, metadata_path = _get_paths(token)
+
+    with open(metadata_path, "w") as f:
+        json.dump({"name": os.path.basename(name), "content_type": content_type}, f)
+    open(data_path, "wb").close()
+
+    return token
+
+
+def append_chunk(token, offset, stream, chunk_size=64 * 1024):
+    """
+    Stream a chunk onto the end of a staged upload and return the upload's new size.
+    The offset must be the upload's current size, so that a retried chunk can't be
+    appended twice.
+    """
+    data_path, _ = _get_paths(token)
+    max_bytes = getattr(settings, "DJANGOCLARITY_UPLOAD_MAX_BYTES", 20 * 1024 * 1024)
+
+    try:
+        size = os.path.getsize(data_path)
+    except FileNotFoundError:
+        raise UploadError("Unknown upload token")
+
+    if offset != size:
+        raise UploadError(f"Expected offset {size}, got {offset}")
+
+    with open(data_path, "ab") as f:
+        while True:
+            data = stream.read(chunk_size)
+            if not data:
+                break
+
+            size += len(data)
+            if size > max_bytes:
+                raise UploadError("Upload is too large")
+
+            f.write(data)
+
+    return size
+
+
+def stage_file(file):
+    """
+    Copy an uploaded file to a new staged upload and return its token, ie. for a
+    background job that outlives the request (and its temporary file).
+    """
+    token = start_upload(file.name, getattr(file, "content_type", "") or "")
+    data_path, _ = _get_paths(token)
+
+    with open(data_path, "wb") as f:
+        for chunk in file.chunks():
+            f.write(chunk)
+
+    return token
+
+
+def open_staged_upload(token):
+    """
+    Return a StagedUploadedFile for a token, or None if there's no such upload.
+    """
+    try:
+        data_path, metadata_path = _get_paths(token)
+        with open(metadata_path) as f:
+            metadata = json.load(f)
+    except (UploadError, OSError, ValueError):
+        return None
+
+    if not os.path.exists(data_path):
+        return None
+
+    return StagedUploadedFile(
+        data_path, metadata["name"], metadata["content_type"], token=token
+    )
+
+
+def remove_staged_upload(token):
+    """Remove a staged upload once it has been used."""
+    for path in _get_paths(token):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def remove_expired_uploads():
+    """Remove any staged uploads that are older than the expiry."""
+    expiry = getattr(settings, "DJANGOCLARITY_UPLOAD_EXPIRY", 24 * 60 * 60)
+    upload_dir = get_upload_dir()
+    now = time.time()
+
+    with os.scandir(upload_dir) as entries:
+        for entry in entries:
+            try:
+                if now - entry.stat().st_mtime > expiry:
+                    os.remove(entry.path)
+            except OSError:
+                continue
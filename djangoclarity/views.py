@@ -1,16 +1,152 @@
+import base64
+import datetime
+import hashlib
 import json
 import pprint
+import time
+from urllib.parse import unquote
 
-from django.core.exceptions import FieldDoesNotExist
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, PermissionDenied, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import transaction
-from django.db.models import Q
-from django.forms import model_to_dict
-from django.http import HttpResponseRedirect
-from django.urls import reverse, reverse_lazy
+from django.db.models import (
+    Avg,
+    CharField,
+    Count,
+    F,
+    FileField,
+    Max,
+    Min,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+)
+from django.db.models.functions import Concat
+from django.forms import Media, model_to_dict
+from django.http import Http404, HttpResponseRedirect, JsonResponse
+from django.template.response import TemplateResponse
+from django.urls import get_script_prefix, get_urlconf, reverse, reverse_lazy
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
 from django.views.generic import CreateView, DeleteView, ListView, UpdateView
-from django.views.generic.base import TemplateView
-
+from django.views.generic.base import TemplateView, View
+
+from .cache import (
+    bump_model_version,
+    get_cache,
+    get_model_versions,
+    is_cache_shared,
+    make_cache_key,
+)
 from .dataclasses import ReadOnlyField
+from .imports import ImportForm, get_import_field_names, import_csv
+from .uploads import (
+    StagedUploadedFile,
+    UploadError,
+    append_chunk,
+    remove_staged_upload,
+    stage_file,
+    start_upload,
+)
+
+# Cache of (namespace, URL name, script prefix, urlconf) to the parts of an object
+# URL around its pk, see DjangoClarityModelBaseView._reverse_object_url()
+_object_url_templates = {}
+_OBJECT_URL_SENTINEL = 987654321
+
+# Session key of the time of the user's last save, see
+# DjangoClarityModelBaseView.get_read_db_alias()
+LAST_WRITE_SESSION_KEY = "djangoclarity_last_write"
+
+# The functions of ModelAdmin.list_aggregates
+AGGREGATE_FUNCTIONS = {"sum": Sum, "avg": Avg, "min": Min, "max": Max, "count": Count}
+
+# Attribute of a loaded instance with its field values as they were loaded, see
+# remember_loaded_values()
+LOADED_VALUES_ATTRIBUTE = "_djangoclarity_loaded_values"
+
+
+def _get_timestamp_field(model, field_name):
+    """Return the model's DateTimeField with the given name, or None."""
+    if not field_name:
+        return None
+
+    try:
+        field = model._meta.get_field(field_name)
+    except FieldDoesNotExist:
+        return None
+
+    return field if field.get_internal_type() == "DateTimeField" else None
+
+
+def remember_loaded_values(instance):
+    """
+    Remember the values of a loaded instance's (non-deferred) concrete fields, so
+    that the fields that are changed before it's saved other than by its form (ie.
+    by the model's clean()) are saved too, see get_update_fields().
+    """
+    deferred_fields = instance.get_deferred_fields()
+    setattr(
+        instance,
+        LOADED_VALUES_ATTRIBUTE,
+        {
+            field.attname: field.value_to_string(instance)
+            for field in instance._meta.concrete_fields
+            if field.attname not in deferred_fields
+        },
+    )
+
+
+def get_changed_fields(instance):
+    """
+    Return the names of an instance's concrete fields whose values changed since
+    remember_loaded_values(), or None if they weren't remembered.
+    """
+    loaded_values = getattr(instance, LOADED_VALUES_ATTRIBUTE, None)
+    if loaded_values is None:
+        return None
+
+    changed_fields = []
+    for field in instance._meta.concrete_fields:
+        if field.attname in loaded_values:
+            changed = field.value_to_string(instance) != loaded_values[field.attname]
+        else:
+            # A field that was deferred, and has been set since
+            changed = field.attname in instance.__dict__
+        if changed:
+            changed_fields.append(field.name)
+
+    return changed_fields
+
+
+def _get_visible_models(request, models, model_admins):
+    """
+    Return the models that the request's user can view, checked with their
+    ModelAdmins (from the user's permissions, which are only loaded once).
+    """
+    # Imported here to avoid a circular import with the registration module
+    from .registration import ModelAdmin
+
+    return [
+        model
+        for model in models
+        if (model_admins.get(model) or ModelAdmin(model)).has_view_permission(request)
+    ]
+
+
+def handle_no_permission(request):
+    """Send anonymous users to log in, and deny the page to everyone else."""
+    if request.user.is_authenticated:
+        raise PermissionDenied
+
+    # Imported here since the auth views can't be imported before the apps are ready
+    from django.contrib.auth.views import redirect_to_login
+
+    return redirect_to_login(request.get_full_path())
 
 
 class DjangoClarityIndexView(TemplateView):
@@ -18,6 +154,7 @@ class DjangoClarityIndexView(TemplateView):
     template_name = "djangoclarity/index.html"
     namespace = None
     app_label_models_dict = None
+    model_admins = None
 
     def __init__(self, *args, **kwargs):
         # Extract the required data from .as_view()'s kwargs
@@ -39,12 +176,26 @@ class DjangoClarityIndexView(TemplateView):
                 % (self.__class__.__name__,)
             )
 
+        # The models' ModelAdmins, for their permissions
+        self.model_admins = kwargs.pop("model_admins", {})
+
+    def dispatch(self, request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            return handle_no_permission(request)
+
+        return super().dispatch(request, *args, **kwargs)
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
         context["app_labels_models"] = []
 
         for app_label, models in sorted(self.app_label_models_dict.items()):
+            # Only list the models that the user can view, and the apps that have any
+            models = _get_visible_models(self.request, models, self.model_admins)
+            if not models:
+                continue
+
             app_models_dict = {}
 
             app_models_dict["app_label"] = {
@@ -74,6 +225,7 @@ class DjangoClarityAppIndexView(TemplateView):
     namespace = None
     app_label = None
     models = None
+    model_admins = None
 
     def __init__(self, *args, **kwargs):
         # Extract the required data from .as_view()'s kwargs
@@ -104,6 +256,15 @@ class DjangoClarityAppIndexView(TemplateView):
                 % (self.__class__.__name__,)
             )
 
+        # The models' ModelAdmins, for their permissions
+        self.model_admins = kwargs.pop("model_admins", {})
+
+    def dispatch(self, request, *args, **kwargs):
+        if not request.user.is_authenticated:
+            return handle_no_permission(request)
+
+        return super().dispatch(request, *args, **kwargs)
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
@@ -113,8 +274,11 @@ class DjangoClarityAppIndexView(TemplateView):
             "window_title": self.app_label.title(),
         }
 
+        # Only list the models that the user can view
+        models = _get_visible_models(self.request, self.models, self.model_admins)
+
         context["models"] = []
-        for model in sorted(self.models, key=lambda m: m.__name__):
+        for model in sorted(models, key=lambda m: m.__name__):
             context["models"].append(
                 {
                     "url": reverse(
@@ -127,6 +291,126 @@ class DjangoClarityAppIndexView(TemplateView):
         return context
 
 
+class DjangoClarityChunkedUploadView(View):
+    """
+    Receives the chunks of a staged upload from ThumbnailImageWidget's "chunked"
+    upload mode (see the uploads module).
+
+    Each chunk is sent as the raw request body and streamed to the staging file.
+    Its position is given by the X-Upload-Offset header. The first chunk is sent
+    without an X-Upload-Token header, and starts a new upload whose token is
+    returned for the following chunks (and, finally, the form).
+    """
+
+    http_method_names = ["post"]
+    # The ModelAdmins of the registered models with image fields, which the user
+    # needs to be able to add or change one of to upload
+    model_admins = []
+
+    def has_permission(self):
+        return any(
+            model_admin.has_add_permission(self.request)
+            or model_admin.has_change_permission(self.request)
+            for model_admin in self.model_admins
+        )
+
+    def post(self, request, *args, **kwargs):
+        if not request.user.is_active or not self.has_permission():
+            return JsonResponse({"error": "Permission denied"}, status=403)
+
+        try:
+            offset = int(request.headers.get("X-Upload-Offset", 0))
+        except ValueError:
+            return JsonResponse({"error": "Invalid offset"}, status=400)
+
+        try:
+            token = request.headers.get("X-Upload-Token")
+            if not token:
+                token = start_upload(
+                    unquote(request.headers.get("X-Upload-Filename", "upload")),
+                    request.headers.get("X-Upload-Content-Type", ""),
+                )
+
+            size = append_chunk(token, offset, request)
+        except UploadError as e:
+            return JsonResponse({"error": str(e)}, status=400)
+
+        return JsonResponse({"token": token, "size": size})
+
+
+class DjangoClarityJobView(TemplateView):
+    """
+    Shows a background job's progress (see the jobs module), which the page polls
+    from DjangoClarityJobStatusView until the job is done.
+    """
+
+    base_template = "djangoclarity/base.html"
+    template_name = "djangoclarity/job.html"
+    namespace = None
+
+    def __init__(self, *args, **kwargs):
+        # Extract the required data from .as_view()'s kwargs
+        # Namespace
+        try:
+            self.namespace = kwargs.pop("namespace")
+        except KeyError:
+            raise TypeError(
+                "%s() missing required keyword argument: 'namespace'"
+                % (self.__class__.__name__,)
+            )
+
+    def get_job(self):
+        """Return the job, which only its user (or a superuser) can see."""
+        # Imported here since models can't be imported before the apps are ready
+        from .models import Job
+
+        user = self.request.user
+        if not user.is_authenticated:
+            raise Http404("No job found")
+
+        jobs = Job.objects.all()
+        if not user.is_superuser:
+            jobs = jobs.filter(user=user)
+
+        try:
+            return jobs.get(pk=self.kwargs["pk"])
+        except Job.DoesNotExist:
+            raise Http404("No job found")
+
+    def get_job_status(self, job):
+        """Return the job's state, as sent to the page's polling."""
+        return {
+            "status": job.status,
+            "status_display": job.get_status_display(),
+            "done": job.is_done,
+            "progress": job.progress,
+            "total": job.total,
+            "percent": job.percent,
+            "message": job.message,
+            "error": job.error,
+        }
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+
+        context["job"] = self.get_job()
+        context["status_url"] = reverse(
+            f"{self.namespace}:djangoclarity-job-status",
+            kwargs={"pk": context["job"].pk},
+        )
+
+        return context
+
+
+class DjangoClarityJobStatusView(DjangoClarityJobView):
+    """Returns a background job's state as JSON, for the job page's polling."""
+
+    http_method_names = ["get"]
+
+    def get(self, request, *args, **kwargs):
+        return JsonResponse(self.get_job_status(self.get_job()))
+
+
 class DjangoClarityModelBaseView:
     base_template = "djangoclarity/base.html"
 
@@ -137,6 +421,7 @@ class DjangoClarityModelBaseView:
     formsets = []
     formset_layouts = []
     namespace = None
+    model_admin = None
 
     def __init__(self, *args, **kwargs):
         # Extract the required data from .as_view()'s kwargs
@@ -171,8 +456,16 @@ class DjangoClarityModelBaseView:
                 % (self.__class__.__name__,)
             )
 
-        # Create the remaining needed data
+        # Model Admin (fall back to the default options if not provided)
         self.model = self.form_class.Meta.model
+        self.model_admin = kwargs.pop("model_admin", None)
+        if self.model_admin is None:
+            # Imported here to avoid a circular import with the registration module
+            from .registration import ModelAdmin
+
+            self.model_admin = ModelAdmin(self.model)
+
+        # Create the remaining needed data
         url_name_prefix = (
             f"djangoclarity-{self.model._meta.app_label}-{self.model._meta.model_name}"
         )
@@ -181,7 +474,9 @@ class DjangoClarityModelBaseView:
         # self.index_url_name = self.form_class.Meta.url_names["index_url_name"]
         # self.update_url_name = self.form_class.Meta.url_names["update_url_name"]
         self.create_url_name = f"{url_name_prefix}-create"
+        self.data_url_name = f"{url_name_prefix}-data"
         self.delete_url_name = f"{url_name_prefix}-delete"
+        self.import_url_name = f"{url_name_prefix}-import"
         self.index_url_name = f"{url_name_prefix}-index"
         self.update_url_name = f"{url_name_prefix}-update"
 
@@ -191,6 +486,342 @@ class DjangoClarityModelBaseView:
         # TODO: do I need to do this? DjangoClarityModelBaseView doesn't have a superclass
         super().__init__(*args, **kwargs)
 
+    def has_permission(self):
+        """
+        Return whether the user can use the page, meant to be overridden. Most pages
+        only need the view permission (see ModelAdmin.has_view_permission()).
+        """
+        return self.model_admin.has_view_permission(self.request)
+
+    def dispatch(self, request, *args, **kwargs):
+        """Send users without the page's permission to log in, or deny them."""
+        if not self.has_permission():
+            return handle_no_permission(request)
+
+        return super().dispatch(request, *args, **kwargs)
+
+    def get_permissions_context(self):
+        """Return the user's permissions for the model, for the templates' links."""
+        return {
+            "has_view_permission": self.model_admin.has_view_permission(self.request),
+            "has_add_permission": self.model_admin.has_add_permission(self.request),
+            "has_change_permission": self.model_admin.has_change_permission(
+                self.request
+            ),
+            "has_delete_permission": self.model_admin.has_delete_permission(
+                self.request
+            ),
+        }
+
+    def get_read_db_alias(self):
+        """
+        Return the database alias that the page's reads are sent to, or None for
+        the default database. Only GET (and HEAD) requests use the read database,
+        and not within ModelAdmin.read_your_writes_window seconds of the user's
+        last save, so that a replica's lag can't hide the user's own changes.
+        """
+        alias = self.model_admin.read_db_alias
+        if alias is None or self.request.method not in ("GET", "HEAD"):
+            return None
+
+        window = self.model_admin.read_your_writes_window
+        session = getattr(self.request, "session", None)
+        if window and session is not None:
+            last_write = session.get(LAST_WRITE_SESSION_KEY)
+            if last_write is not None and time.time() - last_write < window:
+                return None
+
+        return alias
+
+    def using_read_db(self, queryset):
+        """Send a queryset to the read database (see `get_read_db_alias()`)."""
+        alias = self.get_read_db_alias()
+
+        return queryset if alias is None else queryset.using(alias)
+
+    def get_queryset(self):
+        """
+        Read the page's objects from the read database.
+        """
+        return self.using_read_db(super().get_queryset())
+
+    def use_read_db_for_choices(self, *forms):
+        """
+        Read the forms' choices (ie. ForeignKey selects) from the read database.
+        Formsets are given by their forms.
+        """
+        if self.get_read_db_alias() is None:
+            return
+
+        for form in forms:
+            for field in form.fields.values():
+                if getattr(field, "queryset", None) is not None:
+                    field.queryset = self.using_read_db(field.queryset)
+
+    def get_form(self, form_class=None):
+        """Read the form's choices from the read database."""
+        form = super().get_form(form_class)
+        self.use_read_db_for_choices(form)
+
+        return form
+
+    def record_write(self):
+        """
+        Note the time of the user's save in their session, which keeps their reads
+        on the default database for ModelAdmin.read_your_writes_window seconds.
+        """
+        session = getattr(self.request, "session", None)
+        if self.model_admin.read_db_alias is not None and session is not None:
+            session[LAST_WRITE_SESSION_KEY] = time.time()
+
+    def remove_staged_uploads(self, form, formsets=()):
+        """
+        Remove the staged (chunked) uploads that the saved form and formsets used,
+        now that their files have been saved to storage.
+        """
+        forms = [form] + [f for formset in formsets for f in formset.forms]
+        for f in forms:
+            for value in getattr(f, "cleaned_data", {}).values():
+                if isinstance(value, StagedUploadedFile):
+                    value.close()
+                    remove_staged_upload(value.token)
+
+    def redirect_to_job(self, operation, kwargs, label=""):
+        """
+        Queue an operation as a background job (see the jobs module), and redirect
+        to the job's progress page, which links back to the model's index once done.
+        """
+        # Imported here since models can't be imported before the apps are ready
+        from .jobs import enqueue_job
+
+        job = enqueue_job(
+            operation,
+            kwargs,
+            label=label,
+            user=self.request.user,
+            return_url=reverse(f"{self.namespace}:{self.index_url_name}"),
+        )
+
+        return HttpResponseRedirect(
+            reverse(f"{self.namespace}:djangoclarity-job", kwargs={"pk": job.pk})
+        )
+
+    def _reverse_object_url(self, url_name, pk):
+        """
+        Reverse one of the model's object URLs (ie. Update or Delete) for a pk.
+        The URL is only reversed once per URL name, and the pk is then substituted
+        in, which is much cheaper when building a whole page of links.
+        """
+        key = (self.namespace, url_name, get_script_prefix(), get_urlconf())
+        url_parts = _object_url_templates.get(key)
+        if url_parts is None:
+            url = reverse(
+                f"{self.namespace}:{url_name}", kwargs={"pk": _OBJECT_URL_SENTINEL}
+            )
+            url_parts = url.split(str(_OBJECT_URL_SENTINEL))
+            if len(url_parts) != 2:
+                # The sentinel isn't unambiguous in this URL, so don't cache it
+                return reverse(f"{self.namespace}:{url_name}", kwargs={"pk": pk})
+            _object_url_templates[key] = url_parts
+
+        return f"{url_parts[0]}{pk}{url_parts[1]}"
+
+    def get_validators(self):
+        """
+        Return a tuple of the (ETag, Last-Modified timestamp) of the page for a GET
+        request, or None to always render it. Meant to be overridden.
+        """
+        return None
+
+    def make_etag(self, *parts):
+        """
+        Return a quoted ETag for the parts, and for the parts of the request that
+        change the page for the same data (the user, and the CSRF secret that the
+        page's forms are rendered with).
+        """
+        user = getattr(self.request, "user", None)
+        parts += (getattr(user, "pk", None), self.request.META.get("CSRF_COOKIE"))
+        digest = hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+
+        return quote_etag(digest)
+
+    def is_conditional_get_enabled(self):
+        """
+        Return whether GETs are answered with validators (and 304 Not Modified):
+        if ModelAdmin.conditional_get is set, and the cache is shared between
+        processes. The ETags include model versions, and a per-process cache never
+        sees the versions that other processes bump.
+        """
+        return self.model_admin.conditional_get and is_cache_shared()
+
+    def get_not_modified_response(self, validators):
+        """
+        Return a 304 Not Modified response if the request's If-None-Match matches
+        the validators, otherwise None.
+        """
+        if validators is None or not self.is_conditional_get_enabled():
+            return None
+
+        # Only the ETag is checked: a Last-Modified timestamp can't tell that an
+        # inline's child was deleted, so If-Modified-Since alone never gives a 304
+        return get_conditional_response(self.request, etag=validators[0])
+
+    def set_validator_headers(self, response, validators):
+        """Add the ETag and Last-Modified headers to a (200 or 304) response."""
+        if (
+            validators is None
+            or not self.is_conditional_get_enabled()
+            or response.status_code not in (200, 304)
+        ):
+            return response
+
+        etag, last_modified = validators
+        response.headers["ETag"] = etag
+        if last_modified is not None:
+            response.headers["Last-Modified"] = http_date(last_modified)
+
+        # Let the browser keep the page, but check it with the server on each use
+        patch_cache_control(response, private=True, no_cache=True)
+
+        return response
+
+    def get(self, request, *args, **kwargs):
+        """Answer 304 Not Modified, without rendering, if the page hasn't changed."""
+        validators = self.get_validators()
+        response = self.get_not_modified_response(validators)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+
+        return self.set_validator_headers(response, validators)
+
+    def get_update_fields(self, model, changed_data, instance=None):
+        """
+        Return the names of the model's concrete fields among the changed form
+        fields, plus its auto_now fields (which are only updated when listed).
+        Returns an empty list if none of the concrete fields changed.
+
+        If the instance's loaded values were remembered (see
+        remember_loaded_values()), the fields that were changed other than by the
+        form (ie. by the model's clean()) are included too.
+        """
+        concrete_fields = {
+            field.name: field
+            for field in model._meta.concrete_fields
+            if not field.primary_key
+        }
+        update_fields = [name for name in changed_data if name in concrete_fields]
+
+        if instance is not None:
+            for name in get_changed_fields(instance) or []:
+                if name in concrete_fields and name not in update_fields:
+                    update_fields.append(name)
+
+        if update_fields:
+            for name, field in concrete_fields.items():
+                if getattr(field, "auto_now", False) and name not in update_fields:
+                    update_fields.append(name)
+
+        return update_fields
+
+    def save_form(self, form):
+        """
+        Save the form's instance. An existing instance only has its changed fields
+        written (with `save(update_fields=...)`), and isn't written at all if nothing
+        changed. Returns the instance.
+        """
+        if form.instance._state.adding:
+            return form.save()
+
+        instance = form.save(commit=False)
+        update_fields = self.get_update_fields(self.model, form.changed_data, instance)
+        if update_fields:
+            instance.save(update_fields=update_fields)
+
+        # Many-to-many changes are saved separately from the instance's fields
+        m2m_field_names = {field.name for field in self.model._meta.many_to_many}
+        if m2m_field_names.intersection(form.changed_data):
+            form.save_m2m()
+
+        return instance
+
+    def save_formset(self, formset):
+        """
+        Save the formset's changes: delete the deleted children, write only the
+        changed fields of the changed children, and create the new ones. Unchanged
+        children aren't written at all.
+
+        When the formset's `bulk_save` is set (see `can_bulk_save()` in the
+        registration module), changed children are written with one `bulk_update()`
+        per set of changed fields, and new ones with a single `bulk_create()` (unless
+        the form has file or many-to-many fields, which need save()). Otherwise they're
+        saved one at a time.
+        """
+        # This only collects the deleted, changed and new children
+        new_objects = formset.save(commit=False)
+
+        for obj in formset.deleted_objects:
+            formset.delete_existing(obj)
+
+        # Group the changed children by their changed fields
+        bulk_save = getattr(formset, "bulk_save", False)
+        bulk_groups = {}
+        for obj, changed_data in formset.changed_objects:
+            update_fields = self.get_update_fields(formset.model, changed_data, obj)
+            if not update_fields:
+                continue
+
+            # Files are only stored by the FileField's pre_save(), in save()
+            has_files = any(
+                isinstance(formset.model._meta.get_field(name), FileField)
+                for name in update_fields
+            )
+            if bulk_save and not has_files:
+                bulk_groups.setdefault(tuple(update_fields), []).append(obj)
+            else:
+                obj.save(update_fields=update_fields)
+
+        for update_fields, objs in bulk_groups.items():
+            # bulk_update() doesn't set auto_now fields itself
+            for name in update_fields:
+                field = formset.model._meta.get_field(name)
+                if getattr(field, "auto_now", False):
+                    for obj in objs:
+                        field.pre_save(obj, add=False)
+
+            formset.model._default_manager.bulk_update(objs, update_fields)
+
+        new_objects = [obj for obj in new_objects if obj._state.adding]
+        form_model_fields = [
+            field
+            for field in formset.model._meta.get_fields()
+            if field.name in formset.form.base_fields
+        ]
+        if (
+            bulk_save
+            and len(new_objects) > 1
+            and not any(
+                field.many_to_many or isinstance(field, FileField)
+                for field in form_model_fields
+            )
+        ):
+            formset.model._default_manager.bulk_create(new_objects)
+        else:
+            for obj in new_objects:
+                obj.save()
+
+        formset.save_m2m()
+
+    def get_media(self, form, formsets=()):
+        """
+        Return the combined media (CSS/JS) of the form's and formsets' widgets.
+        Combining them means each file is only included once in the page.
+        """
+        media = form.media if form else Media()
+        for formset in formsets:
+            media += formset.media
+
+        return media
+
     def get_form_errors(self, form):
         """
         Compiles all errors from a form into a list of formatted error messages.
@@ -283,12 +914,16 @@ class DjangoClarityModelBaseView:
 
 class DjangoClarityModelCreateView(DjangoClarityModelBaseView, CreateView):
     """
-    Base view for creating a parent model instance (form).
+    Base view for creating a parent model instance (form)
+    and its children model instances (formsets).
     """
 
     template_name = "djangoclarity/base_create_template.html"
     formsets = []
 
+    def has_permission(self):
+        return self.model_admin.has_add_permission(self.request)
+
     def get_context_data(self, **kwargs):
         """
         Adds the formset to the template context.
@@ -296,19 +931,37 @@ class DjangoClarityModelCreateView(DjangoClarityModelBaseView, CreateView):
         """
         context = super().get_context_data(**kwargs)
 
+        # The formsets are bound to the form's (unsaved) instance, which they're
+        # saved with once it has been created.
+        # If this is a POST request, put the POST and FILES data into them.
+        form = context.get("form")
+        context["formsets"] = [
+            formset(
+                data=self.request.POST if self.request.POST else None,
+                files=self.request.FILES if self.request.POST else None,
+                instance=form.instance if form else None,
+            )
+            for formset in self.formsets
+        ]
+        for formset in context["formsets"]:
+            self.use_read_db_for_choices(*formset.forms)
+
+        # Layouts for the formsets
+        context["formset_layouts"] = self.formset_layouts
+
         # Form layout
         context["form_layouts"] = [self.form_layout]
 
+        # Media of the form's and formsets' widgets
+        context["media"] = self.get_media(form, context["formsets"])
+
         # Collect all errors to display at the top
         all_errors = []
-        all_errors.extend(self.get_form_errors(context.get("form")))
+        all_errors.extend(self.get_form_errors(form))
+        for formset in context["formsets"]:
+            all_errors.extend(self.get_formset_errors(formset))
         context["all_errors"] = all_errors
 
-        # Formset model names to let the user know about any child model relationships coming up
-        context["formset_model_names"] = [
-            formset.model._meta.verbose_name for formset in self.formsets
-        ]
-
         # Index URL
         context["index_url"] = reverse(f"{self.namespace}:{self.index_url_name}")
 
@@ -317,6 +970,38 @@ class DjangoClarityModelCreateView(DjangoClarityModelBaseView, CreateView):
 
         return context
 
+    def form_valid(self, form):
+        """
+        Called when the form is valid.
+        Also validates the formsets, and saves the new instance and its children.
+        """
+        # Get the context which includes our formsets
+        context = self.get_context_data(form=form)
+        formsets = context["formsets"]
+
+        # Because form.is_valid() was already called and it passed,
+        # we only need to check the validity of each formset in our formsets.
+        if all(formset.is_valid() for formset in formsets):
+            # Start a transaction to ensure the form and all formsets save together
+            with transaction.atomic():
+                # Save the new instance, which gives the formsets' children their parent
+                self.object = self.save_form(form)
+
+                for formset in formsets:
+                    self.save_formset(formset)
+
+            # Invalidate the cached index pages of the model and its children
+            bump_model_version(self.model)
+            for formset in formsets:
+                bump_model_version(formset.model)
+            self.record_write()
+            self.remove_staged_uploads(form, formsets)
+
+            return HttpResponseRedirect(self.get_success_url())
+        else:
+            # If anything is invalid, re-render with errors
+            return self.render_to_response(context)
+
     def get_success_url(self):
         """
         After successful save, redirect to the update view for the parent model instance.
@@ -333,8 +1018,193 @@ class DjangoClarityModelUpdateView(DjangoClarityModelBaseView, UpdateView):
     """
 
     template_name = "djangoclarity/base_update_template.html"
+    conflict_template_name = "djangoclarity/base_conflict_template.html"
+    version_token_name = "djangoclarity_version"
     formsets = []
 
+    def has_permission(self):
+        """Users with the view permission can see the object, but not save it."""
+        if self.request.method == "POST":
+            return self.model_admin.has_change_permission(self.request)
+
+        return self.model_admin.has_view_permission(self.request)
+
+    def get_object(self, queryset=None):
+        """Return the object, remembering its loaded values (see save_form())."""
+        obj = super().get_object(queryset)
+        remember_loaded_values(obj)
+
+        return obj
+
+    def get_version_field(self):
+        """Return the model's ModelAdmin.version_field, or None."""
+        if not self.model_admin.version_field:
+            return None
+
+        return self.model._meta.get_field(self.model_admin.version_field)
+
+    def get_version_token(self):
+        """
+        Return the version token that the form is rendered with: the object's
+        current version, or the submitted token if the form is being re-rendered
+        with errors (so that a conflict is still caught when it's resubmitted).
+        """
+        version_field = self.get_version_field()
+        if version_field is None:
+            return None
+
+        if self.request.method == "POST":
+            return self.request.POST.get(self.version_token_name, "")
+
+        version = version_field.value_from_object(self.object)
+        if version is None:
+            return ""
+
+        return version.isoformat() if hasattr(version, "isoformat") else str(version)
+
+    def claim_version(self, token):
+        """
+        Check that the object is still at the version of the form's token, and move
+        it to a new version, with a single conditional UPDATE (so no row lock is
+        held while the form is being filled in).
+        Returns the new version, or None if the object was changed in the meantime.
+        An object whose (nullable) version field is NULL is at version 0, which an
+        empty token stands for.
+        """
+        version_field = self.get_version_field()
+        try:
+            version = version_field.to_python(token or None)
+        except ValidationError:
+            return None
+
+        if version is not None:
+            lookup = {version_field.attname: version}
+        elif version_field.null:
+            lookup = {f"{version_field.attname}__isnull": True}
+        else:
+            return None
+
+        if version_field.get_internal_type() == "DateTimeField":
+            new_version = timezone.now()
+        else:
+            new_version = (version or 0) + 1
+
+        updated = self.model._default_manager.filter(
+            pk=self.object.pk, **lookup
+        ).update(**{version_field.attname: new_version})
+
+        return new_version if updated else None
+
+    def render_conflict(self):
+        """Return the page that tells the user the object was changed by someone else."""
+        context = {
+            "base_template": self.base_template,
+            "object": self.object,
+            "model_verbose_name": self.model._meta.verbose_name,
+            "index_url": reverse(f"{self.namespace}:{self.index_url_name}"),
+            "update_url": reverse(
+                f"{self.namespace}:{self.update_url_name}",
+                kwargs={"pk": self.object.pk},
+            ),
+        }
+
+        return TemplateResponse(
+            self.request, self.conflict_template_name, context, status=409
+        )
+
+    def get_choice_models(self):
+        """
+        Return the models whose objects are shown as choices in the form and the
+        formsets (ie. ForeignKey selects), so that the page changes with them.
+        """
+        choice_models = []
+        for form_class in [self.form_class] + [fs.form for fs in self.formsets]:
+            for field in form_class.base_fields.values():
+                queryset = getattr(field, "queryset", None)
+                if queryset is not None and queryset.model not in choice_models:
+                    choice_models.append(queryset.model)
+
+        return choice_models
+
+    def get_validators(self):
+        """
+        Return the page's validators, from a single query of the object's
+        ModelAdmin.updated_at_field and version_field (whose token the form is
+        rendered with), and the latest `updated_at_field` and number of the children
+        of each inline. Models without the field (and the models shown as choices)
+        are represented by their version instead (see the cache module), which
+        changes with any of their instances.
+        """
+        pk = self.kwargs.get(self.pk_url_kwarg)
+        if pk is None:
+            return None
+
+        annotations = {}
+        version_models = self.get_choice_models()
+
+        updated_at_field = _get_timestamp_field(
+            self.model, self.model_admin.updated_at_field
+        )
+        if updated_at_field is not None:
+            annotations["djangoclarity_updated_at"] = F(updated_at_field.name)
+        elif self.model not in version_models:
+            version_models.append(self.model)
+
+        # A save without any changes only moves the object to a new version
+        version_field = self.get_version_field()
+        if version_field is not None:
+            annotations["djangoclarity_version"] = F(version_field.name)
+
+        inlines = self.model_admin.inlines
+        for i, formset in enumerate(self.formsets):
+            inline = inlines[i] if i < len(inlines) else None
+            child_updated_at_field = _get_timestamp_field(
+                formset.model, getattr(inline, "updated_at_field", "updated_at")
+            )
+            if child_updated_at_field is None:
+                if formset.model not in version_models:
+                    version_models.append(formset.model)
+                continue
+
+            children = (
+                formset.model._default_manager.filter(
+                    **{formset.fk.name: OuterRef("pk")}
+                )
+                .order_by()
+                .values(formset.fk.name)
+            )
+            annotations[f"djangoclarity_formset_{i}_updated_at"] = Subquery(
+                children.annotate(value=Max(child_updated_at_field.name)).values(
+                    "value"
+                )
+            )
+            annotations[f"djangoclarity_formset_{i}_count"] = Subquery(
+                children.annotate(value=Count("pk")).values("value")
+            )
+
+        row = (
+            self.get_queryset()
+            .filter(pk=pk)
+            .annotate(**annotations)
+            .values_list("pk", *annotations)
+            .first()
+        )
+        if row is None:
+            # Let the view raise its 404
+            return None
+
+        versions = get_model_versions(*version_models) if version_models else []
+        etag = self.make_etag(row, versions)
+
+        timestamps = [
+            row[i + 1]
+            for i, name in enumerate(annotations)
+            if name.endswith("_updated_at") and row[i + 1] is not None
+        ]
+        last_modified = int(max(timestamps).timestamp()) if timestamps else None
+
+        return etag, last_modified
+
     def get_context_data(self, **kwargs):
         """
         Adds the formset to the template context.
@@ -351,9 +1221,16 @@ class DjangoClarityModelUpdateView(DjangoClarityModelBaseView, UpdateView):
                 data=self.request.POST if self.request.POST else None,
                 files=self.request.FILES if self.request.POST else None,
                 instance=self.object,
+                queryset=self.using_read_db(formset.model._default_manager.all()),
             )
             for formset in self.formsets
         ]
+        if self.request.POST:
+            for formset in context["formsets"]:
+                for form in formset.initial_forms:
+                    remember_loaded_values(form.instance)
+        for formset in context["formsets"]:
+            self.use_read_db_for_choices(*formset.forms)
 
         # Layouts for the formsets
         context["formset_layouts"] = self.formset_layouts
@@ -361,6 +1238,9 @@ class DjangoClarityModelUpdateView(DjangoClarityModelBaseView, UpdateView):
         # Form layout
         context["form_layouts"] = [self.form_layout]
 
+        # Media of the form's and formsets' widgets
+        context["media"] = self.get_media(context.get("form"), context["formsets"])
+
         # Collect all errors to display at the top
         all_errors = []
         all_errors.extend(self.get_form_errors(context.get("form")))
@@ -379,7 +1259,14 @@ class DjangoClarityModelUpdateView(DjangoClarityModelBaseView, UpdateView):
         # Add model verbose name for template use
         context["model_verbose_name"] = self.model._meta.verbose_name
 
-        return context
+        # Version token for the optimistic concurrency check
+        context["version_token"] = self.get_version_token()
+        context["version_token_name"] = self.version_token_name
+
+        # Permissions for the page's buttons
+        context.update(self.get_permissions_context())
+
+        return context
 
     def form_valid(self, form):
         """
@@ -395,15 +1282,39 @@ class DjangoClarityModelUpdateView(DjangoClarityModelBaseView, UpdateView):
         if all(formset.is_valid() for formset in formsets):
             # Start a transaction to ensure the form and all formsets save together
             with transaction.atomic():
-                # Save the form instance to the database
-                form.save()
+                # Check that nobody else saved the object since the form was opened
+                version_field = self.get_version_field()
+                if version_field is not None:
+                    new_version = self.claim_version(
+                        self.request.POST.get(self.version_token_name, "")
+                    )
+                    if new_version is None:
+                        return self.render_conflict()
+
+                    # The claim already wrote the new version, so it doesn't make
+                    # the object changed (see get_update_fields())
+                    setattr(form.instance, version_field.attname, new_version)
+                    getattr(form.instance, LOADED_VALUES_ATTRIBUTE)[
+                        version_field.attname
+                    ] = version_field.value_to_string(form.instance)
+
+                # Save the form instance's changes to the database
+                self.object = self.save_form(form)
 
-                # Go through each formset and save its instances to the database.
+                # Go through each formset and save its changes to the database.
                 # This will also take care of deleting instances from the formsets.
                 for formset in formsets:
-                    formset.save()
+                    self.save_formset(formset)
 
-            return super().form_valid(form)
+            # Invalidate the cached index pages of the model and its children
+            bump_model_version(self.model)
+            for formset in formsets:
+                bump_model_version(formset.model)
+            self.record_write()
+            self.remove_staged_uploads(form, formsets)
+
+            # The form was already saved, so don't let ModelFormMixin save it again
+            return HttpResponseRedirect(self.get_success_url())
         else:
             # If anything is invalid, re-render with errors
             return self.render_to_response(context)
@@ -422,12 +1333,317 @@ class DjangoClarityModelListView(DjangoClarityModelBaseView, ListView):
     items_per_page = 10
     order_by_fields = ("id",)
     paginate_by = 10
+    sort_param = "o"
+    # Maximum number of related objects listed in a filter's facets
+    facet_max_options = 50
 
-    def get_queryset(self):
+    # Attributes to be sent into the .as_view() method
+    sortable_fields = None
+    list_editable_formset = None
+
+    def get_list_fetch(self):
+        """
+        Return how the index rows are fetched (see ModelAdmin.list_fetch). The
+        editable grid needs model instances for its forms.
+        """
+        if self.is_list_editable():
+            return "instances"
+
+        return self.model_admin.list_fetch
+
+    def is_list_editable(self):
+        """
+        Return whether the index table is shown as an editable grid (see
+        ModelAdmin.list_editable). It isn't available in virtual scrolling mode.
+        """
+        return (
+            self.list_editable_formset is not None
+            and not self.model_admin.list_virtual_scroll
+            and self.model_admin.has_change_permission(self.request)
+        )
+
+    def get_list_editable_formset(self, data=None):
+        """
+        Return the editable grid's model formset. Unbound, it's over the current
+        page's objects. Bound, it's over the (searched) objects whose pks were
+        submitted, so rows that moved to another page since are still saved.
+        """
+        if data is None:
+            formset = self.list_editable_formset(
+                queryset=self._get_current_page_objects()
+            )
+            self.use_read_db_for_choices(*formset.forms)
+
+            return formset
+
+        prefix = self.list_editable_formset.get_default_prefix()
+        pk_field = self.model._meta.pk
+        pks = []
+        for key, value in data.items():
+            if key.startswith(f"{prefix}-") and key.endswith(f"-{pk_field.name}"):
+                try:
+                    pks.append(pk_field.to_python(value))
+                except ValidationError:
+                    continue
+
+        formset = self.list_editable_formset(
+            data=data,
+            files=self.request.FILES,
+            queryset=self.get_queryset().filter(pk__in=pks),
+        )
+        for form in formset.initial_forms:
+            remember_loaded_values(form.instance)
+
+        return formset
+
+    def has_permission(self):
+        """Saving the editable grid needs the change permission."""
+        if self.request.method == "POST":
+            return self.model_admin.has_change_permission(self.request)
+
+        return self.model_admin.has_view_permission(self.request)
+
+    def post(self, request, *args, **kwargs):
+        """
+        Save the editable grid. All of its rows are validated, and the changed ones
+        are written together in one transaction (see `save_formset()`).
+        """
+        if not self.is_list_editable():
+            return self.http_method_not_allowed(request, *args, **kwargs)
+
+        formset = self.get_list_editable_formset(data=request.POST)
+        if formset.is_valid():
+            with transaction.atomic():
+                self.save_formset(formset)
+
+            # Invalidate the model's cached index pages
+            bump_model_version(self.model)
+            self.record_write()
+
+            return HttpResponseRedirect(request.get_full_path())
+
+        # Re-render the page with the grid's errors
+        self.object_list = self.get_queryset()
+        context = self.get_context_data(list_editable_formset=formset)
+
+        return self.render_to_response(context)
+
+    def get_sortable_fields(self):
+        """
+        Return the field names that the index can be sorted by.
+        These are worked out at registration (see `get_sortable_fields()` in the
+        registration module), which only allows index-backed fields by default.
+        Otherwise, any concrete, non-null, non-relation layout field is sortable.
+        """
+        if self.sortable_fields is not None:
+            return self.sortable_fields
+
+        sortable_fields = []
+        for field_name in self._get_field_names():
+            try:
+                field = self.model._meta.get_field(field_name)
+            except FieldDoesNotExist:
+                continue
+
+            if field.concrete and not field.is_relation and not field.null:
+                sortable_fields.append(field_name)
+
+        return sortable_fields
+
+    def get_ordering(self):
+        """
+        Return the ordering for the queryset, based on the sort parameter if provided.
+        A primary key tiebreaker is appended so that the ordering is always total.
         """
-        Filter the queryset based on the search parameter if provided.
+        sort = self.request.GET.get(self.sort_param, "")
+        field_name = sort.removeprefix("-")
+
+        if field_name and field_name in self.get_sortable_fields():
+            tiebreaker = "-pk" if sort.startswith("-") else "pk"
+            return (sort, tiebreaker)
+
+        ordering = tuple(self.order_by_fields)
+        pk_names = ("pk", self.model._meta.pk.name)
+        if not any(field.removeprefix("-") in pk_names for field in ordering):
+            ordering += ("pk",)
+
+        return ordering
+
+    def get_list_filters(self):
+        """
+        Return a list of the ModelAdmin.list_filter fields, as (field, kind) tuples
+        where kind is "choice", "bool", "fk" or "date". Fields of other kinds are
+        skipped.
+        """
+        list_filters = []
+        for field_name in self.model_admin.list_filter:
+            field = self.model._meta.get_field(field_name)
+            internal_type = field.get_internal_type()
+
+            if field.choices:
+                kind = "choice"
+            elif internal_type in ("BooleanField", "NullBooleanField"):
+                kind = "bool"
+            elif field.many_to_one or field.one_to_one:
+                kind = "fk"
+            elif internal_type in ("DateField", "DateTimeField"):
+                kind = "date"
+            else:
+                continue
+
+            list_filters.append((field, kind))
+
+        return list_filters
+
+    def get_date_filter_ranges(self, field):
+        """
+        Return a dict of the date filter's options to their (label, start, end)
+        half-open ranges, in the current time zone.
+        """
+        today = timezone.localdate()
+        month_start = today.replace(day=1)
+        next_month = (month_start + datetime.timedelta(days=32)).replace(day=1)
+        year_start = today.replace(month=1, day=1)
+
+        ranges = {
+            "today": ("Today", today, today + datetime.timedelta(days=1)),
+            "7d": (
+                "Past 7 days",
+                today - datetime.timedelta(days=6),
+                today + datetime.timedelta(days=1),
+            ),
+            "month": ("This month", month_start, next_month),
+            "year": ("This year", year_start, year_start.replace(year=today.year + 1)),
+        }
+
+        return {
+            key: (
+                label,
+                self._get_date_bound(field, start),
+                self._get_date_bound(field, end),
+            )
+            for key, (label, start, end) in ranges.items()
+        }
+
+    def _get_date_bound(self, field, date):
+        """
+        Return a date as a bound of a range of the field's values: DateTimeFields
+        are compared with the current time zone's midnight.
+        """
+        if field.get_internal_type() != "DateTimeField":
+            return date
+
+        value = datetime.datetime.combine(date, datetime.time.min)
+        return timezone.make_aware(value) if settings.USE_TZ else value
+
+    def get_date_hierarchy_field(self):
+        """Return the ModelAdmin.date_hierarchy field, or None."""
+        if not self.model_admin.date_hierarchy:
+            return None
+
+        return self.model._meta.get_field(self.model_admin.date_hierarchy)
+
+    def get_date_hierarchy_selection(self):
+        """
+        Return the (year, month, day) that the date hierarchy is drilled down to,
+        from the request's `<field>__year`, `__month` and `__day` parameters. Levels
+        that aren't selected (or aren't valid) are None.
         """
-        queryset = super().get_queryset().order_by(*self.order_by_fields)
+        field = self.get_date_hierarchy_field()
+        selection = []
+        for level in ("year", "month", "day"):
+            try:
+                value = int(self.request.GET.get(f"{field.name}__{level}", ""))
+            except ValueError:
+                break
+
+            selection.append(value)
+
+        # Drop any levels that don't make a valid date range, ie. a day that
+        # doesn't exist, or a year whose end is past date.max
+        while selection:
+            try:
+                self._get_date_range(field, *selection)
+                break
+            except (ValueError, OverflowError):
+                selection.pop()
+
+        return tuple(selection) + (None,) * (3 - len(selection))
+
+    def _get_date_range(self, field, year, month=None, day=None):
+        """
+        Return the half-open (start, end) range of the field's values in a year,
+        month or day. Raises ValueError (or OverflowError) if it isn't a valid date,
+        or if the range's end is past date.max.
+        """
+        if not datetime.MINYEAR <= year < datetime.date.max.year:
+            raise ValueError(f"Year {year} is out of range")
+
+        if month is None:
+            start = datetime.date(year, 1, 1)
+            end = datetime.date(year + 1, 1, 1)
+        elif day is None:
+            start = datetime.date(year, month, 1)
+            end = datetime.date(year + month // 12, month % 12 + 1, 1)
+        else:
+            start = datetime.date(year, month, day)
+            end = start + datetime.timedelta(days=1)
+
+        return self._get_date_bound(field, start), self._get_date_bound(field, end)
+
+    def get_date_hierarchy_range(self):
+        """
+        Return the half-open (start, end) range of the date hierarchy's selection,
+        or None if nothing is selected. Filtering with a range rather than with
+        `__year`/`__month` lookups lets the database use the field's index.
+        """
+        year, month, day = self.get_date_hierarchy_selection()
+        if year is None:
+            return None
+
+        return self._get_date_range(self.get_date_hierarchy_field(), year, month, day)
+
+    def get_filter_query(self, field, kind, value):
+        """
+        Return the Q object for a filter's parameter value, or None if the value
+        isn't valid (in which case the filter is ignored).
+        """
+        if value == "null" and field.null:
+            return Q(**{f"{field.attname}__isnull": True})
+
+        if kind == "date":
+            date_range = self.get_date_filter_ranges(field).get(value)
+            if date_range is None:
+                return None
+
+            _, start, end = date_range
+            return Q(**{f"{field.name}__gte": start, f"{field.name}__lt": end})
+
+        if kind == "bool":
+            if value not in ("1", "0"):
+                return None
+
+            return Q(**{field.name: value == "1"})
+
+        if kind == "choice":
+            for choice_value, _ in field.flatchoices:
+                if str(choice_value) == value:
+                    return Q(**{field.name: choice_value})
+
+            return None
+
+        try:
+            return Q(**{field.attname: field.target_field.to_python(value)})
+        except ValidationError:
+            return None
+
+    def get_filtered_queryset(self, exclude_filter=None):
+        """
+        Return the queryset, searched and filtered by the request's parameters.
+        The filter named `exclude_filter` isn't applied, which is how its facet
+        counts are found.
+        """
+        queryset = super().get_queryset()
         search_term = self.request.GET.get("q", "")
 
         if search_term:
@@ -451,8 +1667,199 @@ class DjangoClarityModelListView(DjangoClarityModelBaseView, ListView):
             # Apply the filter
             queryset = queryset.filter(query)
 
+        # Apply the list filters
+        for field, kind in self.get_list_filters():
+            value = self.request.GET.get(field.name)
+            if not value or field.name == exclude_filter:
+                continue
+
+            query = self.get_filter_query(field, kind, value)
+            if query is not None:
+                queryset = queryset.filter(query)
+
+        # Apply the date hierarchy's selection
+        if self.get_date_hierarchy_field() is not None:
+            date_range = self.get_date_hierarchy_range()
+            if date_range is not None:
+                field_name = self.get_date_hierarchy_field().name
+                queryset = queryset.filter(
+                    **{
+                        f"{field_name}__gte": date_range[0],
+                        f"{field_name}__lt": date_range[1],
+                    }
+                )
+
         return queryset
 
+    def get_queryset(self):
+        """
+        Return the searched and filtered queryset, fetching only what the table needs.
+        """
+        queryset = self.get_filtered_queryset()
+
+        # Compute the ModelAdmin.list_extra_columns in the same query
+        extra_column_annotations = self.get_extra_column_annotations()
+
+        # In values mode, fetch tuples of the table's columns instead of instances
+        if self.get_list_fetch() == "values":
+            return queryset.annotate(
+                **self.get_values_label_annotations(), **extra_column_annotations
+            ).values_list(*self.get_values_columns())
+
+        # Fetch the related objects shown in the table in the same query, and only
+        # load the columns that the table needs
+        select_related_fields = self.get_select_related_fields()
+        if select_related_fields:
+            queryset = queryset.select_related(*select_related_fields)
+
+        return queryset.only(*self.get_only_fields()).annotate(
+            **extra_column_annotations
+        )
+
+    def get_extra_column_annotations(self):
+        """
+        Return a dict of the annotations of the ModelAdmin.list_extra_columns (see
+        the columns module).
+        """
+        return {
+            name: column.get_expression(self.model)
+            for name, column in self.model_admin.list_extra_columns.items()
+        }
+
+    def _get_values_fields(self):
+        """
+        Return the layout's model fields that are fetched in values mode.
+        """
+        values_fields = []
+        for field_name in self._get_field_names():
+            try:
+                field = self.model._meta.get_field(field_name)
+            except FieldDoesNotExist:
+                continue
+
+            if field.concrete and not field.many_to_many:
+                values_fields.append(field)
+
+        return values_fields
+
+    def get_values_label_annotations(self):
+        """
+        Return a dict of annotations for the labels of the layout's related objects,
+        in values mode. Only relations with fields listed in
+        ModelAdmin.list_select_related_fields can be annotated. The labels of the
+        others are looked up with one query per relation for the whole page.
+        """
+        related_only_fields = self.model_admin.list_select_related_fields
+
+        annotations = {}
+        for field in self._get_values_fields():
+            if not field.is_relation or field.name not in related_only_fields:
+                continue
+
+            label_fields = [
+                F(f"{field.name}__{related_field_name}")
+                for related_field_name in related_only_fields[field.name]
+            ]
+            if len(label_fields) == 1:
+                annotations[f"{field.name}__label"] = label_fields[0]
+            else:
+                # Separate the fields with spaces
+                parts = []
+                for label_field in label_fields:
+                    if parts:
+                        parts.append(Value(" "))
+                    parts.append(label_field)
+                annotations[f"{field.name}__label"] = Concat(
+                    *parts, output_field=CharField()
+                )
+
+        return annotations
+
+    def get_values_columns(self):
+        """
+        Return the column names fetched by `values_list()` in values mode: the pk,
+        the layout's fields (ForeignKeys as their ID), any fields declared by
+        `_get_extra_item_fields()`, the related objects' label annotations and the
+        ModelAdmin.list_extra_columns.
+        """
+        columns = [self.model._meta.pk.attname]
+        columns.extend(field.attname for field in self._get_values_fields())
+
+        # The ordering's fields are needed for the data endpoint's cursors
+        for order_field in self.get_ordering():
+            field_name = order_field.removeprefix("-")
+            if field_name != "pk":
+                columns.append(self.model._meta.get_field(field_name).attname)
+
+        columns.extend(self._get_extra_item_fields())
+        columns.extend(self.get_values_label_annotations())
+        columns.extend(self.model_admin.list_extra_columns)
+
+        # Remove duplicates, keeping the order
+        return list(dict.fromkeys(columns))
+
+    def get_select_related_fields(self):
+        """
+        Return the names of the layout's forward ForeignKey/OneToOne fields, whose
+        related objects are shown (as strings) in the index table.
+        """
+        select_related_fields = []
+        for field_name in self._get_field_names():
+            try:
+                field = self.model._meta.get_field(field_name)
+            except FieldDoesNotExist:
+                continue
+
+            if field.concrete and (field.many_to_one or field.one_to_one):
+                select_related_fields.append(field_name)
+
+        return select_related_fields
+
+    def get_only_fields(self):
+        """
+        Return the field names to load for the index queryset, so that wide columns
+        that aren't shown in the table (large text, JSON, binary...) aren't fetched.
+
+        This is the pk, the layout's model fields, and any fields declared by
+        `_get_extra_item_fields()`. For related objects, only the fields listed in
+        ModelAdmin.list_select_related_fields (the ones their `__str__` needs)
+        are loaded, otherwise the whole related row is.
+        """
+        related_only_fields = self.model_admin.list_select_related_fields
+        select_related_fields = self.get_select_related_fields()
+
+        only_fields = [self.model._meta.pk.name]
+        for field_name in self._get_field_names():
+            try:
+                field = self.model._meta.get_field(field_name)
+            except FieldDoesNotExist:
+                continue
+
+            if not field.concrete or field.many_to_many:
+                continue
+
+            if (
+                field_name in select_related_fields
+                and field_name in related_only_fields
+            ):
+                only_fields.extend(
+                    f"{field_name}__{related_field_name}"
+                    for related_field_name in related_only_fields[field_name]
+                )
+            else:
+                only_fields.append(field_name)
+
+        only_fields.extend(self._get_extra_item_fields())
+
+        return only_fields
+
+    def get_paginate_by(self, queryset):
+        """Don't paginate (nor count) the queryset in virtual scrolling mode."""
+        if self.model_admin.list_virtual_scroll:
+            return None
+
+        return super().get_paginate_by(queryset)
+
     def _get_pagination_data(self):
         """
         Helper method to get pagination data.
@@ -467,11 +1874,403 @@ class DjangoClarityModelListView(DjangoClarityModelBaseView, ListView):
         if page < 1:
             page = 1
 
-        # Use the cached queryset from object_list for total
-        total_items = self.object_list.count()
+        total_items = self.get_count()
 
         return page, total_items
 
+    def get_cache_models(self):
+        """
+        Return the models whose changes invalidate this index's cached data: the
+        model itself and the related models that are shown in the table.
+        """
+        models = [self.model]
+        for field_name in self.get_select_related_fields():
+            related_model = self.model._meta.get_field(field_name).related_model
+            if related_model not in models:
+                models.append(related_model)
+
+        # The filters' related objects are shown as facets
+        for field, kind in self.get_list_filters():
+            if kind == "fk" and field.related_model not in models:
+                models.append(field.related_model)
+
+        # The extra columns are computed from related objects
+        for column in self.model_admin.list_extra_columns.values():
+            related_model = column.get_related_model(self.model)
+            if related_model not in models:
+                models.append(related_model)
+
+        return models
+
+    def get_facet_counts(self, field, kind):
+        """
+        Return a list of (parameter value, label, count) options for a filter,
+        counted over the queryset with every other filter applied. Choice, boolean
+        and related filters are counted with a single grouped query, and date
+        filters with a single query of conditional counts.
+        """
+        queryset = self.get_filtered_queryset(exclude_filter=field.name).order_by()
+
+        if kind == "date":
+            date_ranges = self.get_date_filter_ranges(field)
+            counts = queryset.aggregate(
+                **{
+                    key: Count(
+                        "pk",
+                        filter=Q(
+                            **{f"{field.name}__gte": start, f"{field.name}__lt": end}
+                        ),
+                    )
+                    for key, (_, start, end) in date_ranges.items()
+                }
+            )
+            return [
+                (key, label, counts[key]) for key, (label, _, _) in date_ranges.items()
+            ]
+
+        counts = dict(queryset.values_list(field.attname).annotate(count=Count("pk")))
+
+        options = []
+        if kind == "choice":
+            for value, label in field.flatchoices:
+                if value in counts:
+                    options.append((str(value), str(label), counts[value]))
+        elif kind == "bool":
+            for value, param, label in ((True, "1", "Yes"), (False, "0", "No")):
+                if value in counts:
+                    options.append((param, label, counts[value]))
+        else:
+            # The most common related objects, labelled with one query
+            pks = sorted(
+                (pk for pk in counts if pk is not None),
+                key=lambda pk: -counts[pk],
+            )[: self.facet_max_options]
+            related_objects = self.using_read_db(
+                field.related_model._default_manager.all()
+            ).in_bulk(pks)
+            options = [
+                (str(pk), str(related_objects[pk]), counts[pk])
+                for pk in pks
+                if pk in related_objects
+            ]
+
+        if None in counts:
+            options.append(("null", "(None)", counts[None]))
+
+        return options
+
+    def get_facets(self):
+        """
+        Return the list filters for the sidebar, each with its options' counts and
+        links. The counts are cached for ModelAdmin.list_filter_cache_timeout.
+        """
+        list_filters = self.get_list_filters()
+        if not list_filters:
+            return []
+
+        # The counts don't depend on the page nor the ordering
+        timeout = self.model_admin.list_filter_cache_timeout
+        cache_key = None
+        all_counts = None
+        if timeout is not None:
+            cache_key = self.get_cache_key(
+                "facets",
+                ignored_params=("page", self.sort_param, "cursor", "offset", "limit"),
+            )
+            all_counts = get_cache().get(cache_key)
+
+        if all_counts is None:
+            all_counts = [
+                self.get_facet_counts(field, kind) for field, kind in list_filters
+            ]
+            if cache_key is not None:
+                get_cache().set(cache_key, all_counts, timeout)
+
+        facets = []
+        for (field, kind), counts in zip(list_filters, all_counts):
+            selected = self.request.GET.get(field.name, "")
+            facets.append(
+                {
+                    "name": field.name,
+                    "title": field.verbose_name,
+                    "clear_url": self._get_filter_url(field.name, None),
+                    "active": bool(selected),
+                    "options": [
+                        {
+                            "label": label,
+                            "count": count,
+                            "url": self._get_filter_url(field.name, value),
+                            "selected": value == selected,
+                        }
+                        for value, label, count in counts
+                    ],
+                }
+            )
+
+        return facets
+
+    def get_date_hierarchy_dates(self):
+        """
+        Return the dates of the date hierarchy's next level (the years, the months of
+        the selected year, or the days of the selected month) that have objects,
+        from a single dates() (or datetimes()) query over the filtered queryset.
+        They're cached like the filters' counts.
+        """
+        field = self.get_date_hierarchy_field()
+        year, month, day = self.get_date_hierarchy_selection()
+        if day is not None:
+            return []
+
+        kind = "year" if year is None else "month" if month is None else "day"
+
+        timeout = self.model_admin.list_filter_cache_timeout
+        cache_key = None
+        if timeout is not None:
+            cache_key = self.get_cache_key(
+                "date_hierarchy",
+                ignored_params=("page", self.sort_param, "cursor", "offset", "limit"),
+            )
+            dates = get_cache().get(cache_key)
+            if dates is not None:
+                return dates
+
+        queryset = self.get_filtered_queryset().order_by()
+        if field.get_internal_type() == "DateTimeField":
+            # Truncated in the current time zone, like the range filters
+            dates = [
+                (
+                    timezone.localtime(value) if timezone.is_aware(value) else value
+                ).date()
+                for value in queryset.datetimes(field.name, kind)
+            ]
+        else:
+            dates = list(queryset.dates(field.name, kind))
+
+        if cache_key is not None:
+            get_cache().set(cache_key, dates, timeout)
+
+        return dates
+
+    def get_date_hierarchy(self):
+        """
+        Return the date hierarchy's links: the links back up to the selected levels,
+        and the links down to the next level's dates.
+        """
+        field = self.get_date_hierarchy_field()
+        if field is None:
+            return None
+
+        year, month, day = self.get_date_hierarchy_selection()
+
+        def get_url(*selection):
+            params = self.request.GET.copy()
+            params.pop("page", None)
+            for i, level in enumerate(("year", "month", "day")):
+                if i < len(selection):
+                    params[f"{field.name}__{level}"] = str(selection[i])
+                else:
+                    params.pop(f"{field.name}__{level}", None)
+
+            return f"?{params.urlencode()}"
+
+        # The selected levels, ie. "All dates" > 2024 > March
+        breadcrumbs = [{"label": "All dates", "url": get_url()}]
+        if year is not None:
+            breadcrumbs.append({"label": str(year), "url": get_url(year)})
+        if month is not None:
+            breadcrumbs.append(
+                {
+                    "label": datetime.date(year, month, 1).strftime("%B"),
+                    "url": get_url(year, month),
+                }
+            )
+        if day is not None:
+            breadcrumbs.append(
+                {
+                    "label": f"{datetime.date(year, month, day):%B} {day}",
+                    "url": get_url(year, month, day),
+                }
+            )
+
+        # The next level's dates
+        links = []
+        for date in self.get_date_hierarchy_dates():
+            if year is None:
+                links.append({"label": str(date.year), "url": get_url(date.year)})
+            elif month is None:
+                links.append(
+                    {"label": date.strftime("%B"), "url": get_url(year, date.month)}
+                )
+            else:
+                links.append(
+                    {
+                        "label": f"{date:%B} {date.day}",
+                        "url": get_url(year, month, date.day),
+                    }
+                )
+
+        return {
+            "title": field.verbose_name,
+            "params": {
+                f"{field.name}__{level}": value
+                for level, value in zip(("year", "month", "day"), (year, month, day))
+                if value is not None
+            },
+            "breadcrumbs": breadcrumbs,
+            "links": links,
+        }
+
+    def _get_filter_url(self, name, value):
+        """Return the query string of the current page with a filter set (or removed)."""
+        params = self.request.GET.copy()
+        params.pop("page", None)
+        if value is None:
+            params.pop(name, None)
+        else:
+            params[name] = value
+
+        return f"?{params.urlencode()}"
+
+    def get_cache_permissions_key(self):
+        """
+        Return a key for the user's permissions that affect the index's data, so
+        that users who see different data never share a cache entry.
+        """
+        return "".join(
+            "1" if has_permission else "0"
+            for has_permission in self.get_permissions_context().values()
+        )
+
+    def get_cache_date_key(self):
+        """
+        Return the current date (in the current time zone) if the page depends on
+        it, or None. The date filters' ranges ("today", "7d", ...) are relative to
+        it, and the date hierarchy's ranges are in the current time zone, so their
+        cached pages (and ETags) mustn't outlive the day.
+        """
+        if self.get_date_hierarchy_field() is None and not any(
+            kind == "date" for _, kind in self.get_list_filters()
+        ):
+            return None
+
+        return (
+            timezone.get_current_timezone_name(),
+            timezone.localdate().isoformat(),
+        )
+
+    def get_cache_key(self, prefix, ignored_params=()):
+        """
+        Return the cache key for the current request's GET parameters (except for
+        any ignored ones), the user's permissions, the models' versions and the
+        current date if the page depends on it.
+        """
+        params = sorted(
+            (key, tuple(values))
+            for key, values in self.request.GET.lists()
+            if key not in ignored_params
+        )
+
+        return make_cache_key(
+            prefix,
+            self.get_cache_models(),
+            params,
+            self.get_cache_permissions_key(),
+            self.get_cache_date_key(),
+        )
+
+    def get_validators(self):
+        """
+        Return the page's ETag, from the versions of the models in
+        `get_cache_models()` (see the cache module), the GET parameters, the
+        user's permissions and the current date if the page depends on it (see
+        `get_cache_date_key()`). This doesn't query the database.
+        """
+        return self.make_etag(self.get_cache_key("etag")), None
+
+    def get_count(self):
+        """
+        Return the number of objects in the (searched) queryset. The count is
+        cached if ModelAdmin.list_cache_timeout is set.
+        """
+        if hasattr(self, "_count"):
+            return self._count
+
+        timeout = self.model_admin.list_cache_timeout
+        if timeout is None:
+            self._count = self.object_list.count()
+            return self._count
+
+        # The count doesn't depend on the page nor the ordering
+        cache_key = self.get_cache_key(
+            "count",
+            ignored_params=("page", self.sort_param, "cursor", "offset", "limit"),
+        )
+        self._count = get_cache().get(cache_key)
+        if self._count is None:
+            self._count = self.object_list.count()
+            get_cache().set(cache_key, self._count, timeout)
+
+        return self._count
+
+    def get_aggregates(self):
+        """
+        Return a dict of the ModelAdmin.list_aggregates columns to their aggregate
+        over the searched and filtered queryset (not just the current page), from a
+        single aggregate() query. They're cached like the count, if
+        ModelAdmin.list_cache_timeout is set.
+        """
+        list_aggregates = self.model_admin.list_aggregates
+        if not list_aggregates:
+            return {}
+
+        # The aggregates don't depend on the page nor the ordering
+        timeout = self.model_admin.list_cache_timeout
+        cache_key = None
+        if timeout is not None:
+            cache_key = self.get_cache_key(
+                "aggregates",
+                ignored_params=("page", self.sort_param, "cursor", "offset", "limit"),
+            )
+            aggregates = get_cache().get(cache_key)
+            if aggregates is not None:
+                return aggregates
+
+        # Extra columns can be aggregated too
+        queryset = self.get_filtered_queryset().order_by()
+        extra_column_annotations = {
+            name: expression
+            for name, expression in self.get_extra_column_annotations().items()
+            if name in list_aggregates
+        }
+        if extra_column_annotations:
+            queryset = queryset.annotate(**extra_column_annotations)
+
+        values = queryset.aggregate(
+            **{
+                f"djangoclarity_{name}": AGGREGATE_FUNCTIONS[function](name)
+                for name, function in list_aggregates.items()
+            }
+        )
+
+        aggregates = {}
+        for name, function in list_aggregates.items():
+            value = values[f"djangoclarity_{name}"]
+            if function == "avg" and value is not None:
+                value = round(value, 2)
+            aggregates[name] = value
+
+        if cache_key is not None:
+            get_cache().set(cache_key, aggregates, timeout)
+
+        return aggregates
+
+    def get_paginator(self, queryset, per_page, **kwargs):
+        """Use the (possibly cached) count, rather than counting the queryset again."""
+        paginator = super().get_paginator(queryset, per_page, **kwargs)
+        paginator.count = self.get_count()
+
+        return paginator
+
     def _get_paginated_queryset(self, page, total_items):
         """
         Helper method to get the queryset for the current page.
@@ -501,6 +2300,34 @@ class DjangoClarityModelListView(DjangoClarityModelBaseView, ListView):
         """Base method to return a dictionary of extra items, meant to be overridden."""
         return {}
 
+    def _get_extra_items_for_page(self, objects):
+        """
+        Base method to return a dictionary of each of the page's objects' pk to its
+        dictionary of extra items, meant to be overridden. Unlike `_get_extra_items()`
+        it's given all of the page's objects at once, so that their extra items can
+        be looked up with a query for the whole page rather than one per row.
+        In values mode, the objects are dictionaries of the fetched columns.
+
+        By default this calls `_get_extra_items()` for each object.
+        """
+        if type(self)._get_extra_items is DjangoClarityModelListView._get_extra_items:
+            return {}
+
+        pk_attname = self.model._meta.pk.attname
+        return {
+            obj[pk_attname] if isinstance(obj, dict) else obj.pk: (
+                self._get_extra_items(obj)
+            )
+            for obj in objects
+        }
+
+    def _get_extra_item_fields(self):
+        """
+        Base method to return a list of the field names that `_get_extra_items()`
+        reads, so that they're loaded with the index queryset. Meant to be overridden.
+        """
+        return []
+
     # def get_items(self):
     #     """Return the list of instance objects, ready for JSON serialization."""
     #     items = []
@@ -569,67 +2396,190 @@ class DjangoClarityModelListView(DjangoClarityModelBaseView, ListView):
 
         # Add in any extra headers
         headers += self._get_extra_fields()
+        headers += list(self.model_admin.list_extra_columns)
 
         # Add in final headers for the Update & Delete URLs
         headers.append(self.update_url_name)
-        headers.append(self.delete_url_name)
+        if self.model_admin.has_delete_permission(self.request):
+            headers.append(self.delete_url_name)
 
         return headers
 
-    def get_rows(self):
-        """Return a list of dicts, one per object in the query"""
-        items = []
-
-        # Get pagination data
-        page, total_items = self._get_pagination_data()
-
-        # Get the paginated queryset
-        paginated_queryset = self._get_paginated_queryset(page, total_items)
+    def get_sort_links(self):
+        """
+        Return a dict of sortable field names to the sort parameter value for their
+        header link, and the field's current sort direction (if it's being sorted).
+        """
+        sort = self.request.GET.get(self.sort_param, "")
 
-        for obj in paginated_queryset:
-            # d = model_to_dict(obj, self._get_field_names())
+        sort_links = {}
+        for field_name in self.get_sortable_fields():
+            if sort == field_name:
+                sort_links[field_name] = {"param": f"-{field_name}", "direction": "asc"}
+            elif sort == f"-{field_name}":
+                sort_links[field_name] = {"param": field_name, "direction": "desc"}
+            else:
+                sort_links[field_name] = {"param": field_name, "direction": None}
 
-            # Build dict manually from requested field names
-            d = {}
-            for field_name in self._get_field_names():
-                try:
-                    field = self.model._meta.get_field(field_name)
-                    value = getattr(obj, field_name)
-                    # Handle ForeignKey fields - convert to the string
-                    if field.is_relation and not field.many_to_many:
-                        d[field_name] = str(value) if value else None
-                    else:
-                        d[field_name] = value
-                except (AttributeError, FieldDoesNotExist):
-                    # Skip if field doesn't exist (might be a form-only field)
-                    continue
+        return sort_links
 
-            # Add in any extra items
-            d.update(self._get_extra_items(obj))
+    def get_row(self, obj, extra_items=None):
+        """
+        Return a dict of the index table's columns for a single object.
+        The object's extra items are looked up if they aren't given.
+        """
+        # d = model_to_dict(obj, self._get_field_names())
+
+        # Build dict manually from requested field names
+        d = {}
+        for field_name in self._get_field_names():
+            try:
+                field = self.model._meta.get_field(field_name)
+                value = getattr(obj, field_name)
+                # Handle ForeignKey fields - convert to the string
+                if field.is_relation and not field.many_to_many:
+                    d[field_name] = str(value) if value else None
+                else:
+                    d[field_name] = value
+            except (AttributeError, FieldDoesNotExist):
+                # Skip if field doesn't exist (might be a form-only field)
+                continue
 
-            # Add in final columns of the Update & Delete URLs
-            d[self.update_url_name] = reverse(
-                f"{self.namespace}:{self.update_url_name}", kwargs={"pk": obj.pk}
-            )
-            d[self.delete_url_name] = reverse(
-                f"{self.namespace}:{self.delete_url_name}", kwargs={"pk": obj.pk}
+        # Add in the annotated extra columns, and any extra items
+        for name in self.model_admin.list_extra_columns:
+            d[name] = getattr(obj, name, None)
+        if extra_items is None:
+            extra_items = self._get_extra_items_for_page([obj]).get(obj.pk, {})
+        d.update(extra_items)
+
+        # Add in final columns of the Update & Delete URLs
+        d[self.update_url_name] = self._reverse_object_url(self.update_url_name, obj.pk)
+        d[self.delete_url_name] = self._reverse_object_url(self.delete_url_name, obj.pk)
+
+        # Use the `get_{attr_name}_display()` method if it exists.
+        return {
+            key: (
+                getattr(obj, f"get_{key}_display")()
+                if hasattr(obj, f"get_{key}_display")
+                else value
             )
+            for key, value in d.items()
+        }
 
-            # Add the row of information to the list of items.
-            # Use the `get_{attr_name}_display()` method if it exists.
-            items.append(
-                {
-                    key: (
-                        getattr(obj, f"get_{key}_display")()
-                        if hasattr(obj, f"get_{key}_display")
-                        else value
+    def get_values_rows(self, values_rows):
+        """
+        Return a list of dicts, one per tuple fetched in values mode.
+        Choices are mapped to their labels through a dict, and related objects to
+        their labels through the annotated columns (or one query per relation).
+        """
+        columns = self.get_values_columns()
+        column_indexes = {column: i for i, column in enumerate(columns)}
+        pk_index = column_indexes[self.model._meta.pk.attname]
+        values_fields = self._get_values_fields()
+        values_rows = list(values_rows)
+
+        # Precompute a {value: label} dict for each field with choices
+        choices_dicts = {
+            field.name: dict(field.flatchoices)
+            for field in values_fields
+            if field.choices
+        }
+
+        # Look up the labels of any related objects that weren't annotated,
+        # with a single query per relation for the whole page
+        related_labels = {}
+        for field in values_fields:
+            if field.is_relation and f"{field.name}__label" not in column_indexes:
+                index = column_indexes[field.attname]
+                related_pks = {row[index] for row in values_rows} - {None}
+                related_labels[field.name] = {
+                    pk: str(related_obj)
+                    for pk, related_obj in self.using_read_db(
+                        field.related_model._default_manager.all()
                     )
-                    for key, value in d.items()
+                    .in_bulk(related_pks)
+                    .items()
                 }
+
+        # Look up the extra items of the whole page. These are given dicts of the
+        # fetched columns instead of model instances.
+        extra_items = {}
+        if (
+            type(self)._get_extra_items
+            is not DjangoClarityModelListView._get_extra_items
+            or type(self)._get_extra_items_for_page
+            is not DjangoClarityModelListView._get_extra_items_for_page
+        ):
+            extra_items = self._get_extra_items_for_page(
+                [dict(zip(columns, row)) for row in values_rows]
             )
 
+        items = []
+        for row in values_rows:
+            d = {}
+            for field in values_fields:
+                value = row[column_indexes[field.attname]]
+                if field.is_relation:
+                    if value is None:
+                        d[field.name] = None
+                    elif field.name in related_labels:
+                        d[field.name] = related_labels[field.name].get(value)
+                    else:
+                        d[field.name] = row[column_indexes[f"{field.name}__label"]]
+                elif field.name in choices_dicts:
+                    d[field.name] = choices_dicts[field.name].get(value, value)
+                else:
+                    d[field.name] = value
+
+            # Add in the annotated extra columns, and any extra items
+            for name in self.model_admin.list_extra_columns:
+                d[name] = row[column_indexes[name]]
+            pk = row[pk_index]
+            d.update(extra_items.get(pk, {}))
+
+            # Add in final columns of the Update & Delete URLs
+            d[self.update_url_name] = self._reverse_object_url(self.update_url_name, pk)
+            d[self.delete_url_name] = self._reverse_object_url(self.delete_url_name, pk)
+
+            items.append(d)
+
         return items
 
+    def get_rows(self, objects=None):
+        """
+        Return a list of dicts, one per object in the query.
+        If no objects are given, then the current page of the queryset is used.
+        """
+        if objects is None:
+            # Use the cached rows of the current page, if there are any
+            timeout = self.model_admin.list_cache_timeout
+            if timeout is not None:
+                cache_key = self.get_cache_key("rows")
+                rows = get_cache().get(cache_key)
+                if rows is None:
+                    rows = self.get_rows(objects=self._get_current_page_objects())
+                    get_cache().set(cache_key, rows, timeout)
+
+                return rows
+
+            objects = self._get_current_page_objects()
+
+        if self.get_list_fetch() == "values":
+            return self.get_values_rows(objects)
+
+        objects = list(objects)
+        extra_items = self._get_extra_items_for_page(objects)
+
+        return [self.get_row(obj, extra_items.get(obj.pk, {})) for obj in objects]
+
+    def _get_current_page_objects(self):
+        """Return the queryset of the current page's objects."""
+        # Get pagination data
+        page, total_items = self._get_pagination_data()
+
+        # Get the paginated queryset
+        return self._get_paginated_queryset(page, total_items)
+
     def update_object_list(self, paginator):
         """Update the Paginator's object_list to include entries for the Update and Delete URLs"""
         items = []
@@ -681,13 +2631,79 @@ class DjangoClarityModelListView(DjangoClarityModelBaseView, ListView):
 
         # Add in the Create URL name
         context["create_url"] = reverse(f"{self.namespace}:{self.create_url_name}")
+        context["import_url"] = reverse(f"{self.namespace}:{self.import_url_name}")
 
         # Add model verbose name for template use
         context["model_verbose_name"] = self.model._meta.verbose_name
 
+        # Permissions for the page's links
+        context.update(self.get_permissions_context())
+
         # Get the items and field for the table
-        context["items"] = self.get_rows()
         context["fields"] = self.get_headers()
+        context["sort_links"] = self.get_sort_links()
+
+        # The current search, sort and filters, for the page's links and forms (so
+        # the template doesn't depend on the request context processor)
+        context["query_params"] = self.request.GET
+        context["search_query"] = self.request.GET.get("q", "")
+        context["current_sort"] = self.request.GET.get(self.sort_param, "")
+
+        # Sidebar of list filters, with their facet counts
+        context["facets"] = self.get_facets()
+
+        # Drill-down links of the ModelAdmin.date_hierarchy field
+        context["date_hierarchy"] = self.get_date_hierarchy()
+
+        # Footer row of the columns' aggregates
+        context["aggregates"] = self.get_aggregates()
+
+        # In virtual scrolling mode the rows are fetched by the browser from the
+        # data endpoint, so none are rendered here
+        context["virtual_scroll"] = self.model_admin.list_virtual_scroll
+        if context["virtual_scroll"]:
+            context["items"] = []
+            context["virtual_table_config"] = {
+                "url": reverse(f"{self.namespace}:{self.data_url_name}"),
+                "columns": context["fields"],
+                "link_columns": {
+                    self.update_url_name: "Update",
+                    self.delete_url_name: "Delete",
+                },
+                "search": self.request.GET.get("q", ""),
+                "sort": self.request.GET.get(self.sort_param, ""),
+                "filters": {
+                    **{
+                        field.name: self.request.GET[field.name]
+                        for field, _ in self.get_list_filters()
+                        if self.request.GET.get(field.name)
+                    },
+                    **(
+                        context["date_hierarchy"]["params"]
+                        if context["date_hierarchy"]
+                        else {}
+                    ),
+                },
+            }
+        elif self.is_list_editable():
+            # Editable grid: each row has a form for the ModelAdmin.list_editable fields
+            formset = context.get("list_editable_formset")
+            if formset is None:
+                formset = self.get_list_editable_formset()
+            context["list_editable_formset"] = formset
+            context["list_editable"] = self.model_admin.list_editable
+            context["items"] = self.get_rows(
+                objects=[form.instance for form in formset.forms]
+            )
+            context["rows"] = list(zip(context["items"], formset.forms))
+            context["media"] = formset.media
+            context["all_errors"] = self.get_formset_errors(formset)
+        else:
+            context["items"] = self.get_rows()
+
+        # The rows of the table, with their grid forms (if any)
+        if "rows" not in context:
+            context["rows"] = [(item, None) for item in context["items"]]
 
         # TODO: I'm definitely duplicating efforts with the pagination thing. Look into the Django Paginator class and see if there's a way to override its object_list or page_obj or whatever, so that we can add in the Delete and Update URLs as extra attributes. That way we won't have to write our own pagination methods.
 
@@ -699,9 +2715,191 @@ class DjangoClarityModelListView(DjangoClarityModelBaseView, ListView):
         return context
 
 
+class DjangoClarityJSONEncoder(DjangoJSONEncoder):
+    """JSON encoder that falls back to the string of any non-serializable value."""
+
+    def default(self, o):
+        try:
+            return super().default(o)
+        except TypeError:
+            return str(o)
+
+
+class DjangoClarityModelDataView(DjangoClarityModelListView):
+    """
+    JSON endpoint for the index table, using cursor pagination.
+
+    The cursor encodes the sort values of the last row that was sent, so each
+    window is fetched with an indexed range query instead of an OFFSET. Jumps to
+    a far away row (ie. dragging the scrollbar) seek to it with `offset` instead,
+    and carry on from there with cursors.
+    Accepts the same search (`q`) and sort (`o`) parameters as the index page, as
+    well as `cursor`, `offset` and `limit`.
+    """
+
+    data_page_size = 100
+    data_max_page_size = 500
+
+    def get_paginate_by(self, queryset):
+        """The data endpoint does its own (cursor) pagination."""
+        return None
+
+    def get_limit(self):
+        """Return the number of rows to send, from the `limit` parameter if given."""
+        try:
+            limit = int(self.request.GET.get("limit", self.data_page_size))
+        except (TypeError, ValueError):
+            limit = self.data_page_size
+
+        return max(1, min(limit, self.data_max_page_size))
+
+    def get_offset(self):
+        """Return the number of rows to skip, from the `offset` parameter if given."""
+        try:
+            offset = int(self.request.GET.get("offset", 0))
+        except (TypeError, ValueError):
+            offset = 0
+
+        return max(0, offset)
+
+    def _get_cursor_fields(self):
+        """
+        Return a list of (field, descending) tuples for the current ordering.
+        """
+        cursor_fields = []
+        for order_field in self.get_ordering():
+            descending = order_field.startswith("-")
+            field_name = order_field.removeprefix("-")
+            if field_name == "pk":
+                field = self.model._meta.pk
+            else:
+                field = self.model._meta.get_field(field_name)
+            cursor_fields.append((field, descending))
+
+        return cursor_fields
+
+    def encode_cursor(self, obj):
+        """Encode the sort values of an object into an opaque cursor string."""
+        if self.get_list_fetch() == "values":
+            columns = self.get_values_columns()
+            values = [
+                obj[columns.index(field.attname)]
+                for field, _ in self._get_cursor_fields()
+            ]
+        else:
+            values = [
+                field.value_from_object(obj) for field, _ in self._get_cursor_fields()
+            ]
+        data = json.dumps(values, cls=DjangoJSONEncoder).encode()
+
+        return base64.urlsafe_b64encode(data).decode()
+
+    def decode_cursor(self, cursor):
+        """
+        Decode a cursor string into the sort values it was created from.
+        Raises ValueError if the cursor is malformed.
+        """
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (TypeError, ValueError) as e:
+            raise ValueError("Invalid cursor") from e
+
+        cursor_fields = self._get_cursor_fields()
+        if not isinstance(values, list) or len(values) != len(cursor_fields):
+            raise ValueError("Invalid cursor")
+
+        try:
+            return [
+                field.to_python(value)
+                for (field, _), value in zip(cursor_fields, values)
+            ]
+        except ValidationError as e:
+            raise ValueError("Invalid cursor") from e
+
+    def filter_after_cursor(self, queryset, values):
+        """
+        Filter the queryset down to the rows that come after the cursor's values.
+        For an ordering of (a, b) this is: a > x OR (a = x AND b > y).
+        """
+        query = Q()
+        equal_lookups = {}
+        for (field, descending), value in zip(self._get_cursor_fields(), values):
+            lookup = "lt" if descending else "gt"
+            query |= Q(**equal_lookups, **{f"{field.attname}__{lookup}": value})
+            equal_lookups[field.attname] = value
+
+        return queryset.filter(query)
+
+    def get(self, request, *args, **kwargs):
+        validators = self.get_validators()
+        response = self.get_not_modified_response(validators)
+        if response is None:
+            response = self.get_data_response()
+
+        return self.set_validator_headers(response, validators)
+
+    def get_data_response(self):
+        """Return the JSON response of the data, from the cache if possible."""
+        self.object_list = self.get_queryset()
+
+        timeout = self.model_admin.list_cache_timeout
+        if timeout is None:
+            data = self.get_data()
+        else:
+            cache_key = self.get_cache_key("data")
+            data = get_cache().get(cache_key)
+            if data is None:
+                data = self.get_data()
+                get_cache().set(cache_key, data, timeout)
+
+        if "error" in data:
+            return JsonResponse(data, status=400)
+
+        return JsonResponse(data, encoder=DjangoClarityJSONEncoder)
+
+    def get_data(self):
+        """Return the dict of data for the JSON response."""
+        queryset = self.object_list
+
+        data = {
+            "headers": self.get_headers(),
+            "update_key": self.update_url_name,
+            "delete_key": self.delete_url_name,
+        }
+
+        cursor = self.request.GET.get("cursor")
+        offset = 0
+        if cursor:
+            try:
+                queryset = self.filter_after_cursor(
+                    queryset, self.decode_cursor(cursor)
+                )
+            except ValueError as e:
+                return {"error": str(e)}
+        else:
+            offset = self.get_offset()
+            if not offset:
+                # The total is only needed once, to size the table
+                data["count"] = self.get_count()
+
+        # Fetch one extra object to know whether there's another window after this one
+        limit = self.get_limit()
+        objects = list(queryset[offset : offset + limit + 1])
+        has_next = len(objects) > limit
+        objects = objects[:limit]
+
+        data["results"] = self.get_rows(objects)
+        data["next_cursor"] = self.encode_cursor(objects[-1]) if has_next else None
+
+        return data
+
+
 class DjangoClarityModelDeleteView(DjangoClarityModelBaseView, DeleteView):
     template_name = "djangoclarity/base_delete_template.html"
 
+    def has_permission(self):
+        return self.model_admin.has_delete_permission(self.request)
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
@@ -717,7 +2915,101 @@ class DjangoClarityModelDeleteView(DjangoClarityModelBaseView, DeleteView):
         """Override post to handle deletion with form_class present"""
         self.object = self.get_object()
 
+        # Cascade-heavy deletes are run by a background job instead
+        if self.model_admin.delete_in_background:
+            return self.redirect_to_job(
+                "djangoclarity.jobs.delete_objects",
+                {"model": self.model._meta.label_lower, "pks": [self.object.pk]},
+                label=f'Delete {self.model._meta.verbose_name} "{self.object}"',
+            )
+
         # Perform the deletion
         self.object.delete()
 
+        # Invalidate the model's cached index pages
+        bump_model_version(self.model)
+        self.record_write()
+
         return HttpResponseRedirect(self.get_success_url())
+
+
+class DjangoClarityModelImportView(DjangoClarityModelBaseView, TemplateView):
+    """
+    Imports a CSV file of the model's rows, validated with the model's form and
+    written in batches (see the imports module), then shows a report of the import.
+    """
+
+    template_name = "djangoclarity/base_import_template.html"
+
+    def has_permission(self):
+        return self.model_admin.has_add_permission(self.request)
+
+    def get_import_form(self):
+        # Upserting changes existing objects, so it needs the change permission
+        unique_fields = ()
+        if self.model_admin.has_change_permission(self.request):
+            unique_fields = self.model_admin.import_unique_fields
+
+        return ImportForm(
+            data=self.request.POST if self.request.method == "POST" else None,
+            files=self.request.FILES if self.request.method == "POST" else None,
+            unique_fields=unique_fields,
+        )
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.setdefault("import_form", self.get_import_form())
+
+        # Field names that the CSV's header row can use
+        context["import_field_names"] = get_import_field_names(self.form_class)
+
+        # Index URL
+        context["index_url"] = reverse(f"{self.namespace}:{self.index_url_name}")
+
+        # Add model verbose name for template use
+        context["model_verbose_name"] = self.model._meta.verbose_name
+
+        return context
+
+    def post(self, request, *args, **kwargs):
+        import_form = self.get_import_form()
+        if not import_form.is_valid():
+            return self.render_to_response(
+                self.get_context_data(import_form=import_form)
+            )
+
+        unique_fields = None
+        if import_form.cleaned_data.get("upsert"):
+            unique_fields = list(self.model_admin.import_unique_fields)
+
+        # Large files are imported by a background job instead
+        if self.model_admin.import_in_background:
+            return self.redirect_to_job(
+                "djangoclarity.jobs.import_staged_csv",
+                {
+                    "model": self.model._meta.label_lower,
+                    "site": self.namespace,
+                    "token": stage_file(import_form.cleaned_data["file"]),
+                    "unique_fields": unique_fields,
+                    "batch_size": self.model_admin.import_batch_size,
+                    "max_errors": self.model_admin.import_max_errors,
+                },
+                label=f"Import {self.model._meta.verbose_name_plural}",
+            )
+
+        result = import_csv(
+            import_form.cleaned_data["file"],
+            self.form_class,
+            unique_fields=unique_fields,
+            batch_size=self.model_admin.import_batch_size,
+            max_errors=self.model_admin.import_max_errors,
+        )
+
+        # Invalidate the model's cached index pages
+        if result.imported:
+            bump_model_version(self.model)
+            self.record_write()
+
+        return self.render_to_response(
+            self.get_context_data(import_form=import_form, import_result=result)
+        )
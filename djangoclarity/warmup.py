@@ -0,0 +1,183 @@
+"""
+Warm-up of Django Clarity's per-process caches, so that the first request to each
+model's pages doesn't pay for building them.
+
+warmup() loads the URLconf (which builds every registered model's form and formset
+classes, see AdminSite.get_urls()), compiles the pages' templates and the forms'
+widget templates, instantiates the forms and formsets, and works out the object
+URL templates of the index tables. Optionally, it also runs (and caches) each
+index's first COUNT.
+
+It's run by the clarity_warmup management command, or when the app is ready with
+the DJANGOCLARITY_WARMUP setting. Servers that fork their workers after loading
+the app (ie. gunicorn's --preload) then share the warmed caches copy-on-write.
+"""
+
+import os
+
+from django.forms.renderers import get_default_renderer
+from django.http import HttpRequest
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
+from django.urls import URLPattern, URLResolver, get_resolver
+
+from .views import (
+    DjangoClarityModelBaseView,
+    DjangoClarityModelDataView,
+    DjangoClarityModelListView,
+)
+
+
+def _is_index_view(view_class):
+    """Return whether a view class is an index page (rather than its data view)."""
+    return issubclass(view_class, DjangoClarityModelListView) and not issubclass(
+        view_class, DjangoClarityModelDataView
+    )
+
+
+def _iter_views(patterns):
+    """Yield the (view class, initkwargs) of the URL patterns' class-based views."""
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _iter_views(pattern.url_patterns)
+        elif isinstance(pattern, URLPattern):
+            view_class = getattr(pattern.callback, "view_class", None)
+            if view_class is not None:
+                yield view_class, pattern.callback.view_initkwargs
+
+
+def get_template_names():
+    """Return the names of the templates that ship with Django Clarity."""
+    templates_dir = os.path.join(os.path.dirname(__file__), "templates")
+
+    names = []
+    for root, _, files in os.walk(templates_dir):
+        for file in files:
+            if file.endswith(".html"):
+                path = os.path.join(root, file)
+                names.append(os.path.relpath(path, templates_dir).replace(os.sep, "/"))
+
+    return sorted(names)
+
+
+def warm_template(name, cache):
+    """Load (and compile) a template, unless it was already warmed."""
+    if not name or name in cache:
+        return
+
+    cache.add(name)
+    try:
+        get_template(name)
+    except TemplateDoesNotExist:
+        pass
+
+
+def warm_form(form, renderer, widget_templates):
+    """Load the widget templates of a form, and its media."""
+    for field in form.fields.values():
+        template_name = getattr(field.widget, "template_name", None)
+        if template_name and template_name not in widget_templates:
+            widget_templates.add(template_name)
+            renderer.get_template(template_name)
+
+    return form.media
+
+
+def warm_count(view_class, initkwargs, user):
+    """
+    Run an index's COUNT without any search or filters, as the given user, which
+    caches it if the ModelAdmin has a list_cache_timeout.
+    """
+    view = view_class(**initkwargs)
+
+    # A bare GET request, built without the test client so that warming up at
+    # startup doesn't depend on it
+    request = HttpRequest()
+    request.method = "GET"
+    request.path = request.path_info = "/"
+    request.META = {"SERVER_NAME": "localhost", "SERVER_PORT": "80"}
+    request.user = user
+    view.setup(request)
+    if not view.has_permission():
+        return None
+
+    view.object_list = view.get_queryset()
+
+    return view.get_count()
+
+
+def warmup(counts=False, log=None):
+    """
+    Warm up Django Clarity's caches (see the module's docstring). With counts=True,
+    the indexes' first COUNTs are also run, as the first active superuser.
+    `log` is an optional callable that's given a line of progress at a time.
+    """
+    log = log or (lambda message: None)
+
+    # Load the URLconf, which builds the registered models' form classes, and
+    # populate the resolver's reverse lookups
+    resolver = get_resolver()
+    resolver.reverse_dict
+    views = [
+        (view_class, initkwargs)
+        for view_class, initkwargs in _iter_views(resolver.url_patterns)
+        if issubclass(view_class, DjangoClarityModelBaseView)
+    ]
+    log(f"Loaded the URLconf, with {len(views)} model pages")
+
+    # Compile the templates
+    templates = set()
+    for name in get_template_names():
+        warm_template(name, templates)
+    for view_class, _ in views:
+        for attribute in ("base_template", "template_name", "conflict_template_name"):
+            warm_template(getattr(view_class, attribute, None), templates)
+    log(f"Compiled {len(templates)} templates")
+
+    # Instantiate the forms and formsets, and load their widgets' templates
+    renderer = get_default_renderer()
+    widget_templates = set()
+    form_classes = set()
+    for _, initkwargs in views:
+        form_class = initkwargs.get("form_class")
+        if form_class is not None and form_class not in form_classes:
+            form_classes.add(form_class)
+            warm_form(form_class(), renderer, widget_templates)
+
+        for formset_class in initkwargs.get("formsets", []):
+            if formset_class not in form_classes:
+                form_classes.add(formset_class)
+                formset = formset_class()
+                warm_form(formset.empty_form, renderer, widget_templates)
+    log(
+        f"Instantiated {len(form_classes)} forms and formsets, "
+        f"with {len(widget_templates)} widget templates"
+    )
+
+    # Work out the object URL templates of the index tables
+    url_count = 0
+    for view_class, initkwargs in views:
+        if _is_index_view(view_class):
+            view = view_class(**initkwargs)
+            for url_name in (view.update_url_name, view.delete_url_name):
+                view._reverse_object_url(url_name, 1)
+                url_count += 1
+    log(f"Reversed {url_count} object URL templates")
+
+    if counts:
+        # Imported here since models can't be imported before the apps are ready
+        from django.contrib.auth import get_user_model
+
+        user = (
+            get_user_model()
+            ._default_manager.filter(is_superuser=True, is_active=True)
+            .first()
+        )
+        if user is None:
+            log("Skipped the counts, as there's no active superuser")
+        else:
+            for view_class, initkwargs in views:
+                if _is_index_view(view_class):
+                    count = warm_count(view_class, initkwargs, user)
+                    model = initkwargs["form_class"]._meta.model
+                    log(f"Counted {count} {model._meta.verbose_name_plural}")
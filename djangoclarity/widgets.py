@@ -1,9 +1,20 @@
+import threading
+
 from django import forms
 from django.conf import settings
 from django.contrib.admin.widgets import AdminFileWidget
-from django.utils.html import format_html
+from django.core.exceptions import EmptyResultSet
+from django.forms.models import ModelChoiceIterator
+from django.urls import reverse
+from django.utils import translation
+from django.utils.html import conditional_escape, format_html
 from django.utils.safestring import mark_safe
 
+from .assets import CLARITY_JS
+from .cache import connect_model_invalidation, get_model_version, is_cache_shared
+from .thumbnails import get_thumbnail
+from .uploads import open_staged_upload
+
 
 def thumbnail(image_path):
     return (
@@ -13,17 +24,108 @@ def thumbnail(image_path):
     )
 
 
+def resized_thumbnail(thumbnail_1x, thumbnail_2x=None):
+    """
+    Return a lazy-loaded <img> of a server-generated thumbnail (see the thumbnails
+    module), with its dimensions and a 2x variant for high density screens.
+    """
+    srcset = ""
+    if thumbnail_2x and thumbnail_2x["width"] > thumbnail_1x["width"]:
+        srcset = "{} 1x, {} 2x".format(thumbnail_1x["url"], thumbnail_2x["url"])
+
+    return format_html(
+        '<img src="{}" srcset="{}" width="{}" height="{}" loading="lazy" '
+        'decoding="async" class="imageupload-thumbnail" '
+        'style="max-width: 100%; height: auto;">',
+        thumbnail_1x["url"],
+        srcset or thumbnail_1x["url"],
+        thumbnail_1x["width"],
+        thumbnail_1x["height"],
+    )
+
+
 class ThumbnailImageWidget(AdminFileWidget):
     template_with_initial = "%(input)s%(clear_template)s"
     clear_checkbox_label = "Delete Image"
 
-    def __init__(self, attrs=None):
+    def __init__(
+        self,
+        attrs=None,
+        thumbnail_width=200,
+        upload_mode="form",
+        max_dimension=2048,
+        chunk_size=1024 * 1024,
+        upload_url=None,
+    ):
+        """
+        Args:
+            attrs: HTML attributes to apply to the widget
+            thumbnail_width: Width (in CSS pixels) of the thumbnail that's shown.
+                Thumbnails are generated at this width and twice it (for srcset).
+            upload_mode: "form" to upload the image with the form, or "chunked" to
+                downscale it in the browser and upload it in chunks before the form
+                is submitted (see the uploads module)
+            max_dimension: In chunked mode, the maximum width/height (in pixels)
+                that images are downscaled to before uploading
+            chunk_size: In chunked mode, the size (in bytes) of each uploaded chunk
+            upload_url: In chunked mode, the URL of the chunked upload view
+                (default: the djangoclarity site's)
+        """
+        self.thumbnail_width = thumbnail_width
+        self.upload_mode = upload_mode
+        self.max_dimension = max_dimension
+        self.chunk_size = chunk_size
+        self.upload_url = upload_url
+
         # Set accept attribute to only allow jpeg and png files
         final_attrs = {"accept": "image/jpeg,image/png"}
         if attrs is not None:
             final_attrs.update(attrs)
         super().__init__(attrs=final_attrs)
 
+    @property
+    def media(self):
+        if self.upload_mode == "chunked":
+            return forms.Media(js=[CLARITY_JS])
+
+        return forms.Media()
+
+    def get_upload_token_name(self, name):
+        return f"{name}__upload_token"
+
+    def value_from_datadict(self, data, files, name):
+        """
+        In chunked mode, use the staged upload that the form's token refers to.
+        """
+        if self.upload_mode == "chunked":
+            upload = open_staged_upload(data.get(self.get_upload_token_name(name)))
+            if upload is not None:
+                return upload
+
+        return super().value_from_datadict(data, files, name)
+
+    def value_omitted_from_data(self, data, files, name):
+        return (
+            super().value_omitted_from_data(data, files, name)
+            and self.get_upload_token_name(name) not in data
+        )
+
+    def get_thumbnail_html(self, value, file_path):
+        """
+        Return the <img> for the value's server-generated thumbnails. Falls back to
+        the (CSS-shrunk) original if thumbnails can't be generated.
+        """
+        name = getattr(value, "name", None) or str(value)
+        storage = getattr(value, "storage", None)
+
+        thumbnail_1x = get_thumbnail(name, self.thumbnail_width, storage=storage)
+        if thumbnail_1x is None:
+            return thumbnail(file_path)
+
+        thumbnail_2x = get_thumbnail(name, self.thumbnail_width * 2, storage=storage)
+
+        return resized_thumbnail(thumbnail_1x, thumbnail_2x)
+
     def render(self, name, value, attrs=None, renderer=None):
         output = []
         if value:
@@ -31,7 +133,7 @@ class ThumbnailImageWidget(AdminFileWidget):
             try:
                 output.append(
                     '<a target="_blank" href="{}" class="imageupload-thumbcontainer">{}</a>'.format(
-                        file_path, thumbnail(file_path)
+                        file_path, self.get_thumbnail_html(value, file_path)
                     )
                 )
             except IOError:
@@ -49,15 +151,45 @@ class ThumbnailImageWidget(AdminFileWidget):
                 )
             )
 
+        if self.upload_mode == "chunked":
+            # The script finds the upload settings and token input from these
+            attrs = {
+                **(attrs or {}),
+                "data-djangoclarity-chunked-upload": self.upload_url
+                or reverse("djangoclarity:djangoclarity-upload"),
+                "data-max-dimension": self.max_dimension,
+                "data-chunk-size": self.chunk_size,
+                "data-token-input": self.get_upload_token_name(name),
+            }
+
         output.append(
             '<div class="imageupload-widget"><p class="file-upload">%s</p></div>'
             % super(ThumbnailImageWidget, self).render(name, value, attrs)
         )
+
+        if self.upload_mode == "chunked":
+            output.append(
+                format_html(
+                    '<input type="hidden" name="{}">'
+                    '<small class="djangoclarity-upload-status text-muted"></small>',
+                    self.get_upload_token_name(name),
+                )
+            )
+
         return mark_safe(
             '<div class="thumbnail-image-widget-container">%s</div>' % "".join(output)
         )
 
 
+# Compiled choices of RadioButtonsWidget, shared between widget instances (ie. the
+# copies of a widget in each form of a formset)
+_compiled_choices_cache = {}
+_compiled_choices_lock = threading.Lock()
+COMPILED_CHOICES_CACHE_SIZE = 256
+# Models whose versions invalidate the cached model choices
+_choices_models = set()
+
+
 class RadioButtonsWidget(forms.RadioSelect):
     """
     A widget that renders a Bootstrap-style radio button group for use in forms.
@@ -68,6 +200,9 @@ class RadioButtonsWidget(forms.RadioSelect):
     The buttons are styled using Bootstrap classes.
     """
 
+    class Media:
+        js = [CLARITY_JS]
+
     def __init__(self, attrs=None, choices=(), button_variant="outline-primary"):
         """
         Args:
@@ -78,6 +213,124 @@ class RadioButtonsWidget(forms.RadioSelect):
         self.button_variant = button_variant
         super(RadioButtonsWidget, self).__init__(attrs, choices)
 
+    def compile_choices(self, choices):
+        """
+        Return a list of the escaped HTML fragments for each choice, so that they
+        don't have to be formatted again on every render. Each item is a tuple of:
+        (the option value as a string, the part of its button label between the id
+        and the 'active' class, the rest of the label, and the escaped value for the
+        radio input)
+        """
+        variant = conditional_escape(self.button_variant)
+
+        compiled_choices = []
+        for option_value, option_label in choices:
+            compiled_choices.append(
+                (
+                    str(option_value),
+                    f'" class="btn btn-{variant} btn-outline-{variant}',
+                    f'">{conditional_escape(option_label)}</label>',
+                    conditional_escape(option_value),
+                )
+            )
+
+        return compiled_choices
+
+    def _get_choices_cache_key(self):
+        """
+        Return the key that the widget's compiled choices are cached under, or None
+        if they can't be cached.
+
+        Static choices are keyed on their values and (translated) labels, which are
+        only read once per widget instance and language. Model choices are keyed on
+        their queryset's SQL and the model's version (see the cache module), so
+        they're only cached when the cache is shared between processes, where a
+        save in any process bumps the version. Otherwise they're compiled on each
+        render. Labels that come from other models aren't part of the key.
+        """
+        if isinstance(self.choices, ModelChoiceIterator):
+            return self._get_model_choices_cache_key()
+
+        language = translation.get_language()
+        memo = getattr(self, "_static_choices_key", None)
+        if memo is not None and memo[0] is self.choices and memo[1] == language:
+            return memo[2]
+
+        cache_key = self._make_static_choices_cache_key()
+        self._static_choices_key = (self.choices, language, cache_key)
+
+        return cache_key
+
+    def _make_static_choices_cache_key(self):
+        choices = []
+        for option_value, option_label in self.choices:
+            if isinstance(option_label, (list, tuple)):
+                # Grouped choices
+                return None
+            choices.append((option_value, str(option_label)))
+
+        cache_key = ("static", tuple(choices), self.button_variant)
+        try:
+            hash(cache_key)
+        except TypeError:
+            return None
+
+        return cache_key
+
+    def _get_model_choices_cache_key(self):
+        if not is_cache_shared():
+            return None
+
+        field = self.choices.field
+        queryset = self.choices.queryset
+        model = queryset.model
+        try:
+            sql, params = queryset.query.sql_with_params()
+        except EmptyResultSet:
+            return None
+
+        if model not in _choices_models:
+            connect_model_invalidation(model)
+            _choices_models.add(model)
+
+        cache_key = (
+            "model",
+            model._meta.label_lower,
+            get_model_version(model),
+            sql,
+            params,
+            type(field),
+            field.to_field_name,
+            str(field.empty_label) if field.empty_label is not None else None,
+            translation.get_language(),
+            self.button_variant,
+        )
+        try:
+            hash(cache_key)
+        except TypeError:
+            return None
+
+        return cache_key
+
+    def get_compiled_choices(self):
+        """Return the compiled choices of the widget, from the cache if possible."""
+        cache_key = self._get_choices_cache_key()
+        if cache_key is None:
+            return self.compile_choices(self.choices)
+
+        with _compiled_choices_lock:
+            compiled_choices = _compiled_choices_cache.get(cache_key)
+        if compiled_choices is None:
+            compiled_choices = self.compile_choices(self.choices)
+
+            with _compiled_choices_lock:
+                # Keep the cache from growing forever
+                while len(_compiled_choices_cache) >= COMPILED_CHOICES_CACHE_SIZE:
+                    _compiled_choices_cache.pop(next(iter(_compiled_choices_cache)))
+                _compiled_choices_cache[cache_key] = compiled_choices
+
+        return compiled_choices
+
     def render(self, name, value, attrs=None, renderer=None, choices=()):
         """
         Render the radio button group as HTML.
@@ -86,7 +339,9 @@ class RadioButtonsWidget(forms.RadioSelect):
         1. A container div with form-group class
         2. A button group containing styled labels for each option
         3. Hidden radio inputs that correspond to each button
-        4. JavaScript to handle button clicks and update the active state
+
+        The button clicks are handled by the widget's static JavaScript (see Media),
+        which is included once per page rather than once per widget.
 
         Args:
             name: The name attribute for the form field
@@ -101,88 +356,43 @@ class RadioButtonsWidget(forms.RadioSelect):
         if attrs is None:
             attrs = {}
 
-        # Use provided choices or fall back to the widget's choices
-        choices = list(choices) if choices else list(self.choices)
+        # Use the precompiled HTML for the choices (provided choices aren't cached)
+        if choices:
+            compiled_choices = self.compile_choices(choices)
+        else:
+            compiled_choices = self.get_compiled_choices()
 
         # Create a unique ID for the radio group
-        id_ = attrs.get("id")
-        if not id_:
-            id_ = "id_%s" % name
+        id_ = conditional_escape(attrs.get("id") or "id_%s" % name)
+        name = conditional_escape(name)
+        selected_value = str(value)
 
         # Start building the HTML output
         output = [
-            '<div class="form-group">',
+            '<div class="form-group djangoclarity-radio-buttons">',
             f'  <div class="btn-group" role="group" aria-label="{name}">',
         ]
 
-        # First, create all the visible button labels
-        for i, (option_value, option_label) in enumerate(choices):
-            radio_id = f"{id_}_{i}"
-            is_selected = str(value) == str(option_value)
-
-            # Add 'active' class if this option is currently selected
-            active_class = " active" if is_selected else ""
-
-            # Create the button label with Bootstrap styling
-            # btn-outline-{variant} creates an outlined button style
-            button = format_html(
-                '<label for="{}" class="btn btn-{} btn-outline-{}{}">{}</label>',
-                radio_id,
-                self.button_variant,
-                self.button_variant,
-                active_class,
-                option_label,
+        # First, create all the visible button labels.
+        # Only the ids and the 'active' class of the selected option are added here.
+        for i, (option_value, label_class, label_end, _) in enumerate(compiled_choices):
+            active_class = " active" if option_value == selected_value else ""
+            output.append(
+                f'<label for="{id_}_{i}{label_class}{active_class}{label_end}'
             )
 
-            # Add the button to the output
-            output.append(button)
-
         # Close the button group
         output.append("</div>")
 
         # Now add all the hidden radio inputs that correspond to each button
-        for i, (option_value, option_label) in enumerate(choices):
-            radio_id = f"{id_}_{i}"
-            is_selected = str(value) == str(option_value)
-
-            # Create a hidden radio input that will be controlled by the button clicks
-            radio_input = format_html(
-                '<input type="radio" name="{}" value="{}" id="{}" {} style="display:none;">',
-                name,
-                option_value,
-                radio_id,
-                "checked" if is_selected else "",
+        for i, (option_value, _, _, input_value) in enumerate(compiled_choices):
+            checked = "checked" if option_value == selected_value else ""
+            output.append(
+                f'<input type="radio" name="{name}" value="{input_value}" '
+                f'id="{id_}_{i}" {checked} style="display:none;">'
             )
 
-            output.append(radio_input)
-
         output.append("</div>")
 
-        # Add JavaScript to handle the button clicks and update the active state
-        output.append(
-            f"""
-        <script>
-        document.addEventListener('DOMContentLoaded', function() {{
-            // Find the radio group container and all button labels
-            const radioGroup = document.querySelector('[name="{name}"]').closest('.form-group').querySelector('.btn-group');
-            const buttons = radioGroup.querySelectorAll('label');
-
-            // Add click event listener to each button
-            buttons.forEach(function(button) {{
-                button.addEventListener('click', function() {{
-                    // Remove 'active' class from all buttons
-                    buttons.forEach(function(btn) {{
-                        btn.classList.remove('active');
-                    }});
-
-                    // Add 'active' class to the clicked button
-                    this.classList.add('active');
-                }});
-            }});
-        }});
-        </script>
-        """
-        )
-
         # Return the complete HTML as a marked safe string
         return mark_safe("\n".join(output))